@@ -0,0 +1,56 @@
+"""
+Compares formatting cost of `TermStyleFormatter` with plain `logging.Formatter`.
+
+Usage: python benchmarks/formatter.py [--number N]
+"""
+import argparse
+import logging
+import os
+import timeit
+
+from pytermstyle import TermStyleFormatter
+
+FORMAT = "%(colorStart)s%(levelname)s:%(name)s:%(colorEnd)s%(message)s"
+PLAIN_FORMAT = "%(levelname)s:%(name)s:%(message)s"
+
+
+def make_records():
+  return [
+    logging.LogRecord("bench", level, __file__, 1, "Benchmark message %d", (index,), None)
+    for index, level in enumerate([logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL])
+  ]
+
+
+def bench(formatter: logging.Formatter, number: int) -> float:
+  records = make_records()
+
+  def run():
+    for record in records:
+      formatter.format(record)
+
+  return min(timeit.repeat(run, number=number, repeat=5)) / (number * len(records))
+
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--number", type=int, default=20000)
+  args = parser.parse_args()
+
+  os.environ.setdefault("FORCE_COLOR", "true")
+
+  formatters = {
+    "logging.Formatter": logging.Formatter(PLAIN_FORMAT),
+    "TermStyleFormatter": TermStyleFormatter(FORMAT),
+    "TermStyleFormatter(fast=True)": TermStyleFormatter(FORMAT, fast=True),
+  }
+
+  baseline = None
+  for name, formatter in formatters.items():
+    result = bench(formatter, args.number)
+    baseline = baseline or result
+
+    print("{:<32}{:>10.3f} us/record{:>8.2f}x".format(name, result * 1e6, result / baseline))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,395 @@
+"""
+Micro-benchmarks for styling hot paths.
+
+Every benchmark writes its output to memory, so suite can be run offline and without terminal.
+Results are written to JSON file, which can be compared with results of another run.
+
+Usage:
+  python benchmarks/run.py [--output results.json] [--compare previous.json] [--filter NAME]
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import sys
+import timeit
+
+from typing import Callable, Dict
+
+os.environ.setdefault("FORCE_COLOR", "true")
+
+from pytermstyle import TermStyle, TermSettings, TermStyleFormatter, TermStyleStructuredFormatter, OutputSink, Style, Theme, build_format  # noqa: E402
+from pytermstyle import strip_ansi, visible_len  # noqa: E402
+from pytermstyle import is_rgb_valid, is_valid_color, get_4bit_color_code, get_8bit_color_code, unique  # noqa: E402
+
+SETTINGS = {
+  "style": ["bold", "italic", "underline"],
+  "foreground": {"rgb": ["61", "217", "217"]},
+  "background": {"color": "magenta"},
+}
+
+MESSAGE = "Benchmark message"
+
+CASES: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+# Divisors of calls per measurement, for benchmarks of large inputs
+SCALES: Dict[str, int] = {}
+
+
+def case(name: str, scale: int = 1):
+  def register(setup: Callable[[], Callable[[], object]]):
+    CASES[name] = setup
+    SCALES[name] = scale
+    return setup
+
+  return register
+
+
+def _discard(text: str):
+  pass
+
+
+def _sink_logger(settings=None) -> TermStyle:
+  return TermStyle(settings, sink=OutputSink(_discard, buffer_size=64 * 1024, flush_at_exit=False))
+
+
+# TermStyle.print
+
+@case("print.plain")
+def _print_plain():
+  logger = _sink_logger()
+  return lambda: logger(MESSAGE)
+
+
+@case("print.settings")
+def _print_settings():
+  logger = _sink_logger(SETTINGS)
+  return lambda: logger(MESSAGE)
+
+
+@case("print.style")
+def _print_style():
+  logger = _sink_logger()
+  return lambda: logger.bold(MESSAGE)
+
+
+@case("print.4bit")
+def _print_4bit():
+  logger = _sink_logger()
+  return lambda: logger.fg_red(MESSAGE)
+
+
+@case("print.8bit")
+def _print_8bit():
+  logger = _sink_logger()
+  return lambda: logger.fg_color("orange", text=MESSAGE)
+
+
+@case("print.rgb")
+def _print_rgb():
+  logger = _sink_logger()
+  return lambda: logger.fg_rgb(61, 217, 187, text=MESSAGE)
+
+
+@case("print.builtin")
+def _print_builtin():
+  logger = TermStyle(SETTINGS)
+  stream = io.StringIO()
+
+  def run():
+    stream.seek(0)
+    with contextlib.redirect_stdout(stream):
+      logger(MESSAGE)
+
+  return run
+
+
+# Chained methods
+
+@case("chain.construct")
+def _chain_construct():
+  logger = _sink_logger()
+
+  def run():
+    logger.bold().italic().fg_red().bg_rgb(32, 87, 111)
+    logger.print(None)
+
+  return run
+
+
+@case("chain.render")
+def _chain_render():
+  logger = _sink_logger()
+  return lambda: logger.bold().fg_red().bg_cyan().render(MESSAGE)
+
+
+# Formats and settings
+
+@case("get_base_format")
+def _get_base_format():
+  logger = _sink_logger(SETTINGS)
+  return logger.get_base_format
+
+
+@case("settings.construct")
+def _settings_construct():
+  return lambda: TermSettings(SETTINGS)
+
+
+@case("settings.compile")
+def _settings_compile():
+  return lambda: TermSettings.compile(SETTINGS)
+
+
+@case("settings.empty")
+def _settings_empty():
+  return TermSettings
+
+
+@case("settings.add")
+def _settings_add():
+  def run():
+    settings = TermSettings()
+    settings.add_style("bold")
+    settings.add_color("red", "foreground")
+    settings.add_rgb(["32", "87", "111"], "background")
+
+  return run
+
+
+# logging integration
+
+def _formatter_case(levelno: int, fast: bool):
+  def setup():
+    formatter = TermStyleFormatter(fast=fast)
+    record = logging.LogRecord("bench", levelno, __file__, 1, MESSAGE, None, None)
+
+    return lambda: formatter.format(record)
+
+  return setup
+
+
+for _level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
+  case(f"formatter.{_level.lower()}")(_formatter_case(getattr(logging, _level), False))
+  case(f"formatter.fast.{_level.lower()}")(_formatter_case(getattr(logging, _level), True))
+
+
+@case("formatter.structured")
+def _structured_formatter():
+  formatter = TermStyleStructuredFormatter()
+  record = logging.LogRecord("bench", logging.INFO, __file__, 1, MESSAGE, None, None)
+  record.__dict__.update({"user": 42, "path": "/index", "cached": False, "elapsed": 0.25})
+
+  return lambda: formatter.format(record)
+
+
+# ANSI stripping of megabyte inputs
+
+def _rendered_text(size: int) -> str:
+  logger = TermStyle(SETTINGS)
+  line = logger.render("Value") + " | " + logger.bg_color("200").render("Background") + " | plain text\n"
+
+  return line * (size // len(line) + 1)
+
+
+@case("ansi.strip_ansi.1mb", scale=1000)
+def _strip_ansi():
+  text = _rendered_text(1024 * 1024)
+  return lambda: strip_ansi(text)
+
+
+@case("ansi.strip_ansi.bytes.1mb", scale=1000)
+def _strip_ansi_bytes():
+  data = _rendered_text(1024 * 1024).encode()
+  return lambda: strip_ansi(data)
+
+
+@case("ansi.visible_len.1mb", scale=1000)
+def _visible_len():
+  text = _rendered_text(1024 * 1024)
+  return lambda: visible_len(text)
+
+
+@case("ansi.visible_len.plain.1mb", scale=1000)
+def _visible_len_plain():
+  text = "plain text\n" * (1024 * 1024 // 11)
+  return lambda: visible_len(text)
+
+
+# Spans
+
+def _table_spans():
+  styles = [Style.parse(spec) for spec in ["bold red", "red", "bold green", "green on blue", "cyan"]]
+  return [(f" cell {index:>4} ", styles[index % len(styles)]) for index in range(200)]
+
+
+@case("spans.render_spans.200", scale=10)
+def _render_spans():
+  logger = _sink_logger()
+  spans = _table_spans()
+  return lambda: logger.render_spans(spans)
+
+
+@case("spans.separate_render.200", scale=10)
+def _separate_render():
+  spans = _table_spans()
+  return lambda: "".join(style.render(text) for text, style in spans)
+
+
+# Markup
+
+@case("theme.render")
+def _theme_render():
+  theme = Theme({"error": "bold red", "ok": "green", "muted": "faint"})
+  return lambda: theme["error"].render(MESSAGE)
+
+
+@case("markup.render")
+def _markup_render():
+  logger = _sink_logger()
+  return lambda: logger.markup("[bold red]ERROR[/] user [cyan]{id}[/] failed", id=42)
+
+
+@case("markup.chained_equivalent")
+def _markup_chained():
+  logger = _sink_logger()
+  return lambda: f"{logger.bold().fg_red().render('ERROR')} user {logger.fg_cyan().render(str(42))} failed"
+
+
+# Per-character colors
+
+@case("gradient.80")
+def _gradient():
+  logger = _sink_logger()
+  text = "=" * 80
+  return lambda: logger.gradient(text, (255, 0, 0), (0, 0, 255))
+
+
+@case("gradient.per_char_print.80", scale=10)
+def _gradient_per_char():
+  logger = _sink_logger()
+  text = "=" * 80
+
+  def run():
+    for index, char in enumerate(text):
+      logger.fg_rgb(255 - index * 3, 0, index * 3, text=char, end="")
+
+  return run
+
+
+@case("render_colors.heatmap.4k", scale=100)
+def _render_colors():
+  logger = _sink_logger()
+  colors = [(value % 256, 0, 255 - value % 256) for value in range(4096)]
+  text = "#" * len(colors)
+  return lambda: logger.render_colors(text, colors)
+
+
+# Color depth conversion
+
+def _quantize_case(depth: str):
+  def setup():
+    rgbs = [((r << 16) | (g << 8) | b) for r in range(0, 256, 37) for g in range(0, 256, 37) for b in range(0, 256, 37)]
+    keys = [TermSettings({"foreground": {"rgb": [str(rgb >> 16), str((rgb >> 8) & 0xFF), str(rgb & 0xFF)]}}).key() for rgb in rgbs]
+
+    def run():
+      for key in keys:
+        build_format(key, depth)
+
+    return run
+
+  return setup
+
+
+for _depth in ["truecolor", "256", "16"]:
+  case(f"build_format.depth.{_depth}", scale=100)(_quantize_case(_depth))
+
+
+# utils
+
+@case("utils.is_rgb_valid")
+def _is_rgb_valid():
+  rgb = ["61", "217", "187"]
+  return lambda: is_rgb_valid(rgb)
+
+
+@case("utils.is_valid_color")
+def _is_valid_color():
+  return lambda: (is_valid_color("sky-blue"), is_valid_color("200"))
+
+
+@case("utils.get_4bit_color_code")
+def _get_4bit_color_code():
+  return lambda: get_4bit_color_code("cyan", "background")
+
+
+@case("utils.get_8bit_color_code")
+def _get_8bit_color_code():
+  return lambda: (get_8bit_color_code("sky-blue"), get_8bit_color_code("200"))
+
+
+@case("utils.unique")
+def _unique():
+  items = ["bold", "italic", "bold", "underline", "italic"]
+  return lambda: unique(items)
+
+
+def run_case(setup: Callable[[], Callable[[], object]], number: int, repeat: int) -> float:
+  """
+  Returns best time of single call in nanoseconds
+  """
+  function = setup()
+  timings = timeit.repeat(function, number=number, repeat=repeat)
+
+  return min(timings) / number * 1e9
+
+
+def environment() -> dict:
+  return {
+    "python": platform.python_version(),
+    "implementation": platform.python_implementation(),
+    "platform": platform.platform(),
+  }
+
+
+def main(argv=None) -> int:
+  parser = argparse.ArgumentParser(description="pytermstyle micro-benchmarks")
+  parser.add_argument("--output", default="benchmark_results.json", help="JSON file for results")
+  parser.add_argument("--compare", help="JSON file with previous results")
+  parser.add_argument("--filter", default="", help="Run only benchmarks containing this text")
+  parser.add_argument("--number", type=int, default=10000, help="Calls per measurement")
+  parser.add_argument("--repeat", type=int, default=5, help="Measurements per benchmark")
+  args = parser.parse_args(argv)
+
+  previous = {}
+  if args.compare:
+    with open(args.compare, encoding="utf-8") as file:
+      previous = json.load(file).get("results", {})
+
+  results = {}
+  for name, setup in CASES.items():
+    if args.filter not in name:
+      continue
+
+    number = max(1, args.number // SCALES[name])
+    result = results[name] = run_case(setup, number, args.repeat)
+
+    line = "{:<32}{:>12.1f} ns".format(name, result)
+    if name in previous:
+      line += "{:>10.2f}x".format(result / previous[name])
+
+    print(line)
+
+  with open(args.output, "w", encoding="utf-8") as file:
+    json.dump({"environment": environment(), "unit": "ns", "results": results}, file, indent=2)
+
+  print(f"Results written to {args.output}", file=sys.stderr)
+
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -1,38 +1,192 @@
-from .pytermstyle import ColorException
-from .pytermstyle import TermStyle
-from .pytermstyle import get_default_logger
-from .pytermstyle import init_config
-from .pytermstyle import create_logger
-
-from .settings import TermConfigException
-from .settings import TermSettings
-
-from .logger import TermStyleRecord
-from .logger import TermStyleFormatter
-from .logger import basicConfig
-
-from .utils import is_rgb_valid
-from .utils import is_valid_color
-from .utils import get_4bit_color_code
-from .utils import get_8bit_color_code
-from .utils import check_invalid_mode
-from .utils import unique
-
-from .definitions import BASE
-from .definitions import RESET
-from .definitions import FG_RGB_CODE
-from .definitions import BG_RGB_CODE
-from .definitions import FG_COLOR_CODE
-from .definitions import BG_COLOR_CODE
-from .definitions import textStyles
-from .definitions import baseColors
-from .definitions import extendedColors
-
-from .custom_types import TextStyle
-from .custom_types import Color
-from .custom_types import Colors
-from .custom_types import ColorMode
-from .custom_types import TermOptions
+"""
+ANSI color formatting for output in terminal.
+
+Submodules are imported on first access of their attributes (PEP 562),\n
+so importing the package doesn't load `logging`, `asyncio` or other unused dependencies.
+"""
+import importlib
+
+# Same as `typing.TYPE_CHECKING`, without importing `typing`
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+  from .pytermstyle import ColorException
+  from .pytermstyle import TermStyle
+  from .pytermstyle import get_default_logger
+  from .pytermstyle import init_config
+  from .pytermstyle import create_logger
+
+  from .capabilities import ColorSupport
+  from .capabilities import color_support
+  from .capabilities import detect_color_support
+  from .capabilities import detect_color_depth
+
+  from .aio import AsyncTermStyle
+
+  from .colorize import Colorizer
+
+  from .ansi import strip_ansi
+  from .ansi import visible_len
+
+  from .sink import OutputSink
+
+  from .style import Style
+  from .theme import Theme
+
+  from .templates import MarkupTemplate
+  from .templates import compile_markup
+  from .templates import markup
+
+  from .spans import render_spans
+  from .spans import sgr_transition
+
+  from .formats import build_format
+  from .formats import merge_keys
+  from .formats import format_cache_info
+  from .formats import clear_format_cache
+
+  from .settings import TermConfigException
+  from .settings import TermSettings
+  from .settings import CompiledSettings
+
+  from .logger import TermStyleRecord
+  from .logger import TermStyleFormatter
+  from .logger import basicConfig
+  from .structured import TermStyleStructuredFormatter
+
+  from .handlers import TermStyleQueueHandler
+  from .handlers import TermStyleQueueListener
+
+  from .utils import is_rgb_valid
+  from .utils import is_valid_color
+  from .utils import get_4bit_color_code
+  from .utils import get_8bit_color_code
+  from .utils import check_invalid_mode
+  from .utils import unique
+
+  from .definitions import BASE
+  from .definitions import RESET
+  from .definitions import FG_RGB_CODE
+  from .definitions import BG_RGB_CODE
+  from .definitions import FG_COLOR_CODE
+  from .definitions import BG_COLOR_CODE
+  from .definitions import FG_8BIT_CODES
+  from .definitions import BG_8BIT_CODES
+  from .definitions import COLOR_MODES
+  from .definitions import COLOR_DEPTHS
+  from .definitions import COLOR_8BIT
+  from .definitions import COLOR_NAMED
+  from .definitions import COLOR_RGB
+  from .definitions import textStyles
+  from .definitions import textStyleResets
+  from .definitions import styleMasks
+  from .definitions import baseColors
+  from .definitions import extendedColors
+  from .definitions import colorNames
+  from .definitions import colorCodes
+  from .definitions import baseColorCodes
+
+  from .custom_types import TextStyle
+  from .custom_types import Color
+  from .custom_types import Colors
+  from .custom_types import ColorMode
+  from .custom_types import ColorDepth
+  from .custom_types import TermOptions
+
+# Submodule of every public attribute
+_LAZY_ATTRIBUTES = {
+  'ColorException': 'pytermstyle',
+  'TermStyle': 'pytermstyle',
+  'get_default_logger': 'pytermstyle',
+  'init_config': 'pytermstyle',
+  'create_logger': 'pytermstyle',
+
+  'ColorSupport': 'capabilities',
+  'color_support': 'capabilities',
+  'detect_color_support': 'capabilities',
+  'detect_color_depth': 'capabilities',
+
+  'AsyncTermStyle': 'aio',
+
+  'Colorizer': 'colorize',
+
+  'strip_ansi': 'ansi',
+  'visible_len': 'ansi',
+
+  'OutputSink': 'sink',
+
+  'Style': 'style',
+
+  'Theme': 'theme',
+
+  'MarkupTemplate': 'templates',
+  'compile_markup': 'templates',
+  'markup': 'templates',
+
+  'render_spans': 'spans',
+  'sgr_transition': 'spans',
+
+  'build_format': 'formats',
+  'merge_keys': 'formats',
+  'format_cache_info': 'formats',
+  'clear_format_cache': 'formats',
+
+  'TermConfigException': 'settings',
+  'TermSettings': 'settings',
+  'CompiledSettings': 'settings',
+
+  'TermStyleRecord': 'logger',
+  'TermStyleFormatter': 'logger',
+  'basicConfig': 'logger',
+
+  'TermStyleStructuredFormatter': 'structured',
+
+  'TermStyleQueueHandler': 'handlers',
+  'TermStyleQueueListener': 'handlers',
+
+  'is_rgb_valid': 'utils',
+  'is_valid_color': 'utils',
+  'get_4bit_color_code': 'utils',
+  'get_8bit_color_code': 'utils',
+  'check_invalid_mode': 'utils',
+  'unique': 'utils',
+
+  'BASE': 'definitions',
+  'RESET': 'definitions',
+  'FG_RGB_CODE': 'definitions',
+  'BG_RGB_CODE': 'definitions',
+  'FG_COLOR_CODE': 'definitions',
+  'BG_COLOR_CODE': 'definitions',
+  'FG_8BIT_CODES': 'definitions',
+  'BG_8BIT_CODES': 'definitions',
+  'COLOR_MODES': 'definitions',
+  'COLOR_DEPTHS': 'definitions',
+  'COLOR_8BIT': 'definitions',
+  'COLOR_NAMED': 'definitions',
+  'COLOR_RGB': 'definitions',
+  'textStyles': 'definitions',
+  'textStyleResets': 'definitions',
+  'styleMasks': 'definitions',
+  'baseColors': 'definitions',
+  'extendedColors': 'definitions',
+  'colorNames': 'definitions',
+  'colorCodes': 'definitions',
+  'baseColorCodes': 'definitions',
+
+  'TextStyle': 'custom_types',
+  'Color': 'custom_types',
+  'Colors': 'custom_types',
+  'ColorMode': 'custom_types',
+  'ColorDepth': 'custom_types',
+  'TermOptions': 'custom_types',
+}
+
+# Submodules, which are imported on first access as attributes of the package
+_SUBMODULES = frozenset({
+  'aio', 'ansi', 'capabilities', 'colorize', 'custom_types', 'definitions', 'formats', 'gradient',
+  'handlers', 'logger', 'palette', 'pytermstyle', 'settings', 'sink', 'spans', 'structured', 'style',
+  'templates', 'theme', 'utils',
+})
 
 __all__ = [
   'ColorException',
@@ -40,11 +194,35 @@ __all__ = [
   'get_default_logger',
   'init_config',
   'create_logger',
+  'ColorSupport',
+  'color_support',
+  'detect_color_support',
+  'detect_color_depth',
+  'AsyncTermStyle',
+  'Colorizer',
+  'strip_ansi',
+  'visible_len',
+  'OutputSink',
+  'Style',
+  'Theme',
+  'MarkupTemplate',
+  'compile_markup',
+  'markup',
+  'render_spans',
+  'sgr_transition',
+  'build_format',
+  'merge_keys',
+  'format_cache_info',
+  'clear_format_cache',
   'TermConfigException',
   'TermSettings',
+  'CompiledSettings',
   'TermStyleRecord',
   'TermStyleFormatter',
   'basicConfig',
+  'TermStyleStructuredFormatter',
+  'TermStyleQueueHandler',
+  'TermStyleQueueListener',
   'is_rgb_valid',
   'is_valid_color',
   'get_4bit_color_code',
@@ -57,12 +235,43 @@ __all__ = [
   'BG_RGB_CODE',
   'FG_COLOR_CODE',
   'BG_COLOR_CODE',
+  'FG_8BIT_CODES',
+  'BG_8BIT_CODES',
+  'COLOR_MODES',
+  'COLOR_DEPTHS',
+  'COLOR_8BIT',
+  'COLOR_NAMED',
+  'COLOR_RGB',
   'textStyles',
+  'textStyleResets',
+  'styleMasks',
   'baseColors',
   'extendedColors',
+  'colorNames',
+  'colorCodes',
+  'baseColorCodes',
   'TextStyle',
   'Color',
   'Colors',
   'ColorMode',
+  'ColorDepth',
   'TermOptions',
 ]
+
+
+def __getattr__(name: str):
+  module = _LAZY_ATTRIBUTES.get(name)
+  if module is None:
+    if name in _SUBMODULES:
+      return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+  value = getattr(importlib.import_module(f".{module}", __name__), name)
+  globals()[name] = value
+
+  return value
+
+
+def __dir__():
+  return sorted(set(globals()) | set(__all__))
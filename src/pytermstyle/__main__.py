@@ -0,0 +1,82 @@
+"""
+Colorizes text files or standard input, e.g. log files.
+
+Usage: python -m pytermstyle [--levels] [--match PATTERN STYLE]... [FILE]...
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+
+from typing import Optional
+
+from .colorize import Colorizer, DEFAULT_CHUNK_SIZE
+from .settings import TermConfigException
+
+
+def _parser() -> argparse.ArgumentParser:
+  parser = argparse.ArgumentParser(
+    prog="python -m pytermstyle",
+    description="Colorize text files or standard input.",
+    epilog='Styles are words separated by spaces or commas, e.g. "bold red on #20576f"',
+  )
+  parser.add_argument("files", nargs="*", metavar="FILE", help="Files to colorize (standard input by default)")
+  parser.add_argument(
+    "-l", "--levels", action="store_true",
+    help="Style lines starting with logging level (default if no pattern is provided)"
+  )
+  parser.add_argument(
+    "-m", "--match", nargs=2, action="append", default=[], metavar=("PATTERN", "STYLE"),
+    help="Style every match of regular expression PATTERN with STYLE"
+  )
+  parser.add_argument("-i", "--ignore-case", action="store_true", help="Match patterns case-insensitively")
+  parser.add_argument(
+    "--color", choices=["auto", "always", "never"], default="auto",
+    help="When to use colors (default: auto)"
+  )
+  parser.add_argument("--mmap", action="store_true", help="Memory map input files instead of reading them")
+  parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Size of processed chunks in bytes")
+
+  return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+  parser = _parser()
+  args = parser.parse_args(argv)
+
+  if args.chunk_size < 1:
+    parser.error("--chunk-size must be a positive number")
+
+  try:
+    colorizer = Colorizer(
+      dict(args.match),
+      levels=args.levels or not args.match,
+      flags=re.IGNORECASE if args.ignore_case else 0
+    )
+  except (TermConfigException, re.error) as error:
+    parser.error(str(error))
+
+  color = {"auto": None, "always": True, "never": False}[args.color]
+  output = sys.stdout.buffer
+
+  try:
+    if not args.files:
+      colorizer.colorize_stream(sys.stdin.buffer, output, chunk_size=args.chunk_size, color=color)
+
+    for path in args.files:
+      with open(path, "rb") as file:
+        colorizer.colorize_stream(file, output, chunk_size=args.chunk_size, use_mmap=args.mmap, color=color)
+  except BrokenPipeError:
+    # Output was closed early, e.g. piped to `head`
+    sys.stderr.close()
+    return 1
+  except OSError as error:
+    print(f"{parser.prog}: error: {error}", file=sys.stderr)
+    return 1
+
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
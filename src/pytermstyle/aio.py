@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import weakref
+
+from typing import Any, Optional
+
+from .pytermstyle import TermStyle
+from .settings import Settings
+
+"""Colored output for asyncio applications."""
+
+__all__ = [
+  'AsyncTermStyle'
+]
+
+
+class _ExecutorWriter:
+  """
+  Minimal stream writer for streams that are not connected to the event loop\n
+  (e.g. standard output, terminals, regular files, in-memory streams). Data is written in default executor.
+  """
+  def __init__(self, stream: Any, loop: asyncio.AbstractEventLoop, encoding: str) -> None:
+    self._stream = stream
+    self._loop = loop
+    self._encoding = encoding
+    self._buffer: list[bytes] = []
+    self._lock = asyncio.Lock()
+
+  def write(self, data: bytes):
+    self._buffer.append(data)
+
+  def _write_blocking(self, data: bytes):
+    buffer = getattr(self._stream, "buffer", None)
+    if buffer is not None:
+      buffer.write(data)
+    else:
+      self._stream.write(data.decode(self._encoding))
+
+    self._stream.flush()
+
+  async def drain(self):
+    async with self._lock:
+      if self._buffer:
+        data = b"".join(self._buffer)
+        self._buffer = []
+
+        await self._loop.run_in_executor(None, self._write_blocking, data)
+
+  def close(self):
+    pass
+
+  async def wait_closed(self):
+    pass
+
+
+class _PipeProtocol(asyncio.Protocol):
+  """
+  Protocol of pipe transport which tracks pausing of writing by the transport
+  """
+  def __init__(self) -> None:
+    self._paused = False
+    self._waiters: list[asyncio.Future] = []
+    self._exception: Optional[BaseException] = None
+    self.closed: asyncio.Future = asyncio.get_running_loop().create_future()
+
+  def pause_writing(self):
+    self._paused = True
+
+  def resume_writing(self):
+    self._paused = False
+    self._wake_waiters()
+
+  def connection_lost(self, exc: Optional[BaseException]):
+    self._exception = exc
+    self._paused = False
+    self._wake_waiters()
+
+    if not self.closed.done():
+      self.closed.set_result(None)
+
+  def _wake_waiters(self):
+    waiters, self._waiters = self._waiters, []
+    for waiter in waiters:
+      if not waiter.done():
+        waiter.set_result(None)
+
+  async def wait_writable(self):
+    if self._exception is not None:
+      raise self._exception
+
+    if self._paused:
+      waiter = asyncio.get_running_loop().create_future()
+      self._waiters.append(waiter)
+      await waiter
+
+      if self._exception is not None:
+        raise self._exception
+
+
+class _PipeWriter:
+  """
+  Stream writer for file descriptor connected to the event loop as a pipe.\n
+  Blocking mode of the file descriptor, which is shared with the original stream, is restored once writer is closed,\n
+  or when writer is garbage collected or the interpreter exits without closing it.
+  """
+  def __init__(self, transport: asyncio.WriteTransport, protocol: _PipeProtocol, fd: int, blocking: bool) -> None:
+    self._transport = transport
+    self._protocol = protocol
+    self._restore = weakref.finalize(self, _restore_blocking, fd, blocking)
+
+  def write(self, data: bytes):
+    self._transport.write(data)
+
+  async def drain(self):
+    if self._transport.is_closing() and self._protocol.closed.done():
+      raise ConnectionResetError("Connection lost")
+
+    await self._protocol.wait_writable()
+
+  def close(self):
+    self._transport.close()
+
+  async def wait_closed(self):
+    try:
+      await self._protocol.closed
+    finally:
+      self._restore()
+
+
+def _restore_blocking(fd: int, blocking: bool):
+  try:
+    os.set_blocking(fd, blocking)
+  except OSError:
+    pass
+
+
+def _isatty(stream: Any) -> bool:
+  try:
+    return stream.isatty()
+  except (AttributeError, OSError, ValueError):
+    return False
+
+
+class AsyncTermStyle(TermStyle):
+  """
+  Colored logger which writes output without blocking the event loop.
+
+  Output is written through `writer` (`asyncio.StreamWriter` or compatible object) if provided.\n
+  Otherwise, duplicate of `stream` file descriptor is connected to the event loop as a non-blocking pipe\n
+  on the first output, if `stream` is a pipe. Since non-blocking mode is shared with the original stream,\n
+  regular writes to it should be avoided until `aclose` is awaited, which restores the original blocking mode.
+
+  Standard output (used if `stream` is not provided), terminals and other streams are written in default executor,\n
+  so they are never switched to non-blocking mode.
+
+  Outputs made within the same iteration of the event loop are joined in a single write,\n
+  and every `aprint` call waits for the writer to drain, respecting its backpressure.
+
+  `stream` is also used to detect NO_COLOR mode.
+  """
+  def __init__(
+    self,
+    settings: Optional[Settings] = None,
+    *,
+    writer: Any = None,
+    stream: Any = None,
+    encoding: str = "utf-8"
+  ) -> None:
+    super().__init__(settings)
+
+    self._writer = writer
+    self._output_stream = stream
+    self._encoding = encoding
+    self._pending: list[str] = []
+    self._flushed: Optional[asyncio.Future] = None
+    self._connecting: Optional[asyncio.Future] = None
+
+  def _stream(self, file: Any = None) -> Any:
+    if file is not None:
+      return file
+
+    return self._output_stream if self._output_stream is not None else sys.stdout
+
+  async def aprint(self, text: Optional[str] = None, clear: bool = True, *, end: str = "\n"):
+    """
+    Asynchronous equivalent of `print` method
+    """
+    if text:
+      self._pending.append(self.render(text, False) + end)
+
+    if clear:
+      self._clear_override()
+
+    if not text:
+      return self
+
+    writer = self._writer if self._writer is not None else await self._connect()
+
+    await asyncio.shield(self._schedule_flush(writer))
+    await writer.drain()
+
+    return self
+
+  async def drain(self):
+    """
+    Waits until all output is written
+    """
+    if self._flushed is not None:
+      await asyncio.shield(self._flushed)
+
+    if self._writer is not None:
+      await self._writer.drain()
+
+  async def aclose(self):
+    """
+    Writes remaining output and closes writer created by logger
+    """
+    await self.drain()
+
+    if self._writer is not None and self._connecting is not None:
+      writer, self._writer, self._connecting = self._writer, None, None
+
+      writer.close()
+      await writer.wait_closed()
+
+  def _schedule_flush(self, writer: Any) -> asyncio.Future:
+    if self._flushed is None:
+      loop = asyncio.get_running_loop()
+
+      self._flushed = loop.create_future()
+      loop.call_soon(self._flush, writer)
+
+    return self._flushed
+
+  def _flush(self, writer: Any):
+    flushed, self._flushed = self._flushed, None
+    data, self._pending = "".join(self._pending), []
+
+    try:
+      if data:
+        writer.write(data.encode(self._encoding))
+    except Exception as exc:
+      flushed.set_exception(exc)  # type: ignore
+    else:
+      flushed.set_result(None)  # type: ignore
+
+  async def _connect(self) -> Any:
+    if self._connecting is None:
+      self._connecting = asyncio.ensure_future(self._open_writer())
+
+    writer = await asyncio.shield(self._connecting)
+    self._writer = writer
+
+    return writer
+
+  async def _open_writer(self) -> Any:
+    loop = asyncio.get_running_loop()
+    stream = self._stream()
+
+    # Only explicitly provided streams are taken over, as terminal is usually shared with other streams and processes
+    if self._output_stream is None or _isatty(stream):
+      return _ExecutorWriter(stream, loop, self._encoding)
+
+    try:
+      stream.flush()
+      fd = stream.fileno()
+      blocking = os.get_blocking(fd)
+      pipe = os.fdopen(os.dup(fd), "wb", buffering=0)
+    except (AttributeError, OSError, ValueError):
+      return _ExecutorWriter(stream, loop, self._encoding)
+
+    try:
+      transport, protocol = await loop.connect_write_pipe(_PipeProtocol, pipe)
+    except (OSError, ValueError, NotImplementedError):
+      pipe.close()
+      _restore_blocking(fd, blocking)
+
+      return _ExecutorWriter(stream, loop, self._encoding)
+
+    return _PipeWriter(transport, protocol, fd, blocking)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import re
+
+from typing import Union
+
+"""Removal and measurement of SGR escape sequences in already rendered text."""
+
+__all__ = [
+  'strip_ansi', 'visible_len'
+]
+
+# Select Graphic Rendition sequences, e.g. "\033[1;38;2;61;217;187;48;5;200m" or "\033[0m"
+_SGR = re.compile("\033\\[[0-9;:]*m")
+_SGR_BYTES = re.compile(b"\033\\[[0-9;:]*m")
+
+_ESCAPE = "\033"
+# Membership test of memoryview compares items, so it is scanned by pattern instead
+_ESCAPE_BYTES = b"\033"
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def strip_ansi(text: Union[str, BytesLike]) -> Union[str, bytes]:
+  """
+  Returns copy of `text` (str or bytes-like object) without SGR escape sequences\n
+  (styles, 4-bit, 8-bit and RGB colors and resets).
+
+  Bytes-like `text` is returned as bytes.
+  """
+  if isinstance(text, str):
+    if _ESCAPE not in text:
+      return text
+
+    return _SGR.sub("", text)
+
+  if not isinstance(text, memoryview) and _ESCAPE_BYTES not in text:
+    return bytes(text)
+
+  return _SGR_BYTES.sub(b"", text)
+
+
+def visible_len(text: Union[str, BytesLike]) -> int:
+  """
+  Returns length of `text` (str or bytes-like object) without SGR escape sequences,\n
+  i.e. number of characters (or bytes) visible in terminal
+  """
+  if isinstance(text, str):
+    if _ESCAPE not in text:
+      return len(text)
+
+    return len(_SGR.sub("", text))
+
+  if not isinstance(text, memoryview) and _ESCAPE_BYTES not in text:
+    return len(text)
+
+  return len(_SGR_BYTES.sub(b"", text))
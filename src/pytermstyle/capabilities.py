@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import os
+import sys
+import weakref
+
+from typing import Any, Optional, Tuple
+
+from .custom_types import ColorDepth
+from .definitions import COLOR_DEPTHS
+
+"""Detection of color support for output streams."""
+
+__all__ = [
+  'ColorSupport', 'color_support', 'detect_color_support', 'detect_color_depth'
+]
+
+DISABLE_ENV = ("NO_COLOR", "ANSI_COLORS_DISABLED")
+WATCHED_ENV = ("NO_COLOR", "ANSI_COLORS_DISABLED", "FORCE_COLOR", "TERM", "COLORTERM")
+
+# Other values of FORCE_COLOR (e.g. "1" or "true") only force colored output, and depth is detected
+FORCE_COLOR_DEPTHS: dict[str, ColorDepth] = {"2": "256", "3": "truecolor"}
+TRUECOLOR_TERMS = ("truecolor", "24bit")
+BASIC_TERMS = ("linux", "vt100", "vt220", "ansi", "cygwin", "xterm-color", "screen")
+
+
+def detect_color_support(stream: Any = None) -> bool:
+  """
+  Returns True if colored output should be written to `stream` (standard output by default).\n
+  Colors are disabled if one of the following environment variables exists,\n
+  or if stream is not a terminal:
+   * NO_COLOR
+   * ANSI_COLORS_DISABLED
+   * TERM = "dumb"
+
+  If FORCE_COLOR environment variable exists, colored output will be attempted.
+  """
+  if any(env_var in os.environ for env_var in DISABLE_ENV):
+    return False
+
+  if "FORCE_COLOR" in os.environ:
+    return True
+
+  if os.environ.get("TERM") == "dumb":
+    return False
+
+  if stream is None:
+    stream = sys.stdout
+
+  isatty = getattr(stream, "isatty", None)
+  if isatty is None:
+    return False
+
+  try:
+    return bool(isatty())
+  except ValueError:
+    # Stream is already closed
+    return False
+
+
+def detect_color_depth(stream: Any = None) -> ColorDepth:
+  """
+  Returns colors supported by `stream` (standard output by default):
+   * "none" - Colored output is not supported (See `detect_color_support`)
+   * FORCE_COLOR = "2" or "3" - "256" or "truecolor" respectively
+   * COLORTERM = "truecolor" or "24bit" - "truecolor"
+   * TERM ending with "256color" - "256"
+   * TERM of basic terminals (e.g. "linux", "vt100", "xterm-color") - "16"
+
+  Otherwise, "truecolor" is assumed and colors are written as configured.
+  """
+  if not detect_color_support(stream):
+    return "none"
+
+  depth = FORCE_COLOR_DEPTHS.get(os.environ.get("FORCE_COLOR", ""))
+  if depth is not None:
+    return depth
+
+  if os.environ.get("COLORTERM", "").lower() in TRUECOLOR_TERMS:
+    return "truecolor"
+
+  term = os.environ.get("TERM", "").lower()
+  if term.endswith("256color"):
+    return "256"
+
+  if term in BASIC_TERMS or term.endswith("16color"):
+    return "16"
+
+  return "truecolor"
+
+
+class ColorSupport:
+  """
+  Resolves color support and color depth once per output stream and caches the result.
+
+  Cached results can be discarded by calling `refresh()`, or automatically\n
+  whenever relevant environment variables change by enabling `watch_env()`.
+
+  Detected color depth can be overridden with `force_depth()`.
+  """
+  def __init__(self) -> None:
+    self._cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    self._last: Tuple[Any, ColorDepth] = (None, "none")
+    self._watching = False
+    self._env: Optional[Tuple[Optional[str], ...]] = None
+    self._forced: Optional[ColorDepth] = None
+
+  def enabled(self, stream: Any = None) -> bool:
+    """
+    Returns True if colored output is supported for `stream` (standard output by default)
+    """
+    return self.depth(stream) != "none"
+
+  def depth(self, stream: Any = None) -> ColorDepth:
+    """
+    Returns colors supported by `stream` (standard output by default), see `ColorDepth` type
+    """
+    if stream is None:
+      stream = sys.stdout
+
+    if self._watching:
+      self._check_env()
+
+    last_stream, last_depth = self._last
+    if stream is last_stream:
+      return last_depth
+
+    try:
+      depth = self._cache[stream]
+    except KeyError:
+      depth = self._cache[stream] = self._detect(stream)
+    except TypeError:
+      # Stream does not support weak references
+      depth = self._detect(stream)
+
+    self._last = (stream, depth)
+
+    return depth
+
+  def force_depth(self, depth: Optional[ColorDepth]):
+    """
+    Uses `depth` for every stream which supports colored output instead of detected depth.\n
+    Forcing "none" depth disables colored output. Detection is restored with `None`.
+    """
+    if depth is not None and depth not in COLOR_DEPTHS:
+      raise ValueError(f"Color depth {depth} is not supported")
+
+    self._forced = depth
+    self.refresh()
+
+  def _detect(self, stream: Any) -> ColorDepth:
+    depth = detect_color_depth(stream)
+    if depth == "none" or self._forced is None:
+      return depth
+
+    return self._forced
+
+  def refresh(self, stream: Any = None):
+    """
+    Discards cached result for `stream`, or for every stream if `stream` is not provided
+    """
+    if stream is None:
+      self._cache.clear()
+    else:
+      try:
+        self._cache.pop(stream, None)
+      except TypeError:
+        pass
+
+    self._last = (None, "none")
+
+  def watch_env(self, enabled: bool = True):
+    """
+    When enabled, cached results are discarded whenever one of the environment\n
+    variables controlling color output changes.
+    """
+    self._watching = enabled
+    self._env = self._snapshot_env() if enabled else None
+
+  def _snapshot_env(self) -> Tuple[Optional[str], ...]:
+    return tuple(os.environ.get(env_var) for env_var in WATCHED_ENV)
+
+  def _check_env(self):
+    env = self._snapshot_env()
+    if env != self._env:
+      self._env = env
+      self.refresh()
+
+
+color_support = ColorSupport()
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import mmap
+import re
+import shutil
+
+from typing import Any, BinaryIO, Iterator, Mapping, Optional, Union
+
+from .capabilities import color_support
+from .custom_types import ColorDepth
+from .definitions import RESET
+from .settings import TermSettings, Settings
+from .style import Style
+
+"""Colorizing of large text streams, e.g. log files."""
+
+__all__ = [
+  'Colorizer', 'DEFAULT_CHUNK_SIZE', 'MAX_LINE_SIZE', 'LEVEL_STYLES'
+]
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+MAX_LINE_SIZE = 64 * 1024
+
+StyleLike = Union[Style, TermSettings, Settings, str]
+
+LEVEL_STYLES: dict[str, StyleLike] = {
+  "DEBUG": {"foreground": {"color": "light-blue"}},
+  "INFO": {"foreground": {"color": "green"}},
+  "WARNING": {"foreground": {"color": "yellow"}},
+  "WARN": {"foreground": {"color": "yellow"}},
+  "ERROR": {"foreground": {"color": "red"}},
+  "CRITICAL": {"style": ["bold"], "foreground": {"color": "red"}},
+  "FATAL": {"style": ["bold"], "foreground": {"color": "red"}},
+}
+
+_RESET = RESET.encode()
+
+# Escaped character, including octal escape and numbered backreference, or conditional group with number
+_NUMBERED_REFERENCE = re.compile(r"\\(?:[0-7]{3}|(?P<group>[1-9]\d?)|.)|(?P<condition>\(\?\(\d+\))", re.DOTALL)
+
+
+def _check_references(pattern: str):
+  """
+  Numbered groups of a rule are shifted when rules are combined, so references to them are rejected
+  """
+  for match in _NUMBERED_REFERENCE.finditer(pattern):
+    if match.group("group") or match.group("condition"):
+      reference = match.group()
+      raise re.error(
+        f"Numbered group reference {reference!r} is not supported in pattern {pattern!r}, "
+        "use named groups instead, e.g. (?P<name>...)(?P=name)"
+      )
+
+
+def _to_style(style: StyleLike) -> Style:
+  if isinstance(style, str):
+    return Style.parse(style)
+
+  return Style(style)
+
+
+class Colorizer:
+  """
+  Applies styles to text streams in large chunks, with memory bounded by chunk size.
+
+  `rules` - Mapping of regular expression to style. Every match of the expression is styled.
+
+  `levels` - If True, every line starting with logging level name (optionally preceded by whitespace or `[`)\n
+  is styled with style of that level (See `LEVEL_STYLES`). Mapping of level name to style can be provided instead.\n
+  Lines matched by level are not matched by other rules.
+
+  Style can be `style.Style`, settings or style specification (See `Style.parse`).
+
+  e.g. `Colorizer({r"\\d+ms": "bold yellow"}, levels=True)`
+
+  Numbered group references (e.g. `\\1`) are not supported in rules, named groups can be used instead.
+
+  Input is processed line by line, so matches can't span multiple lines.\n
+  Lines longer than `MAX_LINE_SIZE` (or chunk size, if larger) are processed in parts.
+  """
+  def __init__(
+    self,
+    rules: Optional[Mapping[str, StyleLike]] = None,
+    *,
+    levels: Union[bool, Mapping[str, StyleLike]] = False,
+    flags: int = 0
+  ) -> None:
+    patterns: list[bytes] = []
+    self._styles: dict[str, Style] = {}
+    self._level_styles: dict[bytes, Style] = {}
+
+    if levels:
+      level_styles = LEVEL_STYLES if levels is True else levels
+      level_names = b"|".join(re.escape(level.encode()) for level in level_styles)
+
+      patterns.append(b"(?P<_level>^[^\\S\\n]*\\[?(?P<_level_name>" + level_names + b")\\b[^\\n]*)")
+      # Level names are matched case-insensitively with `re.IGNORECASE`, so they are looked up in upper case
+      self._level_styles = {level.upper().encode(): _to_style(style) for level, style in level_styles.items()}  # type: ignore
+
+    for index, (pattern, style) in enumerate((rules or {}).items()):
+      name = f"_rule{index}"
+      _check_references(pattern)
+
+      patterns.append(f"(?P<{name}>{pattern})".encode())
+      self._styles[name] = _to_style(style)
+
+    if not patterns:
+      raise ValueError("Colorizer requires at least one rule or levels")
+
+    self._pattern = re.compile(b"|".join(patterns), flags | re.MULTILINE)
+    self._set_depth("truecolor")
+
+  def _set_depth(self, depth: ColorDepth):
+    self._depth = depth
+    self._prefixes = {name: style.format(depth).encode() for name, style in self._styles.items()}
+    self._level_prefixes = {level: style.format(depth).encode() for level, style in self._level_styles.items()}
+
+  def _replace(self, match: re.Match) -> bytes:
+    if match.lastgroup == "_level":
+      prefix = self._level_prefixes[match.group("_level_name").upper()]
+    else:
+      prefix = self._prefixes[match.lastgroup]  # type: ignore
+
+    if not prefix or match.start() == match.end():
+      return match.group()
+
+    return b"".join([prefix, match.group(), _RESET])
+
+  def colorize(self, data: Any) -> bytes:
+    """
+    Returns styled copy of bytes-like `data`
+    """
+    return self._pattern.sub(self._replace, data)
+
+  def iter_chunks(self, source: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Reads binary `source` in chunks of `chunk_size` bytes, and yields styled chunks\n
+    split on line boundaries.
+    """
+    max_line = max(chunk_size, MAX_LINE_SIZE)
+    carry = b""
+
+    while True:
+      data = source.read(chunk_size)
+      if not data:
+        break
+
+      if carry:
+        data = carry + data
+
+      end = data.rfind(b"\n") + 1
+      if end == 0 and len(data) < max_line:
+        carry = data
+        continue
+
+      if end == 0:
+        end = len(data)
+
+      carry = data[end:]
+      yield self.colorize(memoryview(data)[:end])
+
+    if carry:
+      yield self.colorize(carry)
+
+  def iter_mapped(self, source: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Memory maps file `source` (path or binary file), and yields styled chunks\n
+    without reading the file into memory.
+    """
+    file = open(source, "rb") if isinstance(source, (str, bytes)) or hasattr(source, "__fspath__") else source
+
+    max_line = max(chunk_size, MAX_LINE_SIZE)
+
+    try:
+      try:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+      except ValueError:
+        # Empty file can't be mapped
+        return
+
+      with mapped:
+        start, size = 0, len(mapped)
+
+        while start < size:
+          chunk_end = min(start + chunk_size, size)
+          end = mapped.find(b"\n", chunk_end - 1, chunk_end + max_line) + 1
+          if end == 0:
+            end = min(chunk_end + max_line, size)
+
+          view = memoryview(mapped)[start:end]
+          try:
+            yield self.colorize(view)
+          finally:
+            view.release()
+
+          start = end
+    finally:
+      if file is not source:
+        file.close()
+
+  def colorize_stream(
+    self,
+    source: BinaryIO,
+    destination: BinaryIO,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    use_mmap: bool = False,
+    color: Optional[bool] = None
+  ):
+    """
+    Writes styled content of binary `source` to binary `destination`.
+
+    `use_mmap` - Memory map `source` instead of reading it. Requires `source` to be a regular file.
+
+    `color` - Force (True) or disable (False) colored output.\n
+    By default, color support and color depth of `destination` are detected (See `capabilities.ColorSupport`).
+    """
+    depth: ColorDepth = "truecolor"
+    if color is None:
+      depth = color_support.depth(destination)
+      color = depth != "none"
+
+    if not color:
+      shutil.copyfileobj(source, destination, chunk_size)
+      return
+
+    if depth != self._depth:
+      self._set_depth(depth)
+
+    chunks = self.iter_mapped(source, chunk_size) if use_mmap else self.iter_chunks(source, chunk_size)
+    for chunk in chunks:
+      destination.write(chunk)
+
+    destination.flush()
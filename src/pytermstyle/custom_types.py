@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Literal, Union, TypedDict
 
 __all__ = [
-  'TextStyle', 'Color', 'Colors', 'ColorMode', 'TermOptions'
+  'TextStyle', 'Color', 'Colors', 'ColorMode', 'ColorDepth', 'TermOptions'
 ]
 
 TextStyle = Literal[
@@ -53,6 +53,14 @@ ColorMode = Literal[
   "background",
 ]
 
+# Colors supported by terminal: 24-bit RGB, 8-bit, 4-bit (base and bright colors) or none
+ColorDepth = Literal[
+  "truecolor",
+  "256",
+  "16",
+  "none",
+]
+
 # Settings Types
 
 
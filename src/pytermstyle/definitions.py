@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from .custom_types import TextStyle, Color, Colors
+from typing import get_args
+
+from .custom_types import TextStyle, Color, Colors, ColorMode, ColorDepth
 
 __all__ = [
   'BASE', 'RESET', 'FG_RGB_CODE', 'BG_RGB_CODE', 'FG_COLOR_CODE',
-  'BG_COLOR_CODE', 'textStyles', 'baseColors', 'extendedColors'
+  'BG_COLOR_CODE', 'COLOR_8BIT', 'COLOR_NAMED', 'COLOR_RGB',
+  'FG_8BIT_CODES', 'BG_8BIT_CODES', 'COLOR_MODES', 'COLOR_DEPTHS',
+  'textStyles', 'textStyleResets', 'styleMasks', 'baseColors', 'extendedColors', 'colorNames', 'colorCodes',
+  'baseColorCodes'
 ]
 
 BASE = "\033["
@@ -14,6 +19,18 @@ BG_RGB_CODE = ["48", "2"]
 FG_COLOR_CODE = ["38", "5"]
 BG_COLOR_CODE = ["48", "5"]
 
+# Escape sequence fragments for every 8-bit color code
+FG_8BIT_CODES = tuple(";".join(FG_COLOR_CODE + [str(code)]) for code in range(256))
+BG_8BIT_CODES = tuple(";".join(BG_COLOR_CODE + [str(code)]) for code in range(256))
+
+COLOR_MODES: frozenset[ColorMode] = frozenset(get_args(ColorMode))
+COLOR_DEPTHS: frozenset[ColorDepth] = frozenset(get_args(ColorDepth))
+
+# Flags of packed color values, see `formats.pack_color` / `formats.pack_rgb`
+COLOR_8BIT = 1 << 24
+COLOR_NAMED = 1 << 25
+COLOR_RGB = 1 << 26
+
 textStyles: dict[TextStyle, str] = {
   "bold": "1",
   "faint": "2",
@@ -28,6 +45,25 @@ textStyles: dict[TextStyle, str] = {
   "overlined": "53",
 }
 
+# Codes which turn off text styles, some of them turn off multiple styles at once
+textStyleResets: dict[TextStyle, str] = {
+  "bold": "22",
+  "faint": "22",
+  "italic": "23",
+  "underline": "24",
+  "slow_blink": "25",
+  "rapid_blink": "25",
+  "conceal": "28",
+  "strike": "29",
+  "framed": "54",
+  "encircled": "54",
+  "overlined": "55",
+}
+
+styleMasks: dict[TextStyle, int] = {
+  style: 1 << index for index, style in enumerate(textStyles)
+}
+
 baseColors: list[Color] = [
   "black",
   "red",
@@ -55,3 +91,15 @@ extendedColors: dict[Colors, str] = {
 }
 
 extendedColors.update({color: str(index) for index, color in enumerate(baseColors)})
+
+colorNames: dict[int, Colors] = {int(code): color for color, code in extendedColors.items()}
+
+# 8-bit code for every color name and every valid 8-bit code
+colorCodes: dict[str, str] = {str(code): str(code) for code in range(256)}
+colorCodes.update(extendedColors.items())
+
+# 4-bit codes of base colors for each color mode
+baseColorCodes: dict[ColorMode, dict[Color, str]] = {
+  "foreground": {color: str(30 + index) for index, color in enumerate(baseColors)},
+  "background": {color: str(40 + index) for index, color in enumerate(baseColors)},
+}
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+from .custom_types import ColorDepth, ColorMode, TextStyle
+from .definitions import BASE, FG_RGB_CODE, BG_RGB_CODE, FG_8BIT_CODES, BG_8BIT_CODES, COLOR_8BIT, COLOR_NAMED, COLOR_RGB
+from .definitions import textStyles, styleMasks, extendedColors, colorNames
+from .palette import rgb_to_256, rgb_to_16, color_256_to_16, get_16_color_code
+from .utils import get_8bit_color_code
+
+"""Compact representation of settings and its compilation into ANSI escape sequences."""
+
+__all__ = [
+  'FORMAT_CACHE_SIZE', 'build_format', 'merge_keys', 'format_cache_info', 'clear_format_cache',
+  'color_code', 'pack_styles', 'unpack_styles', 'pack_color', 'pack_rgb', 'unpack_color', 'unpack_rgb'
+]
+
+FORMAT_CACHE_SIZE = 1024
+
+# Packed color, 0 if color is not set
+ColorKey = int
+# Bitmask of text styles, packed foreground and packed background color
+SettingsKey = Tuple[int, ColorKey, ColorKey]
+
+
+def pack_styles(styles: Iterable[TextStyle]) -> int:
+  """
+  Returns bitmask of text styles (See `definitions.styleMasks`)
+  """
+  mask = 0
+  for style in styles:
+    mask |= styleMasks[style]
+
+  return mask
+
+
+def unpack_styles(mask: int) -> list[TextStyle]:
+  return [style for style, bit in styleMasks.items() if mask & bit]
+
+
+def pack_color(color: str) -> ColorKey:
+  """
+  Packs color name or 8-bit color code into integer
+  """
+  code = get_8bit_color_code(color)
+  if code is None:
+    raise ValueError(f"Color {color} is not supported")
+
+  return COLOR_8BIT | (COLOR_NAMED if color in extendedColors else 0) | int(code)
+
+
+def pack_rgb(rgb: Iterable) -> ColorKey:
+  """
+  Packs RGB values into integer
+  """
+  r, g, b = (int(value) for value in rgb)
+
+  return COLOR_RGB | (r << 16) | (g << 8) | b
+
+
+def unpack_color(packed: ColorKey) -> Optional[str]:
+  if not packed & COLOR_8BIT:
+    return None
+
+  code = packed & 0xFF
+
+  return colorNames[code] if packed & COLOR_NAMED else str(code)
+
+
+def unpack_rgb(packed: ColorKey) -> Optional[list[str]]:
+  if not packed & COLOR_RGB:
+    return None
+
+  return [str((packed >> 16) & 0xFF), str((packed >> 8) & 0xFF), str(packed & 0xFF)]
+
+
+def color_code(packed: ColorKey, mode: ColorMode, depth: ColorDepth = "truecolor") -> Optional[str]:
+  """
+  Returns escape sequence fragment of packed color, converted to `depth`
+  """
+  if packed & COLOR_RGB:
+    if depth == "truecolor":
+      rgb_code = FG_RGB_CODE if mode == "foreground" else BG_RGB_CODE
+      return ";".join(rgb_code + unpack_rgb(packed))  # type: ignore
+
+    rgb = ((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF)
+    if depth == "16":
+      return get_16_color_code(rgb_to_16(*rgb), mode)
+
+    packed = COLOR_8BIT | rgb_to_256(*rgb)
+
+  if packed & COLOR_8BIT:
+    if depth == "16":
+      return get_16_color_code(color_256_to_16(packed & 0xFF), mode)
+
+    return (FG_8BIT_CODES if mode == "foreground" else BG_8BIT_CODES)[packed & 0xFF]
+
+  return None
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def build_format(key: SettingsKey, depth: ColorDepth = "truecolor") -> str:
+  """
+  Returns escape sequence which starts styled output for given settings key\n
+  (See `TermSettings.key`). Results are kept in process-wide LRU cache.
+
+  Colors are converted to the nearest colors available with `depth`\n
+  (See `capabilities.ColorSupport.depth`). No sequence is produced for "none" depth.
+  """
+  if depth == "none":
+    return ""
+
+  styles, foreground, background = key
+
+  fmt = ";".join([
+    code for code in [
+      ";".join([textStyles[style] for style in unpack_styles(styles)]),
+      color_code(foreground, "foreground", depth),
+      color_code(background, "background", depth),
+    ] if code
+  ])
+
+  return f"{BASE}{fmt}m" if fmt else ""
+
+
+def merge_keys(first: SettingsKey, second: SettingsKey) -> SettingsKey:
+  """
+  Returns key with styles of both keys, where colors of `second` take precedence
+  """
+  return (
+    first[0] | second[0],
+    second[1] or first[1],
+    second[2] or first[2],
+  )
+
+
+def format_cache_info():
+  """
+  Returns hit / miss statistics of escape sequence cache
+  """
+  return build_format.cache_info()
+
+
+def clear_format_cache():
+  """
+  Removes every compiled escape sequence from the cache and resets statistics
+  """
+  build_format.cache_clear()
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import sys
+
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Sequence
+
+from .custom_types import ColorDepth, ColorMode
+from .definitions import BASE, RESET, COLOR_RGB
+from .formats import ColorKey, color_code
+from .palette import QUANTIZE_CACHE_SIZE
+
+"""Per-character coloring of text, e.g. gradients, progress bars and heatmaps."""
+
+__all__ = [
+  'interpolate_rgb', 'pack_rgb_array', 'render_colored'
+]
+
+# Smaller inputs are processed faster without NumPy
+NUMPY_MIN_SIZE = 1024
+
+RGBLike = Sequence[int]
+
+
+@lru_cache(maxsize=None)
+def _import_numpy() -> Any:
+  # NumPy is optional, and imported only once it is needed
+  try:
+    import numpy  # type: ignore[import-not-found]
+  except ImportError:
+    return None
+
+  return numpy
+
+
+def _numpy(colors: Any, size: int) -> Any:
+  numpy = sys.modules.get("numpy")
+  if numpy is not None and isinstance(colors, numpy.ndarray):
+    return numpy
+
+  return _import_numpy() if size >= NUMPY_MIN_SIZE else None
+
+
+def interpolate_rgb(start: RGBLike, end: RGBLike, count: int) -> list[ColorKey]:
+  """
+  Returns `count` packed RGB colors linearly interpolated from `start` to `end` (inclusive)
+  """
+  if count <= 0:
+    return []
+
+  if count == 1:
+    return pack_rgb_array([start])
+
+  numpy = _numpy(None, count)
+  if numpy is not None:
+    colors = numpy.linspace(numpy.asarray(start, dtype=float), numpy.asarray(end, dtype=float), count)
+    return pack_rgb_array(numpy.rint(colors).astype(numpy.int64))
+
+  # Validates both colors
+  pack_rgb_array([start, end])
+
+  r0, g0, b0 = start
+  dr, dg, db = (end[0] - r0) / (count - 1), (end[1] - g0) / (count - 1), (end[2] - b0) / (count - 1)
+
+  return [
+    COLOR_RGB | (round(r0 + dr * i) << 16) | (round(g0 + dg * i) << 8) | round(b0 + db * i)
+    for i in range(count)
+  ]
+
+
+def pack_rgb_array(colors: Any) -> list[ColorKey]:
+  """
+  Validates and packs RGB colors (sequence of `(r, g, b)` values or NumPy array of shape (n, 3))\n
+  in a single pass. Raises `ValueError` if any value is not 0 <= color <= 255.
+  """
+  numpy = _numpy(colors, len(colors))
+  if numpy is not None:
+    array = numpy.asarray(colors)
+    if array.size == 0:
+      return []
+
+    if array.ndim != 2 or array.shape[1] != 3:
+      raise ValueError("Colors must be provided in format: [[r, g, b], ...]")
+
+    if array.dtype.kind not in "iu" or array.min() < 0 or array.max() > 255:
+      raise ValueError("Provided values for RGB must be 0 <= color <= 255")
+
+    array = array.astype(numpy.int64)
+    return (COLOR_RGB | (array[:, 0] << 16) | (array[:, 1] << 8) | array[:, 2]).tolist()
+
+  packed = []
+  for rgb in colors:
+    if len(rgb) != 3:
+      raise ValueError("Colors must be provided in format: [[r, g, b], ...]")
+
+    r, g, b = rgb
+    if not (isinstance(r, int) and isinstance(g, int) and isinstance(b, int)) \
+       or not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+      raise ValueError("Provided values for RGB must be 0 <= color <= 255")
+
+    packed.append(COLOR_RGB | (r << 16) | (g << 8) | b)
+
+  return packed
+
+
+@lru_cache(maxsize=QUANTIZE_CACHE_SIZE)
+def _color_sequence(packed: ColorKey, mode: ColorMode, depth: ColorDepth) -> str:
+  return f"{BASE}{color_code(packed, mode, depth)}m"
+
+
+def render_colored(
+  text: str,
+  colors: Iterable[ColorKey],
+  mode: ColorMode = "foreground",
+  depth: ColorDepth = "truecolor",
+  base_codes: Optional[str] = None
+) -> str:
+  """
+  Returns `text` where every character has the packed color at the same position in `colors`\n
+  (which must have the same length as `text`).
+
+  Consecutive characters which end up with the same color after conversion to `depth`\n
+  share a single escape sequence. `base_codes` (e.g. text styles) are written once, at the start.
+  """
+  if not text or depth == "none":
+    return text
+
+  parts = [f"{BASE}{base_codes}m"] if base_codes else []
+  previous = None
+  run_code = None
+  run_start = 0
+
+  for index, packed in enumerate(colors):
+    if packed == previous:
+      continue
+
+    previous = packed
+    code = _color_sequence(packed, mode, depth)
+
+    if code != run_code:
+      if index:
+        parts.append(text[run_start:index])
+
+      parts.append(code)
+      run_code, run_start = code, index
+
+  parts.append(text[run_start:])
+  parts.append(RESET)
+
+  return "".join(parts)
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import copy
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+
+from typing import Any, Literal, Optional
+
+from .logger import TermStyleFormatter
+
+"""Logging handlers which move coloring and output away from the calling thread."""
+
+__all__ = [
+  'TermStyleQueueHandler', 'TermStyleQueueListener'
+]
+
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 256
+
+_Policy = Literal["block", "drop"]
+
+
+class TermStyleQueueListener(logging.handlers.QueueListener):
+  """
+  Listener which takes log records from the queue in background thread,\n
+  formats them with formatter of `handler` and writes them to its stream in batches\n
+  of at most `batch_size` records, with a single write per batch.
+  """
+  def __init__(self, queue_: queue.Queue, handler: TermStyleQueueHandler, batch_size: int = DEFAULT_BATCH_SIZE):
+    super().__init__(queue_)
+    self._handler = handler
+    self._batch_size = batch_size
+    self._thread: Optional[threading.Thread] = None
+
+  def start(self):
+    if self._thread is not None:
+      raise RuntimeError("Listener already started")
+
+    self._thread = threading.Thread(target=self._drain, name="pytermstyle-log-writer", daemon=True)
+    self._thread.start()
+
+  def enqueue_sentinel(self):
+    # Sentinel must not be dropped when queue is full
+    self.queue.put(self._sentinel)
+
+  def _drain(self):
+    records_queue = self.queue
+
+    while True:
+      batch = [records_queue.get()]
+
+      while len(batch) < self._batch_size:
+        try:
+          batch.append(records_queue.get_nowait())
+        except queue.Empty:
+          break
+
+      stop = any(record is self._sentinel for record in batch)
+
+      self._handler.write_batch([record for record in batch if record is not self._sentinel])
+
+      for _ in batch:
+        records_queue.task_done()
+
+      if stop:
+        break
+
+
+class TermStyleQueueHandler(logging.handlers.QueueHandler):
+  """
+  Handler which puts log records to a bounded queue, and leaves formatting\n
+  and writing to `stream` (standard error by default) to a background thread.
+
+  Records are formatted with `TermStyleFormatter` unless other formatter is set.
+
+  `policy` defines behavior when queue already holds `maxsize` records:
+   * "block" - Logging call waits until there is space in the queue,\n
+     or at most `timeout` seconds if provided, after which record is dropped
+   * "drop" - Record is dropped immediately
+
+  Number of dropped records and depth of the queue are available as\n
+  `dropped`, `queue_depth` and `max_queue_depth` attributes.
+  """
+  def __init__(
+    self,
+    stream: Any = None,
+    *,
+    maxsize: int = DEFAULT_QUEUE_SIZE,
+    policy: _Policy = "block",
+    timeout: Optional[float] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    formatter: Optional[logging.Formatter] = None,
+    start: bool = True
+  ):
+    if policy not in ("block", "drop"):
+      raise ValueError(f"Queue policy {policy} is not supported")
+
+    if maxsize < 1 or batch_size < 1:
+      raise ValueError("maxsize and batch_size must be positive numbers")
+
+    self.queue: queue.Queue = queue.Queue(maxsize)
+    super().__init__(self.queue)
+
+    self.stream = stream if stream is not None else sys.stderr
+    self.terminator = "\n"
+    self.setFormatter(formatter if formatter else TermStyleFormatter())
+
+    self._policy = policy
+    self._timeout = timeout
+    self._metrics_lock = threading.Lock()
+    self.dropped = 0
+    self.max_queue_depth = 0
+
+    self.listener = TermStyleQueueListener(self.queue, self, batch_size)
+    if start:
+      self.start()
+
+  @property
+  def queue_depth(self) -> int:
+    return self.queue.qsize()
+
+  def start(self):
+    self.listener.start()
+
+  def stop(self):
+    """
+    Waits until every queued record is written and stops background thread
+    """
+    if self.listener._thread is not None:
+      self.listener.stop()
+
+  def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+    # Message is merged with arguments on calling thread, since arguments could be changed
+    # before record is handled. Formatting with colors is left to background thread.
+    record = copy.copy(record)
+    record.msg = record.getMessage()
+    record.args = None
+
+    return record
+
+  def enqueue(self, record: logging.LogRecord):
+    try:
+      if self._policy == "drop":
+        self.queue.put_nowait(record)
+      else:
+        self.queue.put(record, timeout=self._timeout)
+    except queue.Full:
+      with self._metrics_lock:
+        self.dropped += 1
+
+      return
+
+    depth = self.queue.qsize()
+    if depth > self.max_queue_depth:
+      self.max_queue_depth = depth
+
+  def write_batch(self, records: list[logging.LogRecord]):
+    """
+    Formats records and writes them to the stream with a single write
+    """
+    lines = []
+    for record in records:
+      try:
+        lines.append(self.format(record) + self.terminator)
+      except Exception:
+        self.handleError(record)
+
+    if not lines:
+      return
+
+    try:
+      self.stream.write("".join(lines))
+      self.stream.flush()
+    except Exception:
+      self.handleError(records[-1])
+
+  def close(self):
+    self.stop()
+    super().close()
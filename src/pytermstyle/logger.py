@@ -1,9 +1,16 @@
+from __future__ import annotations
+
 import logging
 
-from typing import Literal, Optional
+from typing import Any, Literal, Mapping, Optional, Tuple
 
+from .capabilities import color_support
+from .custom_types import ColorDepth
 from .definitions import RESET
+from .formats import SettingsKey, build_format
 from .pytermstyle import TermStyle
+from .settings import TermConfigException, TermSettings
+from .theme import StyleLike, Theme
 
 __all__ = [
   'TermStyleRecord', 'TermStyleFormatter', 'basicConfig'
@@ -15,13 +22,23 @@ DEFAULT_SETTINGS = {
   "WARNING": {"foreground": {"color": "yellow"}},
   "ERROR": {"foreground": {"color": "red"}},
   "CRITICAL": {
-    "styles": ["bold"],
+    "style": ["bold"],
     "foreground": {"color": "red"}
   },
 }
 
+SETTINGS_KEYS = frozenset(["style", "foreground", "background"])
+
 _Style = Literal["%", "{", "$"]
 
+# colorStart and colorEnd of logging level
+LevelColors = Tuple[str, str]
+
+NO_COLORS: LevelColors = ("", "")
+
+# Names of colored regions which are provided by formatter
+RESERVED_REGIONS = frozenset(["colorStart", "colorEnd", "levelColor", "reset"])
+
 BASE_STYLES = {
   '%': "%(colorStart)s%(levelname)s:%(name)s:%(colorEnd)s%(message)s",
   '{': '{colorStart}{levelname}:{name}:{colorEnd}{message}',
@@ -29,17 +46,56 @@ BASE_STYLES = {
 }
 
 
+def _level_names() -> dict[str, int]:
+  mapping = getattr(logging, "getLevelNamesMapping", None)
+  if mapping is not None:
+    return mapping()
+
+  # Python < 3.11
+  return dict(logging._nameToLevel)  # type: ignore
+
+
 class TermStyleRecord:
-  def __init__(self, record: logging.LogRecord, term_style: TermStyle) -> None:
+  def __init__(
+    self,
+    record: logging.LogRecord,
+    term_style: Optional[TermStyle] = None,
+    *,
+    colors: Optional[LevelColors] = None
+  ) -> None:
     self.__dict__.update(record.__dict__)
-    self.colorStart = self.get_level_color(term_style)
-    self.colorEnd = RESET if self.colorStart else ""
+
+    if colors is None:
+      start = self.get_level_color(term_style) if term_style else ""
+      colors = (start, RESET if start else "")
+
+    self.colorStart, self.colorEnd = colors
 
   def get_level_color(self, term_style: TermStyle):
-    if term_style._no_color():
+    depth = color_support.depth()
+    if depth == "none":
       return ""
 
-    return term_style.get_base_format()
+    return term_style.get_base_format(depth)
+
+
+class _RecordFields(dict):
+  """
+  Values of colored regions, which fall back to attributes of the log record and format defaults
+  """
+  __slots__ = ("attributes", "defaults")
+
+  attributes: Mapping[str, Any]
+  defaults: Optional[Mapping[str, Any]]
+
+  def __missing__(self, name: str) -> Any:
+    try:
+      return self.attributes[name]
+    except KeyError:
+      if self.defaults and name in self.defaults:
+        return self.defaults[name]
+
+      raise
 
 
 class TermStyleFormatter(logging.Formatter):
@@ -53,7 +109,14 @@ class TermStyleFormatter(logging.Formatter):
 
   e.g. `"{ INFO": { "foreground": { "color": "green" } } }`
 
-  Logging Levels not specified in custom settings will use predefined default settings.
+  Logging Levels not specified in custom settings will use predefined default settings.\n
+  Level can be a level name, including custom levels registered with `logging.addLevelName`\n
+  before formatter is created, or a level number.
+
+  `TermConfigException` exception will be thrown if level is unknown or its settings are not valid.
+
+  Escape sequences of every logging level are compiled once, so coloring a record\n
+  takes a single table lookup.
 
   ---
 
@@ -61,6 +124,26 @@ class TermStyleFormatter(logging.Formatter):
   portion in format with `colorStart` and `colorEnd` attributes.
 
   e.g. `%(colorStart)s%(levelname)s:%(name)s:%(colorEnd)s%(message)s`
+
+  ---
+
+  Format can contain any number of additional colored regions, defined with `regions`\n
+  as a mapping of region name to style, which can be `style.Style`, settings or style specification\n
+  (See `Style.parse`). Region name is used in format to start the region, and `reset` ends any region.\n
+  `levelColor` is the same as `colorStart`.
+
+  e.g. `TermStyleFormatter(\n
+    "%(levelColor)s%(levelname)s%(reset)s %(dim)s%(asctime)s%(reset)s %(message)s",\n
+    regions={"dim": "faint"}\n
+  )`
+
+  Styles of regions are compiled once, and their values are looked up together with attributes\n
+  of the log record, without a copy of the record.
+
+  ---
+
+  If `fast` is True, `colorStart` and `colorEnd` are set directly on the log record instead.\n
+  Values of regions are never set on the record, so they don't appear in output of other handlers.
   """
   def __init__(
     self,
@@ -69,6 +152,8 @@ class TermStyleFormatter(logging.Formatter):
     style: _Style = "%",
     *args,
     settings=None,
+    regions: Optional[Mapping[str, StyleLike]] = None,
+    fast: bool = False,
     **kwargs
   ):
     if not fmt:
@@ -77,17 +162,131 @@ class TermStyleFormatter(logging.Formatter):
     super().__init__(fmt, datefmt, style, *args, **kwargs)
 
     self._stg = settings if settings else DEFAULT_SETTINGS
-    self._term_styles = {
-      level: TermStyle(stg) for level, stg in self._stg.items()  # type: ignore
-    }
+    self._level_keys = self._compile_settings(DEFAULT_SETTINGS)
+    self._level_keys.update(self._compile_settings(self._stg))
+
+    reserved = RESERVED_REGIONS.intersection(regions or {})
+    if reserved:
+      raise TermConfigException("Reserved region names: {}".format(", ".join(sorted(reserved))))
+
+    self._regions = Theme(regions)
+    # Formats which refer to regions are formatted with looked up fields, even in fast mode
+    self._uses_regions = any(name in self._style._fmt for name in [*self._regions, "levelColor", "reset"])
+
+    self._fast = fast
+    # Colors of every logging level and values of regions, for each color depth in use
+    self._tables: dict[ColorDepth, Tuple[dict[int, LevelColors], dict[str, str]]] = {}
+    self._current = ("none", self._build_level_colors("none"), self._build_region_values("none"))
+
+  @staticmethod
+  def _compile_settings(settings: dict) -> dict[int, SettingsKey]:
+    level_names = _level_names()
+    level_keys = {}
+
+    for level, level_settings in settings.items():
+      levelno = level if isinstance(level, int) else level_names.get(level)
+      if levelno is None:
+        raise TermConfigException(f"Unknown logging level: {level}")
+
+      if not isinstance(level_settings, dict):
+        raise TermConfigException(f"Settings of logging level {level} must be a dictionary")
+
+      unknown = set(level_settings).difference(SETTINGS_KEYS)
+      if unknown:
+        raise TermConfigException(
+          "Invalid settings of logging level {}: {}".format(level, ", ".join(sorted(unknown)))
+        )
+
+      level_keys[levelno] = TermSettings.compile(level_settings).key()
+
+    return level_keys
+
+  def _build_level_colors(self, depth: ColorDepth) -> dict[int, LevelColors]:
+    level_colors = {levelno: NO_COLORS for levelno in _level_names().values()}
+
+    for levelno, key in self._level_keys.items():
+      start = build_format(key, depth)
+      level_colors[levelno] = (start, RESET if start else "")
+
+    return level_colors
+
+  def _build_region_values(self, depth: ColorDepth) -> dict[str, str]:
+    if depth == "none":
+      return {name: "" for name in [*self._regions, "reset"]}
+
+    region_values = {name: self._regions[name].format(depth) for name in self._regions}
+    region_values["reset"] = RESET
+
+    return region_values
+
+  def _get_tables(self) -> Tuple[dict[int, LevelColors], dict[str, str]]:
+    depth = color_support.depth()
+
+    current_depth, level_colors, region_values = self._current
+    if depth != current_depth:
+      tables = self._tables.get(depth)
+      if tables is None:
+        tables = self._tables[depth] = (self._build_level_colors(depth), self._build_region_values(depth))
+
+      level_colors, region_values = tables
+      self._current = (depth, level_colors, region_values)
+
+    return level_colors, region_values
+
+  @staticmethod
+  def _lookup_colors(level_colors: dict[int, LevelColors], levelno: int) -> LevelColors:
+    colors = level_colors.get(levelno)
+    if colors is None:
+      # Level was registered after formatter was created, or is not registered at all
+      colors = level_colors[levelno] = NO_COLORS
+
+    return colors
+
+  def get_level_colors(self, levelno: int) -> LevelColors:
+    """
+    Returns `colorStart` and `colorEnd` of logging level for standard output
+    """
+    level_colors, _ = self._get_tables()
+
+    return self._lookup_colors(level_colors, levelno)
+
+  def get_region_values(self) -> dict[str, str]:
+    """
+    Returns escape sequences of colored regions for standard output
+    """
+    _, region_values = self._get_tables()
+
+    return dict(region_values)
 
   def formatMessage(self, record: logging.LogRecord) -> str:
-    custom_style = self._term_styles.get(record.levelname)
-    term_style = custom_style \
-        if custom_style \
-        else TermStyle(DEFAULT_SETTINGS[record.levelname])  # type: ignore
+    level_colors, region_values = self._get_tables()
+    colors = self._lookup_colors(level_colors, record.levelno)
+
+    if self._fast and not self._uses_regions:
+      record.colorStart, record.colorEnd = colors
+      return super().formatMessage(record)
+
+    fields = _RecordFields(region_values)
+    fields["colorStart"], fields["colorEnd"] = colors
+    fields["levelColor"] = colors[0]
+    fields.attributes = record.__dict__
+    fields.defaults = getattr(self._style, "_defaults", None)
+
+    return self._format_fields(fields)
+
+  def _format_fields(self, fields: _RecordFields) -> str:
+    style = self._style
 
-    return super().formatMessage(TermStyleRecord(record, term_style))  # type: ignore
+    try:
+      if isinstance(style, logging.StringTemplateStyle):
+        return style._tpl.substitute(fields)
+
+      if isinstance(style, logging.StrFormatStyle):
+        return style._fmt.format_map(fields)  # type: ignore
+
+      return style._fmt % fields  # type: ignore
+    except KeyError as error:
+      raise ValueError(f"Formatting field not found in record: {error}") from None
 
 
 def basicConfig(
@@ -95,6 +294,8 @@ def basicConfig(
   style: _Style = "%",
   datefmt: Optional[str] = None,
   settings=None,
+  fast: bool = False,
+  regions: Optional[Mapping[str, StyleLike]] = None,
   **kwargs
 ):
   """
@@ -113,12 +314,22 @@ def basicConfig(
   e.g. `"{ INFO": { "foreground": { "color": "green" } } }`
 
   Logging Levels not specified in custom settings will use predefined default settings.
+
+  ---
+
+  `fast` - Use precomputed colors which are set directly on log records (See `TermStyleFormatter`)
+
+  ---
+
+  `regions` - Styles of additional colored regions in format (See `TermStyleFormatter`)
   """
   formatter = TermStyleFormatter(
     format,
     datefmt,
     style,
-    settings=settings
+    settings=settings,
+    regions=regions,
+    fast=fast
   )
 
   logging.basicConfig(**kwargs)
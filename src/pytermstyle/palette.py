@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Tuple
+
+from .custom_types import ColorMode
+from .definitions import baseColors
+from .utils import get_4bit_color_code
+
+"""Conversion of colors to palettes of terminals with limited color depth."""
+
+__all__ = [
+  'QUANTIZE_CACHE_SIZE', 'PALETTE_16', 'PALETTE_256', 'color_distance',
+  'rgb_to_256', 'rgb_to_16', 'color_256_to_16', 'get_16_color_code'
+]
+
+QUANTIZE_CACHE_SIZE = 4096
+
+RGB = Tuple[int, int, int]
+
+# Default xterm values of base colors (0 - 7) and their bright variants (8 - 15)
+PALETTE_16: tuple[RGB, ...] = (
+  (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0),
+  (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+  (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+  (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+)
+
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+PALETTE_256: tuple[RGB, ...] = (
+  *PALETTE_16,
+  *((_CUBE_LEVELS[r], _CUBE_LEVELS[g], _CUBE_LEVELS[b]) for r in range(6) for g in range(6) for b in range(6)),
+  *((8 + 10 * gray,) * 3 for gray in range(24)),
+)
+
+
+def color_distance(first: RGB, second: RGB) -> int:
+  """
+  Returns weighted ("redmean") squared distance of two colors, approximating perceived difference
+  """
+  r_mean = (first[0] + second[0]) // 2
+  r, g, b = first[0] - second[0], first[1] - second[1], first[2] - second[2]
+
+  return (((512 + r_mean) * r * r) >> 8) + 4 * g * g + (((767 - r_mean) * b * b) >> 8)
+
+
+def _cube_index(value: int) -> int:
+  if value < 48:
+    return 0
+
+  if value < 115:
+    return 1
+
+  return (value - 35) // 40
+
+
+@lru_cache(maxsize=QUANTIZE_CACHE_SIZE)
+def rgb_to_256(r: int, g: int, b: int) -> int:
+  """
+  Returns 8-bit code of the color cube (16 - 231) or grayscale (232 - 255) entry nearest to RGB color.\n
+  Codes 0 - 15 are not used, since they are often redefined by terminal themes.
+  """
+  cube = 16 + 36 * _cube_index(r) + 6 * _cube_index(g) + _cube_index(b)
+  gray = 232 + min(max((r + g + b) // 3 - 3, 0) // 10, 23)
+
+  rgb = (r, g, b)
+  if color_distance(rgb, PALETTE_256[gray]) < color_distance(rgb, PALETTE_256[cube]):
+    return gray
+
+  return cube
+
+
+@lru_cache(maxsize=QUANTIZE_CACHE_SIZE)
+def rgb_to_16(r: int, g: int, b: int) -> int:
+  """
+  Returns index (0 - 15) of base color or bright base color nearest to RGB color
+  """
+  rgb = (r, g, b)
+
+  return min(range(16), key=lambda index: color_distance(rgb, PALETTE_16[index]))
+
+
+@lru_cache(maxsize=256)
+def color_256_to_16(code: int) -> int:
+  """
+  Returns index (0 - 15) of base color or bright base color nearest to 8-bit color
+  """
+  if code < 16:
+    return code
+
+  return rgb_to_16(*PALETTE_256[code])
+
+
+def get_16_color_code(index: int, mode: ColorMode) -> str:
+  """
+  Returns the 4-bit code of base color (0 - 7) or its bright variant (8 - 15)
+  """
+  code = get_4bit_color_code(baseColors[index % 8], mode)
+
+  return str(int(code) + 60) if index >= 8 else code
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
-import os
+import itertools
 import sys
-from typing import Any, Optional
 
-from .custom_types import TextStyle, ColorMode, Color, Colors
-from .definitions import BASE, RESET, FG_RGB_CODE, BG_RGB_CODE, FG_COLOR_CODE, BG_COLOR_CODE, textStyles
+from contextvars import ContextVar
+from typing import Any, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from .capabilities import color_support
+from .custom_types import TextStyle, ColorMode, ColorDepth, Colors
+from .definitions import BASE, RESET
+from .formats import build_format
+from .gradient import interpolate_rgb, pack_rgb_array, render_colored
 from .settings import TermSettings, Settings
-from .utils import is_rgb_valid, get_8bit_color_code, is_valid_color
+from .templates import compile_markup
+from .sink import OutputSink
+from .spans import Span, render_spans
+from .style import Style
+from .utils import is_rgb_valid, is_valid_color, check_invalid_mode
 
 """ANSI color formatting for output in terminal."""
 
@@ -17,6 +26,20 @@ __all__ = [
 ]
 
 
+DEFAULT_CHUNK_SIZE = 1024
+MAX_CACHED_SETTINGS = 256
+
+StyleSettings = Union[Settings, TermSettings, Style]
+BatchItem = Union[str, Tuple[str, Optional[StyleSettings]]]
+
+# Styles selected by chaining methods, by id of logger.
+# Single variable is shared by all loggers, since a context keeps every variable ever set in it
+_overrides: ContextVar[dict[int, TermSettings]] = ContextVar("pytermstyle_overrides", default={})
+
+# Ids of loggers are never reused, unlike `id()` of collected loggers
+_logger_ids = itertools.count()
+
+
 class ColorException(Exception):
   pass
 
@@ -75,104 +98,265 @@ class TermStyle:
   If a user calls methods for styling / color directly, they will override any existing settings\n
   Once logger outputs text with overridden styling / color, \n
   it will return to configured settings as a default behavior
+
+  ---
+
+  Output is written to standard output by default, unless `sink` is provided.\n
+  Sink can be `sink.OutputSink` or any target accepted by it (stream or callable).
+
+  ---
+
+  Styles selected by chaining methods are stored per thread and per asyncio task,\n
+  so a single logger can be shared between threads / tasks.
   """
-  def __init__(self, settings: Optional[Settings] = None) -> None:
-    self._default_settings = TermSettings(settings)
-    self._override_settings = TermSettings()
+  def __init__(self, settings: Optional[Union[Settings, TermSettings]] = None, *, sink: Any = None) -> None:
+    self._default_settings = TermSettings.compile(settings)
+    self._id = next(_logger_ids)
+    self._sink: Optional[OutputSink] = None
 
-  def configure(self, settings: Optional[Settings] = None):
+    self.set_sink(sink)
+
+  def configure(self, settings: Optional[Union[Settings, TermSettings]] = None):
     """
-    Used to configure new settings for logger
+    Used to configure new settings for logger.\n
+    Settings are compiled (See `TermSettings.compile`), and compiled settings are shared without copying.
     """
-    self._default_settings = TermSettings(settings)
+    self._default_settings = TermSettings.compile(settings)
 
-  def add_style(self, style: TextStyle):
-    self._override_settings.add_style(style)
+  def set_sink(self, sink: Any = None):
+    """
+    Used to configure output sink for logger. Passing `None` restores output to standard output.\n
+    Output buffered by previous sink is flushed.
+    """
+    if self._sink is not None:
+      self._sink.flush()
 
-  def add_color(self, color: Color, mode: ColorMode):
-    self._override_settings.add_color(color, mode)
+    if sink is not None and not isinstance(sink, OutputSink):
+      sink = OutputSink(sink)
 
-  def _set_color_code(self, settings: TermSettings, mode: ColorMode) -> Optional[str]:
-    rgb = settings.rgb(mode)
-    if rgb:
-      rgb_code = FG_RGB_CODE if mode == "foreground" else BG_RGB_CODE
-      return ";".join(rgb_code + list(map(str, rgb)))
+    self._sink = sink
 
-    color = settings.color(mode)
-    if color:
-      base_code = FG_COLOR_CODE if mode == "foreground" else BG_COLOR_CODE
-      color_code = get_8bit_color_code(color)
+  @property
+  def sink(self) -> Optional[OutputSink]:
+    return self._sink
 
-      if color_code:
-        return ";".join(base_code + [color_code])
+  def flush(self):
+    """
+    Writes any output buffered by the sink
+    """
+    if self._sink is not None:
+      self._sink.flush()
 
-    return None
+  def _stream(self, file: Any = None) -> Any:
+    return file if file is not None else self._sink
 
-  def _no_color(self) -> bool:
+  def add_style(self, style: TextStyle):
+    settings = self._copy_override()
+    settings.add_style(style)
+    self._set_override(settings)
+
+  def add_color(self, color: Colors, mode: ColorMode):
+    settings = self._copy_override()
+    settings.add_color(color, mode)
+    self._set_override(settings)
+
+  def add_rgb(self, rgb: list[str], mode: ColorMode):
+    settings = self._copy_override()
+    settings.add_rgb(rgb, mode)
+    self._set_override(settings)
+
+  def _get_override(self) -> Optional[TermSettings]:
+    return _overrides.get().get(self._id)
+
+  def _set_override(self, settings: TermSettings):
+    # Mapping is never modified in place, since it can be shared with copied contexts
+    overrides = dict(_overrides.get())
+    overrides[self._id] = settings
+    _overrides.set(overrides)
+
+  def _copy_override(self) -> TermSettings:
+    # Settings are never modified in place, since they can be shared with copied contexts
+    settings = self._get_override()
+
+    return settings.copy() if settings is not None else TermSettings()
+
+  def _clear_override(self):
+    overrides = _overrides.get()
+    if self._id in overrides:
+      overrides = dict(overrides)
+      del overrides[self._id]
+      _overrides.set(overrides)
+
+  def _no_color(self, stream: Any = None) -> bool:
     """
     Support for NO_COLOR mode that can be controlled by environment variables\n
-    If one of the following variables exists, or if standard output is not terminal,\n
+    If one of the following variables exists, or if output stream is not terminal,\n
     logger will strip any ANSI color codes from the output and behave as regular `print function`:
      * NO_COLOR
      * ANSI_COLORS_DISABLED
      * TERM = "dumb"
 
     If FORCE_COLOR environment variable exists, logger will attempt colored output.
+
+    Result is resolved once per output stream (See `capabilities.ColorSupport`).
     """
-    disable_env = [
-      "NO_COLOR",
-      "ANSI_COLORS_DISABLED"
-    ]
+    return not color_support.enabled(stream)
 
-    if any(env_var in os.environ for env_var in disable_env):
-      return True
+  def get_base_format(self, depth: ColorDepth = "truecolor"):
+    """
+    Returns escape sequence of current settings, with colors converted to `depth`
+    """
+    settings = self._get_override()
+    if settings is None or not settings.has_settings():
+      settings = self._default_settings
 
-    if "FORCE_COLOR" in os.environ:
-      return False
+    return build_format(settings.key(), depth)
 
-    if os.environ.get("TERM") == "dumb":
-      return True
+  def render(self, text: Optional[str], clear: bool = True, file: Any = None) -> str:
+    """
+    Returns text surrounded with escape sequences of current settings, without printing it.\n
+    Escape sequences are omitted in NO_COLOR mode for `file` (logger output by default).
 
-    return not sys.stdout.isatty()
+    Can be used at the end of the chain as well:
 
-  def get_base_format(self):
-    settings = self._override_settings \
-      if self._override_settings.has_settings() \
-      else self._default_settings
+    e.g. `logger.bold().fg_red().render("Colored Text")`
+    """
+    fmt_text = text or ""
 
-    styles = ";".join([textStyles[style] for style in settings.styles()])
-    foreground = self._set_color_code(settings, "foreground")
-    background = self._set_color_code(settings, "background")
+    depth = color_support.depth(self._stream(file)) if fmt_text else "none"
+    if depth != "none":
+      fmt = self.get_base_format(depth)
 
-    fmt = ";".join([style for style in [styles, foreground, background] if style])
+      if fmt:
+        fmt_text = f"{fmt}{fmt_text}{RESET}"
 
-    return f"{BASE}{fmt}m" if fmt else ""
+    if clear:
+      self._clear_override()
+
+    return fmt_text
 
   def print(self, text: Optional[str], clear: bool = True, **kwargs):
     if text:
-      fmt_text = text
+      if self._sink is not None and kwargs.get("file") is None:
+        self._sink.write(self.render(text, False) + kwargs.get("end", "\n"))
+
+        if kwargs.get("flush"):
+          self._sink.flush()
+      else:
+        print(self.render(text, False, kwargs.get("file")), **kwargs)
 
-      if not self._no_color():
-        fmt = self.get_base_format()
+    if clear:
+      self._clear_override()
 
-        fmt_text = "{fmt}{text}{reset}".format(
-          fmt=fmt,
-          text=text,
-          reset=RESET
-        ) if fmt else fmt_text
+    return self
 
-      print(fmt_text, **kwargs)
+  def render_many(
+    self,
+    items: Iterable[BatchItem],
+    settings: Optional[StyleSettings] = None,
+    *,
+    end: str = "\n",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    clear: bool = True,
+    file: Any = None
+  ) -> Iterator[str]:
+    """
+    Styles many texts at once and yields them joined in chunks of at most `chunk_size` texts.\n
+    Every item is either a text or a `(text, settings)` pair. Texts without their own settings\n
+    use `settings` if provided, or current settings of the logger otherwise.
+
+    Each distinct settings object is resolved only once, and `items` are consumed lazily,\n
+    so any iterable (e.g. generator) can be passed without loading it into memory.
+    """
+    if chunk_size < 1:
+      raise ValueError("chunk_size must be a positive number")
+
+    depth = color_support.depth(self._stream(file))
+    default_fmt = ""
+    if depth != "none":
+      default_fmt = self._resolve_format(settings, depth) if settings else self.get_base_format(depth)
 
     if clear:
-      self._override_settings.clear()
+      self._clear_override()
+
+    return self._render_chunks(iter(items), default_fmt, depth, end, chunk_size)
+
+  def print_many(
+    self,
+    items: Iterable[BatchItem],
+    settings: Optional[StyleSettings] = None,
+    *,
+    end: str = "\n",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    clear: bool = True,
+    file: Any = None,
+    flush: bool = False
+  ):
+    """
+    Outputs many styled texts with a single write per chunk (See `render_many`)
+    """
+    stream = self._stream(file)
+    if stream is None:
+      stream = sys.stdout
+
+    for chunk in self.render_many(items, settings, end=end, chunk_size=chunk_size, clear=clear, file=stream):
+      stream.write(chunk)
+
+    if flush:
+      stream.flush()
 
     return self
 
+  def _resolve_format(self, settings: StyleSettings, depth: ColorDepth) -> str:
+    if isinstance(settings, Style):
+      return settings.format(depth)
+
+    # Dictionary settings are validated once per distinct content
+    return build_format(TermSettings.compile(settings).key(), depth)
+
+  def _render_chunks(
+    self,
+    items: Iterator[BatchItem],
+    default_fmt: str,
+    depth: ColorDepth,
+    end: str,
+    chunk_size: int
+  ) -> Iterator[str]:
+    formats: dict = {}
+    chunk: list[str] = []
+
+    for item in items:
+      if isinstance(item, str):
+        text, fmt = item, default_fmt
+      else:
+        text, item_settings = item
+        fmt = default_fmt
+
+        if item_settings is not None and depth != "none":
+          # Settings object is kept alongside its format, so that its id can't be reused
+          cached = formats.get(id(item_settings))
+          if cached is None:
+            if len(formats) >= MAX_CACHED_SETTINGS:
+              formats.clear()
+
+            cached = formats[id(item_settings)] = (item_settings, self._resolve_format(item_settings, depth))
+
+          fmt = cached[1]
+
+      chunk.append(f"{fmt}{text}{RESET}{end}" if fmt and text else f"{text}{end}")
+
+      if len(chunk) >= chunk_size:
+        yield "".join(chunk)
+        chunk = []
+
+    if chunk:
+      yield "".join(chunk)
+
   def clear(self):
     """
     Can be used to clear any previously configured settings
     """
-    self._default_settings.clear()
+    self._default_settings = TermSettings.compile()
 
   def __call__(self, *args: Any, **kwds: Any) -> Any:
     if not args and not kwds:
@@ -223,14 +407,14 @@ class TermStyle:
     if not is_valid_color(color):
       raise ColorException("Invalid value for color: {}".format(color))
 
-    self._override_settings.add_color(color, "foreground")
+    self.add_color(color, "foreground")
     return self._output(text, clear, **kwargs)
 
   def bg_color(self, color: Colors, *, text: Optional[str] = None, clear: bool = True, **kwargs):
     if not is_valid_color(color):
       raise ColorException("Invalid value for color: {}".format(color))
 
-    self._override_settings.add_color(color, "background")
+    self.add_color(color, "background")
     return self._output(text, clear, **kwargs)
 
   """Public 16-bit RGB"""
@@ -240,7 +424,7 @@ class TermStyle:
     if not is_rgb_valid(rgb):
       raise ColorException("Provided values for RGB must be 0 <= color <= 255")
 
-    self._override_settings.add_rgb(rgb, "foreground")
+    self.add_rgb(rgb, "foreground")
     return self._output(text, clear, **kwargs)
 
   def bg_rgb(self, r: int, g: int, b: int, *, text: Optional[str] = None, clear: bool = True, **kwargs):
@@ -249,9 +433,114 @@ class TermStyle:
     if not is_rgb_valid(rgb):
       raise ColorException("Provided values for RGB must be 0 <= color <= 255")
 
-    self._override_settings.add_rgb(rgb, "background")
+    self.add_rgb(rgb, "background")
     return self._output(text, clear, **kwargs)
 
+  def render_spans(self, spans: Iterable[Span], *, clear: bool = True, file: Any = None) -> str:
+    """
+    Returns joined `(text, style)` spans, writing only the changes between styles of adjacent spans\n
+    instead of full escape sequence and reset for every span (See `spans.render_spans`).\n
+    Spans without style use current settings of the logger.
+
+    e.g. `logger.render_spans([("ERROR", "bold red"), (" user ", None), ("42", "cyan")])`
+    """
+    settings = self._get_override()
+    if settings is None or not settings.has_settings():
+      settings = self._default_settings
+
+    depth = color_support.depth(self._stream(file))
+
+    if clear:
+      self._clear_override()
+
+    return render_spans(((text, settings if style is None else style) for text, style in spans), depth)
+
+  def markup(self, template: str, *args: Any, file: Any = None, **kwargs: Any) -> str:
+    """
+    Returns styled markup `template` for logger output (See `templates.MarkupTemplate`)
+
+    e.g. `logger.markup("[bold red]ERROR[/] user [cyan]{id}[/]", id=42)`
+    """
+    return compile_markup(template).render(*args, file=self._stream(file), **kwargs)
+
+  """Per-character colors"""
+  def gradient(
+    self,
+    text: str,
+    start: Sequence[int],
+    end: Sequence[int],
+    *,
+    mode: ColorMode = "foreground",
+    clear: bool = True,
+    file: Any = None
+  ) -> str:
+    """
+    Returns text with RGB colors linearly interpolated from `start` to `end` color, one per character.\n
+    Text styles and color of the other mode from current settings are kept.
+
+    e.g. `logger.bold().gradient("Loading...", (255, 0, 0), (0, 0, 255))`
+    """
+    if not text or self._no_color(self._stream(file)):
+      if clear:
+        self._clear_override()
+
+      return text
+
+    try:
+      colors = interpolate_rgb(start, end, len(text))
+    except (TypeError, ValueError):
+      raise ColorException("Provided values for RGB must be 0 <= color <= 255")
+
+    return self._render_colored(text, colors, mode, clear, file)
+
+  def render_colors(
+    self,
+    text: str,
+    colors: Any,
+    *,
+    mode: ColorMode = "foreground",
+    clear: bool = True,
+    file: Any = None
+  ) -> str:
+    """
+    Returns text where every character has its own RGB color, e.g. for heatmaps.\n
+    `colors` is a sequence of `(r, g, b)` values (or NumPy array of shape (n, 3)) with the same length as text.\n
+    Consecutive characters with the same color share a single escape sequence.
+    """
+    if len(colors) != len(text):
+      raise ColorException("Number of colors must match length of text")
+
+    if not text or self._no_color(self._stream(file)):
+      if clear:
+        self._clear_override()
+
+      return text
+
+    try:
+      packed = pack_rgb_array(colors)
+    except (TypeError, ValueError) as error:
+      raise ColorException(str(error))
+
+    return self._render_colored(text, packed, mode, clear, file)
+
+  def _render_colored(self, text: str, colors: list[int], mode: ColorMode, clear: bool, file: Any) -> str:
+    check_invalid_mode(mode)
+
+    settings = self._get_override()
+    if settings is None or not settings.has_settings():
+      settings = self._default_settings
+
+    styles, foreground, background = settings.key()
+    key = (styles, 0, background) if mode == "foreground" else (styles, foreground, 0)
+
+    depth = color_support.depth(self._stream(file))
+    base_codes = build_format(key, depth)[len(BASE):-1]
+
+    if clear:
+      self._clear_override()
+
+    return render_colored(text, colors, mode, depth, base_codes)
+
 
 _root = TermStyle()
 
@@ -263,7 +552,7 @@ def get_default_logger():
   return _root
 
 
-def init_config(settings: Optional[Settings] = None):
+def init_config(settings: Optional[Union[Settings, TermSettings]] = None):
   """
   Can be used to acquire and configure default colored logger
   """
@@ -272,10 +561,10 @@ def init_config(settings: Optional[Settings] = None):
   return _root
 
 
-def create_logger(settings: Optional[Settings] = None):
+def create_logger(settings: Optional[Union[Settings, TermSettings]] = None, *, sink: Any = None):
   """
   Can be used to create and configure custom instance of colored logger
   """
-  logger = TermStyle(settings)
+  logger = TermStyle(settings, sink=sink)
 
   return logger
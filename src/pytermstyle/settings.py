@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-import copy
+import weakref
 
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 from .custom_types import TermOptions, ColorOptions, TextStyle, Colors, ColorMode
-from .definitions import textStyles, extendedColors
-from .utils import is_rgb_valid, check_invalid_mode, unique
+from .definitions import textStyles, styleMasks
+from .formats import ColorKey, SettingsKey, pack_styles, pack_color, pack_rgb, unpack_styles, unpack_color, unpack_rgb
+from .utils import is_rgb_valid, is_valid_color, check_invalid_mode
 
 __all__ = [
-  'TermConfigException', 'TermSettings'
+  'TermConfigException', 'TermSettings', 'CompiledSettings'
 ]
 
+SETTINGS_CACHE_SIZE = 256
+
 Settings = Union[TermOptions, dict]
 
 
@@ -62,38 +65,119 @@ class TermSettings:
     },
   }
   """
+  __slots__ = ("_styles", "_foreground", "_background", "_key")
+
   def __init__(self, settings: Optional[Settings] = None) -> None:
     """
     `TermConfigException` exception will be thrown if passed settings\n
     are not in valid format.
+
+    Settings are stored in compact form: text styles as a bitmask and colors as packed integers\n
+    (See `formats.SettingsKey`). Dictionary format is used only as input / output.
     """
-    self._settings = copy.deepcopy(settings) if settings else TermOptions()
-    self._verify_settings(self._settings)
+    self._styles = 0
+    self._foreground: ColorKey = 0
+    self._background: ColorKey = 0
+    self._key: Optional[SettingsKey] = None
 
-  def has_settings(self) -> bool:
-    if not self._settings:
-      return False
+    if settings:
+      self._verify_settings(settings)
+
+      self._styles = pack_styles(settings.get("style") or [])
+      self._foreground = self._pack_colors(settings.get("foreground"))
+      self._background = self._pack_colors(settings.get("background"))
+
+  @classmethod
+  def compile(cls, settings: Optional[Union[Settings, TermSettings]] = None) -> CompiledSettings:
+    """
+    Returns validated settings which can't be modified (See `CompiledSettings`).\n
+    Settings are validated once, and settings with the same content are represented with the same object,\n
+    which can be shared between loggers without copying.
+
+    e.g. `logger = TermStyle(TermSettings.compile({"style": ["bold"]}))`
+    """
+    if isinstance(settings, CompiledSettings):
+      return settings
+
+    if isinstance(settings, TermSettings):
+      return CompiledSettings._from_key(settings.key())
+
+    if not settings:
+      return CompiledSettings._from_key((0, 0, 0))
+
+    # Representation of settings is cheaper to compute than validation, and distinguishes value types
+    content = repr(settings)
+
+    compiled = _compiled_content.get(content)
+    if compiled is None:
+      if len(_compiled_content) >= SETTINGS_CACHE_SIZE:
+        _compiled_content.clear()
+
+      compiled = _compiled_content[content] = CompiledSettings._from_key(TermSettings(settings).key())
+
+    return compiled
 
-    return any(val for val in self._settings.values())
+  def _pack_colors(self, colors: Optional[ColorOptions]) -> ColorKey:
+    if not colors:
+      return 0
+
+    if "rgb" in colors:
+      return pack_rgb(colors["rgb"])
+
+    return pack_color(colors["color"]) if "color" in colors else 0
+
+  def has_settings(self) -> bool:
+    return bool(self._styles or self._foreground or self._background)
 
   def clear(self):
-    self._settings = {}
+    self._styles = self._foreground = self._background = 0
+    self._key = None
+
+  def copy(self) -> TermSettings:
+    """
+    Returns independent copy of already verified settings
+    """
+    settings = TermSettings()
+    settings._styles = self._styles
+    settings._foreground = self._foreground
+    settings._background = self._background
+    settings._key = self._key
+
+    return settings
+
+  def key(self) -> SettingsKey:
+    """
+    Returns immutable, hashable representation of settings.\n
+    Key is computed once and invalidated whenever settings are modified.
+    """
+    if self._key is None:
+      self._key = (self._styles, self._foreground, self._background)
+
+    return self._key
+
+  def _packed(self, mode: ColorMode) -> ColorKey:
+    if mode == "foreground":
+      return self._foreground
+
+    return self._background if mode == "background" else 0
+
+  def _set_packed(self, mode: ColorMode, packed: ColorKey):
+    if mode == "foreground":
+      self._foreground = packed
+    else:
+      self._background = packed
+
+    self._key = None
 
   """ Getters """
   def styles(self) -> list[TextStyle]:
-    return unique(self._settings.get("style", []))
+    return unpack_styles(self._styles)
 
   def color(self, mode: ColorMode) -> Optional[str]:
-    if mode in self._settings:
-      return self._settings[mode].get("color")  # type: ignore
-
-    return None
+    return unpack_color(self._packed(mode))
 
   def rgb(self, mode: ColorMode) -> Optional[list[str]]:
-    if mode in self._settings:
-      return self._settings[mode].get("rgb")  # type: ignore
-
-    return None
+    return unpack_rgb(self._packed(mode))
 
   """ Setters """
   def add_style(self, style: TextStyle):
@@ -101,7 +185,8 @@ class TermSettings:
     if error:
       raise TermConfigException(error)
 
-    self._settings.setdefault("style", []).append(style)
+    self._styles |= styleMasks[style]
+    self._key = None
 
   def add_color(self, color: Colors, mode: ColorMode):
     check_invalid_mode(mode)
@@ -111,7 +196,7 @@ class TermSettings:
     if error:
       raise TermConfigException(error)
 
-    self._settings[mode] = color_to_add
+    self._set_packed(mode, pack_color(color))
 
   def add_rgb(self, rgb: list[str], mode: ColorMode):
     check_invalid_mode(mode)
@@ -121,7 +206,25 @@ class TermSettings:
     if error:
       raise TermConfigException(error)
 
-    self._settings[mode] = rgb_to_add
+    self._set_packed(mode, pack_rgb(rgb))
+
+  def as_dict(self) -> TermOptions:
+    """
+    Returns settings in dictionary format
+    """
+    settings = TermOptions()
+
+    if self._styles:
+      settings["style"] = self.styles()
+
+    for mode in ("foreground", "background"):
+      color, rgb = self.color(mode), self.rgb(mode)  # type: ignore
+      if color:
+        settings[mode] = ColorOptions({"color": color})  # type: ignore
+      elif rgb:
+        settings[mode] = ColorOptions({"rgb": rgb})  # type: ignore
+
+    return settings
 
   """ Verification utilities """
   def _verify_settings(self, settings: Settings):
@@ -143,7 +246,7 @@ class TermSettings:
     if not styles:
       return None
 
-    not_found = set(styles).difference(set(textStyles.keys()))
+    not_found = [style for style in dict.fromkeys(styles) if style not in textStyles]
     if not not_found:
       return None
 
@@ -158,7 +261,7 @@ class TermSettings:
     if "color" in colors and "rgb" in colors:
       return '"rgb" and "color" properties are mutually exclusive.'
 
-    if "color" in colors and colors["color"] not in extendedColors:
+    if "color" in colors and not (isinstance(colors["color"], str) and is_valid_color(colors["color"])):
       return 'Color {color} is not supported.'.format(
         color=colors["color"]
       )
@@ -178,4 +281,46 @@ class TermSettings:
     )
 
   def __repr__(self) -> str:
-    return repr(self._settings)
+    return repr(self.as_dict())
+
+
+class CompiledSettings(TermSettings):
+  """
+  Validated settings which can't be modified, created with `TermSettings.compile`.\n
+  Compiled settings are compared and hashed by their content, and settings with the same content are interned.
+
+  Methods which modify settings raise `TermConfigException`, `copy` can be used to obtain modifiable settings.
+  """
+  __slots__ = ("__weakref__",)
+
+  _interned: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+  @classmethod
+  def _from_key(cls, key: SettingsKey) -> CompiledSettings:
+    settings = cls._interned.get(key)
+    if settings is not None:
+      return settings
+
+    settings = object.__new__(cls)
+    settings._styles, settings._foreground, settings._background = key
+    settings._key = key
+
+    return cls._interned.setdefault(key, settings)
+
+  def _frozen(self, *args: Any, **kwargs: Any):
+    raise TermConfigException("Compiled settings can't be modified")
+
+  add_style = add_color = add_rgb = clear = _set_packed = _frozen  # type: ignore
+
+  def __eq__(self, other: object) -> bool:
+    if not isinstance(other, CompiledSettings):
+      return NotImplemented
+
+    return self._key == other._key
+
+  def __hash__(self) -> int:
+    return hash(self._key)
+
+
+# Compiled settings by content of settings dictionary
+_compiled_content: dict[str, CompiledSettings] = {}
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import atexit
+import io
+import sys
+import threading
+import weakref
+
+from typing import Any, Callable, Optional
+
+"""Buffered output destinations for styled text."""
+
+__all__ = [
+  'OutputSink', 'DEFAULT_BUFFER_SIZE'
+]
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+_exit_sinks: weakref.WeakSet = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_at_exit():
+  for sink in list(_exit_sinks):
+    try:
+      sink.flush()
+    except Exception:
+      pass
+
+
+class OutputSink:
+  """
+  Buffered destination for styled output.
+
+  `target` can be either:
+   * Text stream, e.g. `sys.stdout`, `io.StringIO` (standard output by default)
+   * Binary stream, e.g. `io.BufferedWriter`, `io.BytesIO` - text is encoded with `encoding`
+   * Callable which accepts a string
+
+  Written text is kept in a buffer until one of the flush policies is triggered:
+   * `buffer_size` - Buffer is flushed once it holds at least that many characters.\n
+     Value 0 disables buffering.
+   * `flush_interval` - Buffer is flushed at most `flush_interval` seconds after first write
+   * Explicit call to `flush()` or `close()`
+   * `flush_at_exit` - Buffer is flushed when interpreter exits
+  """
+  def __init__(
+    self,
+    target: Any = None,
+    *,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    flush_interval: Optional[float] = None,
+    flush_at_exit: bool = True,
+    encoding: str = "utf-8"
+  ) -> None:
+    if buffer_size < 0:
+      raise ValueError("buffer_size must not be negative")
+
+    if flush_interval is not None and flush_interval <= 0:
+      raise ValueError("flush_interval must be a positive number")
+
+    self._target = target if target is not None else sys.stdout
+    self._write = self._make_writer(self._target, encoding)
+    self._buffer_size = buffer_size
+    self._flush_interval = flush_interval
+    self._buffer: list[str] = []
+    self._size = 0
+    self._lock = threading.RLock()
+    self._timer: Optional[threading.Timer] = None
+    self._closed = False
+
+    if flush_at_exit:
+      _exit_sinks.add(self)
+
+  @property
+  def target(self) -> Any:
+    return self._target
+
+  @property
+  def pending(self) -> int:
+    """
+    Number of buffered characters that are not yet written to target
+    """
+    return self._size
+
+  def _make_writer(self, target: Any, encoding: str) -> Callable[[str], Any]:
+    if isinstance(target, (io.RawIOBase, io.BufferedIOBase)):
+      return lambda text: target.write(text.encode(encoding))
+
+    if hasattr(target, "write"):
+      return target.write
+
+    if callable(target):
+      return target
+
+    raise TypeError("Output sink target must be a stream or a callable")
+
+  def isatty(self) -> bool:
+    isatty = getattr(self._target, "isatty", None)
+
+    try:
+      return bool(isatty()) if isatty else False
+    except ValueError:
+      return False
+
+  def write(self, text: str) -> int:
+    if self._closed:
+      raise ValueError("Write to closed output sink")
+
+    if not text:
+      return 0
+
+    with self._lock:
+      self._buffer.append(text)
+      self._size += len(text)
+
+      if self._size >= self._buffer_size:
+        self._flush()
+      elif self._flush_interval and self._timer is None:
+        self._timer = threading.Timer(self._flush_interval, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    return len(text)
+
+  def flush(self):
+    with self._lock:
+      self._flush()
+
+  def _flush(self):
+    if self._timer is not None:
+      self._timer.cancel()
+      self._timer = None
+
+    if self._buffer:
+      data = "".join(self._buffer)
+      self._buffer = []
+      self._size = 0
+
+      self._write(data)
+
+    flush = getattr(self._target, "flush", None)
+    if flush:
+      flush()
+
+  def close(self):
+    """
+    Flushes buffered output, after which sink can't be used anymore.\n
+    Target itself is not closed.
+    """
+    if self._closed:
+      return
+
+    self.flush()
+    self._closed = True
+    _exit_sinks.discard(self)
+
+  @property
+  def closed(self) -> bool:
+    return self._closed
+
+  def __enter__(self) -> OutputSink:
+    return self
+
+  def __exit__(self, *args: Any):
+    self.close()
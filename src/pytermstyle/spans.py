@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Tuple, Union
+
+from .custom_types import ColorDepth
+from .definitions import BASE, RESET, textStyles, textStyleResets, styleMasks
+from .formats import FORMAT_CACHE_SIZE, SettingsKey, build_format, color_code, unpack_styles
+from .settings import TermSettings, Settings
+from .style import Style
+
+"""Rendering of differently styled segments with minimal escape sequences between them."""
+
+__all__ = [
+  'render_spans', 'sgr_transition'
+]
+
+EMPTY_KEY: SettingsKey = (0, 0, 0)
+
+SpanStyle = Optional[Union[Style, TermSettings, Settings, str]]
+Span = Tuple[str, SpanStyle]
+
+
+def _reset_groups() -> list[tuple[str, int]]:
+  groups: dict[str, int] = {}
+  for style, code in textStyleResets.items():
+    groups[code] = groups.get(code, 0) | styleMasks[style]
+
+  return list(groups.items())
+
+
+# Reset code and bitmask of every style turned off by it
+_RESET_GROUPS = _reset_groups()
+
+
+def _span_key(style: SpanStyle) -> SettingsKey:
+  if style is None:
+    return EMPTY_KEY
+
+  if isinstance(style, Style):
+    return style.key
+
+  if isinstance(style, str):
+    return Style.parse(style).key
+
+  return TermSettings.compile(style).key()
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def sgr_transition(previous: SettingsKey, key: SettingsKey, depth: ColorDepth = "truecolor") -> str:
+  """
+  Returns the shortest escape sequence which changes output styled with `previous` settings key\n
+  to `key` (See `TermSettings.key`): either only the differences, or a reset followed by `key`.
+  """
+  if previous == key or depth == "none":
+    return ""
+
+  if key == EMPTY_KEY:
+    return RESET
+
+  full = build_format(key, depth)
+  if previous == EMPTY_KEY:
+    return full
+
+  prev_styles, prev_foreground, prev_background = previous
+  styles, foreground, background = key
+
+  codes = []
+  added = styles & ~prev_styles
+  removed = prev_styles & ~styles
+
+  for code, mask in _RESET_GROUPS:
+    if removed & mask:
+      codes.append(code)
+      # Remaining styles turned off by the same code are enabled again
+      added |= styles & mask
+
+  codes.extend(textStyles[style] for style in unpack_styles(added))
+
+  for mode, prev_color, color, default in [
+    ("foreground", prev_foreground, foreground, "39"),
+    ("background", prev_background, background, "49"),
+  ]:
+    prev_code = color_code(prev_color, mode, depth)  # type: ignore
+    code = color_code(color, mode, depth)  # type: ignore
+
+    if code != prev_code:
+      codes.append(code or default)
+
+  delta = f"{BASE}{';'.join(codes)}m" if codes else ""
+  reset = f"{BASE}0;{full[len(BASE):]}" if full else RESET
+
+  return delta if len(delta) <= len(reset) else reset
+
+
+def render_spans(spans: Iterable[Span], depth: ColorDepth = "truecolor") -> str:
+  """
+  Returns joined `(text, style)` spans, where style is `style.Style`, settings,\n
+  style specification (See `Style.parse`) or None for unstyled text.
+
+  Only the changes between styles of adjacent spans are written (See `sgr_transition`),\n
+  and a single reset is written at the end. All escape sequences are omitted for "none" `depth`.
+  """
+  if depth == "none":
+    return "".join(text for text, _ in spans)
+
+  # Style object is kept alongside its key, so that its id can't be reused
+  keys: dict[int, tuple[Any, SettingsKey]] = {}
+  parts = []
+  previous = EMPTY_KEY
+
+  for text, style in spans:
+    if not text:
+      continue
+
+    cached = keys.get(id(style))
+    if cached is None:
+      cached = keys[id(style)] = (style, _span_key(style))
+
+    key = cached[1]
+    if key != previous:
+      transition = sgr_transition(previous, key, depth)
+      if transition:
+        parts.append(transition)
+
+      previous = key
+
+    parts.append(text)
+
+  if previous != EMPTY_KEY and build_format(previous, depth):
+    parts.append(RESET)
+
+  return "".join(parts)
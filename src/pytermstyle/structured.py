@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import logging
+import re
+
+from typing import Any, Mapping, Optional, Sequence, Tuple, Union
+
+from .capabilities import color_support
+from .custom_types import ColorDepth
+from .definitions import RESET
+from .logger import LevelColors, NO_COLORS, TermStyleFormatter
+from .settings import TermConfigException
+from .theme import StyleLike, Theme
+
+"""Colored `key=value` formatting of structured log records."""
+
+__all__ = [
+  'TermStyleStructuredFormatter', 'DEFAULT_FIELDS', 'FIELD_NAMES', 'DEFAULT_VALUE_STYLES'
+]
+
+# Record attribute and its key in output
+DEFAULT_FIELDS: dict[str, str] = {
+  "levelname": "level",
+  "name": "logger",
+  "message": "msg",
+}
+
+FIELD_NAMES: dict[str, str] = {
+  **DEFAULT_FIELDS,
+  "asctime": "time",
+}
+
+DEFAULT_VALUE_STYLES: dict[str, StyleLike] = {
+  "key": "faint",
+  "string": "",
+  "number": "cyan",
+  "bool": "magenta",
+  "none": "faint",
+  "other": "",
+}
+
+# Attributes of every log record, which are not extra fields
+_RECORD_ATTRIBUTES = frozenset(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {
+  "message", "asctime", "colorStart", "colorEnd", "taskName"
+}
+
+MAX_CACHED_KEYS = 1024
+
+_NEEDS_QUOTES = re.compile(r'[\s="\\]')
+_ESCAPES = str.maketrans({'"': '\\"', "\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+Fields = Union[Sequence[str], Mapping[str, str]]
+
+
+def _quote(text: str) -> str:
+  if text and not _NEEDS_QUOTES.search(text):
+    return text
+
+  return '"' + text.translate(_ESCAPES) + '"'
+
+
+def _value(value: Any) -> Tuple[str, str]:
+  """
+  Returns text of field value and its style name
+  """
+  value_type = type(value)
+  if value_type is str:
+    return _quote(value), "string"
+
+  if value_type is int or value_type is float:
+    return str(value), "number"
+
+  if isinstance(value, str):
+    return _quote(value), "string"
+
+  if value is None:
+    return "null", "none"
+
+  if value is True or value is False:
+    return ("true" if value else "false"), "bool"
+
+  if isinstance(value, (int, float)):
+    return str(value), "number"
+
+  return _quote(str(value)), "other"
+
+
+class _Colors:
+  """
+  Escape sequences of levels, keys and value styles for one color depth
+  """
+  __slots__ = ("levels", "values", "keys", "key_colors")
+
+  def __init__(self, levels: dict[int, LevelColors], values: dict[str, LevelColors]) -> None:
+    self.levels = levels
+    self.values = values
+    self.key_colors = values.pop("key")
+    # Rendered ` key=` of every key used so far
+    self.keys: dict[str, str] = {}
+
+  def key(self, name: str) -> str:
+    rendered = self.keys.get(name)
+    if rendered is None:
+      start, end = self.key_colors
+      rendered = f" {start}{name}{end}="
+
+      if len(self.keys) < MAX_CACHED_KEYS:
+        self.keys[name] = rendered
+
+    return rendered
+
+
+class TermStyleStructuredFormatter(TermStyleFormatter):
+  """
+  Formatter which outputs log records as colored `key=value` fields:
+
+   `level=INFO logger=app msg="User logged in" user=42 admin=false`
+
+  `fields` - Record attributes which are written first, in given order.\n
+  Attributes are written with keys from `FIELD_NAMES` (e.g. `levelname` as `level`),\n
+  or with custom keys if `fields` is a mapping of attribute to key.\n
+  `asctime` is formatted with `datefmt`.
+
+  `extra` - If True, extra attributes of the record (e.g. passed with `extra` argument of logging call)\n
+  which are not in `fields` are written after `fields`.
+
+  ---
+
+  Level is colored with level settings in the same format as `TermStyleFormatter`.\n
+  Keys are colored with "key" style, and values by their type with "string", "number", "bool",\n
+  "none" (for None) and "other" styles (See `DEFAULT_VALUE_STYLES`). Styles can be overridden with `styles`,\n
+  where style is `style.Style`, settings or style specification (See `Style.parse`).
+
+  e.g. `TermStyleStructuredFormatter(styles={"key": "blue", "number": "bold yellow"})`
+
+  Escape sequences are compiled once for every color depth in use, and every record\n
+  is rendered with a single join. No escape sequences are written when colors are disabled.
+
+  Values are quoted if they are empty, or contain whitespace, `=`, `"` or `\\`.\n
+  Exception and stack information are written as `exc` and `stack` fields.
+  """
+  def __init__(
+    self,
+    fields: Optional[Fields] = None,
+    datefmt: Optional[str] = None,
+    *,
+    settings=None,
+    styles: Optional[Mapping[str, StyleLike]] = None,
+    extra: bool = True
+  ):
+    super().__init__(None, datefmt, settings=settings)
+
+    if fields is None:
+      fields = DEFAULT_FIELDS
+
+    if isinstance(fields, Mapping):
+      self._fields = list(fields.items())
+    else:
+      self._fields = [(field, FIELD_NAMES.get(field, field)) for field in fields]
+
+    unknown = set(styles or {}).difference(DEFAULT_VALUE_STYLES)
+    if unknown:
+      raise TermConfigException("Unknown value styles: {}".format(", ".join(sorted(unknown))))
+
+    self._value_styles = Theme({**DEFAULT_VALUE_STYLES, **(styles or {})})
+    self._extra = extra
+    # Attributes which are not extra fields, including attributes written as `fields`
+    self._skipped_attributes = _RECORD_ATTRIBUTES.union(field for field, _ in self._fields)
+    self._uses_time = any(field == "asctime" for field, _ in self._fields)
+
+    self._colors: dict[ColorDepth, _Colors] = {}
+    self._current_colors = ("none", self._build_colors("none"))
+
+  def _build_colors(self, depth: ColorDepth) -> _Colors:
+    values = {}
+    for name in self._value_styles:
+      start = self._value_styles[name].format(depth) if depth != "none" else ""
+      values[name] = (start, RESET if start else "")
+
+    return _Colors(self._build_level_colors(depth), values)
+
+  def get_colors(self) -> _Colors:
+    """
+    Returns escape sequences for color depth of standard output
+    """
+    depth = color_support.depth()
+
+    current_depth, colors = self._current_colors
+    if depth != current_depth:
+      cached = self._colors.get(depth)
+      if cached is None:
+        cached = self._colors[depth] = self._build_colors(depth)
+
+      colors = cached
+      self._current_colors = (depth, colors)
+
+    return colors
+
+  def format(self, record: logging.LogRecord) -> str:
+    record.message = record.getMessage()
+    if self._uses_time:
+      record.asctime = self.formatTime(record, self.datefmt)
+
+    colors = self.get_colors()
+    values = colors.values
+    keys = colors.keys
+    attributes = record.__dict__
+
+    parts: list[str] = []
+    for field, key in self._fields:
+      if field == "levelname":
+        start, end = colors.levels.get(record.levelno, NO_COLORS)
+        text = _quote(record.levelname)
+      else:
+        text, style = _value(attributes.get(field))
+        start, end = values[style]
+
+      parts += (keys.get(key) or colors.key(key), start, text, end)
+
+    extra = []
+    if self._extra:
+      skipped = self._skipped_attributes
+      extra = [(name, value) for name, value in attributes.items() if name not in skipped]
+
+    if record.exc_info and not record.exc_text:
+      record.exc_text = self.formatException(record.exc_info)
+
+    if record.exc_text:
+      extra.append(("exc", record.exc_text))
+
+    if record.stack_info:
+      extra.append(("stack", self.formatStack(record.stack_info)))
+
+    for name, value in extra:
+      text, style = _value(value)
+      start, end = values[style]
+      parts += (keys.get(name) or colors.key(name), start, text, end)
+
+    # Every key is preceded by a separator
+    return "".join(parts)[1:]
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import re
+import weakref
+
+from typing import Any, Optional, Union
+
+from .capabilities import color_support
+from .custom_types import ColorDepth
+from .definitions import RESET, textStyles
+from .formats import SettingsKey, build_format, merge_keys
+from .settings import TermConfigException, TermSettings, Settings
+from .utils import is_valid_color
+
+"""Immutable, reusable styles."""
+
+__all__ = [
+  'Style'
+]
+
+_SPEC_SEPARATOR = re.compile(r"[\s,]+")
+_HEX_COLOR = re.compile(r"#([0-9a-fA-F]{6})")
+
+
+class Style:
+  """
+  Immutable style which can be created once and applied to any number of texts.\n
+  Style accepts settings in the same format as `settings.TermSettings`,\n
+  which are validated and compiled to escape sequence only once.
+
+  e.g. `error = Style({"style": ["bold"], "foreground": {"color": "red"}})`
+
+  Styles can be applied by calling them, or by using `render` method:
+
+  e.g. `error("Colored text")` or `error.render("Colored text")`
+
+  Styles can be composed with `|` or `+` operators, in which case\n
+  styles are combined, and colors of the right operand take precedence:
+
+  e.g. `error | Style({"background": {"color": "white"}})`
+
+  Styles with same settings are interned, and represented with the same object.
+  """
+  __slots__ = ("_key", "_prefix", "_hash", "__weakref__")
+
+  _interned: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+  _key: SettingsKey
+  _prefix: str
+  _hash: int
+
+  def __new__(cls, settings: Optional[Union[Settings, TermSettings, Style]] = None) -> Style:
+    if isinstance(settings, Style):
+      return settings
+
+    return cls._from_key(TermSettings.compile(settings).key())
+
+  @classmethod
+  def parse(cls, spec: str) -> Style:
+    """
+    Creates style from textual specification, which is a list of words separated by spaces or commas:
+     * Text style, e.g. `bold`, `italic`
+     * Color name, 8-bit color code or RGB color in `#rrggbb` format - foreground color
+     * `on` followed by a color - background color
+
+    e.g. `Style.parse("bold sky-blue on #20576f")`
+
+    `TermConfigException` exception will be thrown if specification is not valid.
+    """
+    settings: dict = {}
+    words = [word for word in _SPEC_SEPARATOR.split(spec) if word]
+
+    index = 0
+    while index < len(words):
+      word = words[index]
+
+      if word in textStyles:
+        settings.setdefault("style", []).append(word)
+      else:
+        mode = "foreground"
+        if word == "on" and index + 1 < len(words):
+          mode = "background"
+          index += 1
+          word = words[index]
+
+        settings[mode] = cls._parse_color(word, spec)
+
+      index += 1
+
+    return cls(settings)
+
+  @staticmethod
+  def _parse_color(word: str, spec: str) -> dict:
+    hex_color = _HEX_COLOR.fullmatch(word)
+    if hex_color:
+      value = int(hex_color.group(1), 16)
+      return {"rgb": [str((value >> 16) & 0xFF), str((value >> 8) & 0xFF), str(value & 0xFF)]}
+
+    if is_valid_color(word):
+      return {"color": word}
+
+    raise TermConfigException(f"Invalid style specification: {spec!r} ({word!r} is not supported)")
+
+  @classmethod
+  def _from_key(cls, key: SettingsKey) -> Style:
+    style = cls._interned.get(key)
+    if style is not None:
+      return style
+
+    style = object.__new__(cls)
+    object.__setattr__(style, "_key", key)
+    object.__setattr__(style, "_prefix", build_format(key))
+    object.__setattr__(style, "_hash", hash(key))
+
+    return cls._interned.setdefault(key, style)
+
+  @property
+  def key(self) -> SettingsKey:
+    return self._key
+
+  @property
+  def prefix(self) -> str:
+    """
+    Escape sequence which starts styled output
+    """
+    return self._prefix
+
+  def format(self, depth: ColorDepth = "truecolor") -> str:
+    """
+    Returns escape sequence which starts styled output, with colors converted to `depth`
+    """
+    if depth == "truecolor":
+      return self._prefix
+
+    return build_format(self._key, depth)
+
+  def render(self, text: str, file: Any = None) -> str:
+    """
+    Returns styled text. Escape sequences are omitted in NO_COLOR mode\n
+    for `file` (standard output by default), and colors are converted to its color depth.
+    """
+    if not text or not self._prefix:
+      return text
+
+    depth = color_support.depth(file)
+    if depth == "none":
+      return text
+
+    return f"{self.format(depth)}{text}{RESET}"
+
+  def __call__(self, text: str, file: Any = None) -> str:
+    return self.render(text, file)
+
+  def __or__(self, other: Any) -> Style:
+    if not isinstance(other, Style):
+      return NotImplemented
+
+    return Style._from_key(merge_keys(self._key, other._key))
+
+  __add__ = __or__
+
+  def __eq__(self, other: Any) -> bool:
+    if not isinstance(other, Style):
+      return NotImplemented
+
+    return self._key == other._key
+
+  def __hash__(self) -> int:
+    return self._hash
+
+  def __setattr__(self, name: str, value: Any):
+    raise AttributeError("Style is immutable")
+
+  def __delattr__(self, name: str):
+    raise AttributeError("Style is immutable")
+
+  def __reduce__(self):
+    return (Style._from_key, (self._key,))
+
+  def __repr__(self) -> str:
+    return "Style({!r})".format(self._prefix)
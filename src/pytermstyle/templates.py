@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import re
+
+from functools import lru_cache
+from typing import Any
+
+from .capabilities import color_support
+from .custom_types import ColorDepth
+from .settings import TermConfigException
+from .spans import Span, render_spans
+from .style import Style
+
+"""Inline markup for styled text, e.g. `"[bold red]ERROR[/] user [cyan]{id}[/]"`."""
+
+__all__ = [
+  'MARKUP_CACHE_SIZE', 'MarkupTemplate', 'compile_markup', 'markup'
+]
+
+MARKUP_CACHE_SIZE = 256
+
+# Escaped bracket, closing tag or opening tag
+_TAG = re.compile(r"\\\[|\[(/?)([^\[\]]*)\]")
+
+
+class MarkupTemplate:
+  """
+  Markup template, parsed once into styled literal fragments.
+
+  Tags are style specifications in square brackets (See `style.Style.parse`), which apply\n
+  to the following text until the matching closing tag `[/]` (or `[/anything]`) or the end of template.\n
+  Nested tags are combined with enclosing tags, where colors of inner tags take precedence.
+
+  Brackets which don't contain a valid specification (e.g. `[1]`, `[note]`) are kept as text,\n
+  and `\\[` can be used to write `[` literally.
+
+  Template can contain replacement fields of `str.format` (e.g. `{id}`), which are substituted\n
+  after styling, so replacement values are never interpreted as markup.
+  """
+  __slots__ = ("template", "_spans", "_formats")
+
+  def __init__(self, template: str) -> None:
+    self.template = template
+    self._spans = self._parse(template)
+    self._formats: dict[ColorDepth, str] = {}
+
+  @staticmethod
+  def _parse(template: str) -> list[Span]:
+    spans: list[Span] = []
+    stack = [Style()]
+    text: list[str] = []
+
+    def flush():
+      if text:
+        spans.append(("".join(text), stack[-1]))
+        text.clear()
+
+    position = 0
+    for match in _TAG.finditer(template):
+      text.append(template[position:match.start()])
+      position = match.end()
+
+      closing, spec = match.groups()
+      if spec is None:
+        text.append("[")
+      elif closing:
+        if len(stack) == 1:
+          raise TermConfigException(f"Closing tag {match.group()!r} does not have matching opening tag")
+
+        flush()
+        stack.pop()
+      else:
+        style = MarkupTemplate._parse_tag(spec)
+        if style is None:
+          text.append(match.group())
+          continue
+
+        flush()
+        stack.append(stack[-1] | style)
+
+    text.append(template[position:])
+    flush()
+
+    return spans
+
+  @staticmethod
+  def _parse_tag(spec: str) -> Any:
+    # Numbers in brackets (e.g. indices) are more likely text than 8-bit colors
+    if not spec.strip() or spec.strip().isdigit():
+      return None
+
+    try:
+      return Style.parse(spec)
+    except TermConfigException:
+      return None
+
+  def format_string(self, depth: ColorDepth = "truecolor") -> str:
+    """
+    Returns styled template (with replacement fields) for color `depth`
+    """
+    fmt = self._formats.get(depth)
+    if fmt is None:
+      fmt = self._formats[depth] = render_spans(self._spans, depth)
+
+    return fmt
+
+  def render(self, *args: Any, file: Any = None, **kwargs: Any) -> str:
+    """
+    Returns styled template with replacement fields substituted by `args` and `kwargs`.\n
+    Escape sequences are omitted in NO_COLOR mode for `file` (standard output by default).
+    """
+    return self.format_string(color_support.depth(file)).format(*args, **kwargs)
+
+  def __repr__(self) -> str:
+    return f"MarkupTemplate({self.template!r})"
+
+
+@lru_cache(maxsize=MARKUP_CACHE_SIZE)
+def compile_markup(template: str) -> MarkupTemplate:
+  """
+  Returns parsed template. Templates are kept in process-wide LRU cache
+  """
+  return MarkupTemplate(template)
+
+
+def markup(template: str, *args: Any, file: Any = None, **kwargs: Any) -> str:
+  """
+  Returns styled markup `template` with replacement fields substituted by `args` and `kwargs`\n
+  (See `MarkupTemplate`).
+
+  e.g. `markup("[bold red]ERROR[/] user [cyan]{id}[/]", id=42)`
+  """
+  return compile_markup(template).render(*args, file=file, **kwargs)
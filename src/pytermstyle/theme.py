@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+
+from typing import Any, Iterator, Mapping, Optional, Tuple, Union
+
+from .settings import TermConfigException, TermSettings, Settings
+from .style import Style
+
+"""Registry of named styles, loaded from dictionaries or theme files."""
+
+__all__ = [
+  'Theme', 'DEFAULT_WATCH_INTERVAL'
+]
+
+DEFAULT_WATCH_INTERVAL = 1.0
+
+StyleLike = Union[Style, TermSettings, Settings, str]
+
+_Stamp = Tuple[int, int]
+
+
+def _read_file(path: str) -> Any:
+  if path.endswith(".toml"):
+    try:
+      import tomllib  # type: ignore
+    except ImportError:
+      try:
+        import tomli as tomllib  # type: ignore
+      except ImportError:
+        raise TermConfigException("Reading of TOML themes requires Python 3.11 or tomli package") from None
+
+    with open(path, "rb") as file:
+      return tomllib.load(file)
+
+  with open(path, "r", encoding="utf-8") as file:
+    return json.load(file)
+
+
+class Theme:
+  """
+  Registry of named styles, e.g. `"error"`, `"ok"` or `"muted"`.\n
+  Every style is validated and compiled once, when the theme is loaded,\n
+  and looked up by name as a `style.Style`:
+
+  e.g. `theme = Theme({"error": "bold red", "ok": {"foreground": {"color": "green"}}})`\n
+  `theme["error"]("Colored text")`
+
+  Style can be `style.Style`, settings or style specification (See `Style.parse`).
+
+  ---
+
+  Themes can be loaded from JSON files, or TOML files (with `.toml` suffix, requires Python 3.11 or tomli):
+
+   error = "bold red"
+
+   [ok]
+   foreground = { color = "green" }
+
+  Theme loaded from a file can be reloaded when the file changes, either by calling `reload`,\n
+  or periodically in a background thread started with `watch`. Reloaded styles replace\n
+  all previous styles at once, so lookups are never blocked and never see a partially loaded theme.\n
+  If the changed file is not valid, previous styles are kept.
+  """
+  def __init__(self, styles: Optional[Mapping[str, StyleLike]] = None) -> None:
+    self._styles: dict[str, Style] = self._compile(styles or {})
+    self._path: Optional[str] = None
+    self._stamp: Optional[_Stamp] = None
+
+    # Serializes reloads, lookups don't use it
+    self._reload_lock = threading.Lock()
+    self._watcher: Optional[threading.Thread] = None
+    self._stop_watching = threading.Event()
+
+    self.last_error: Optional[Exception] = None
+
+  @classmethod
+  def from_file(cls, path: Union[str, os.PathLike], *, watch: bool = False, interval: float = DEFAULT_WATCH_INTERVAL) -> Theme:
+    """
+    Loads theme from JSON or TOML file. If `watch` is True, theme is reloaded\n
+    whenever the file changes, which is checked every `interval` seconds.
+
+    `TermConfigException` exception will be thrown if the file or any of its styles are not valid.
+    """
+    theme = cls()
+    theme._path = os.fspath(path)
+    theme.reload()
+
+    if watch:
+      theme.watch(interval)
+
+    return theme
+
+  @property
+  def path(self) -> Optional[str]:
+    return self._path
+
+  @staticmethod
+  def _compile(styles: Any) -> dict[str, Style]:
+    if not isinstance(styles, Mapping):
+      raise TermConfigException("Theme must be a mapping of style names to styles")
+
+    compiled: dict[str, Style] = {}
+    for name, style in styles.items():
+      if not isinstance(name, str):
+        raise TermConfigException(f"Invalid style name: {name!r}")
+
+      try:
+        compiled[name] = Style.parse(style) if isinstance(style, str) else Style(style)
+      except (TermConfigException, AttributeError, TypeError, ValueError) as error:
+        raise TermConfigException(f"Invalid style {name!r}: {error}") from None
+
+    return compiled
+
+  def load(self, styles: Mapping[str, StyleLike]):
+    """
+    Replaces all styles of the theme.\n
+    New styles are compiled before they replace previous styles.
+    """
+    self._styles = self._compile(styles)
+
+  def reload(self) -> bool:
+    """
+    Reloads the theme from its file, if the file changed since it was last loaded.\n
+    Returns True if styles were replaced.
+    """
+    if self._path is None:
+      raise TermConfigException("Theme was not loaded from a file")
+
+    with self._reload_lock:
+      try:
+        stat = os.stat(self._path)
+      except OSError as error:
+        raise TermConfigException(f"Theme file can't be read: {error}") from None
+
+      stamp = (stat.st_mtime_ns, stat.st_size)
+      if stamp == self._stamp:
+        return False
+
+      try:
+        content = _read_file(self._path)
+      except (OSError, ValueError) as error:
+        raise TermConfigException(f"Invalid theme file {self._path}: {error}") from None
+
+      self.load(content)
+      self._stamp = stamp
+
+      return True
+
+  def watch(self, interval: float = DEFAULT_WATCH_INTERVAL):
+    """
+    Starts background thread which reloads the theme every `interval` seconds, if its file changed.\n
+    Errors of reloading are stored in `last_error` attribute, and previous styles are kept.
+    """
+    if self._path is None:
+      raise TermConfigException("Theme was not loaded from a file")
+
+    if self._watcher is not None:
+      raise RuntimeError("Theme is already watched")
+
+    self._stop_watching.clear()
+    self._watcher = threading.Thread(
+      target=self._watch, args=(interval,), name="pytermstyle-theme-watcher", daemon=True
+    )
+    self._watcher.start()
+
+  def stop(self):
+    """
+    Stops background reloading started with `watch`
+    """
+    watcher, self._watcher = self._watcher, None
+    if watcher is not None:
+      self._stop_watching.set()
+      watcher.join()
+
+  def _watch(self, interval: float):
+    while not self._stop_watching.wait(interval):
+      try:
+        self.reload()
+        self.last_error = None
+      except TermConfigException as error:
+        self.last_error = error
+
+  def get(self, name: str, default: Optional[Style] = None) -> Optional[Style]:
+    return self._styles.get(name, default)
+
+  def __getitem__(self, name: str) -> Style:
+    return self._styles[name]
+
+  def __contains__(self, name: object) -> bool:
+    return name in self._styles
+
+  def __iter__(self) -> Iterator[str]:
+    return iter(self._styles)
+
+  def __len__(self) -> int:
+    return len(self._styles)
+
+  def __repr__(self) -> str:
+    return f"Theme({sorted(self._styles)!r})"
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Optional, get_args
+from typing import Optional
 
 from .custom_types import ColorMode, Color
-from .definitions import baseColors, extendedColors
+from .definitions import COLOR_MODES, colorCodes, baseColorCodes
+from .definitions import baseColors, extendedColors  # noqa: F401
 
 __all__ = [
   'is_rgb_valid', 'is_valid_color', 'get_4bit_color_code', 'get_8bit_color_code',
@@ -11,10 +12,16 @@ __all__ = [
 ]
 
 
+_RGB_VALUES = frozenset([*range(256), *map(str, range(256))])
+
+
 def is_rgb_valid(rgb: list[str]) -> bool:
   """
   Returns True if all values are valid RGB code
   """
+  if all(color in _RGB_VALUES for color in rgb):
+    return True
+
   try:
     return all(0 <= int(color) <= 255 for color in rgb)
   except ValueError:
@@ -26,10 +33,11 @@ def is_valid_color(name: str) -> bool:
   Returns True if `name` is a supported color name\n
   (See `Colors` type) or a valid custom color code
   """
-  if name not in extendedColors:
-    return name.isdigit() and is_rgb_valid([name])
+  if name in colorCodes:
+    return True
 
-  return True
+  # Codes which are not in canonical form, e.g. "061"
+  return name.isdigit() and is_rgb_valid([name])
 
 
 def get_4bit_color_code(color: Color, mode: ColorMode) -> str:
@@ -38,14 +46,12 @@ def get_4bit_color_code(color: Color, mode: ColorMode) -> str:
 
   Supported by variety of terminal emulators
   """
-  if color not in baseColors:
+  if color not in baseColorCodes["foreground"]:
     raise ValueError(f"Color {color} does not have a supported 4-bit code")
 
   check_invalid_mode(mode)
 
-  code = baseColors.index(color) + (30 if mode == "foreground" else 40)
-
-  return str(code)
+  return baseColorCodes[mode][color]
 
 
 def get_8bit_color_code(name: str) -> Optional[str]:
@@ -54,17 +60,18 @@ def get_8bit_color_code(name: str) -> Optional[str]:
   Some colors can be passed by name (See `Colors` type)\n
   For the remaining colors, 8-bit code can be directly provided
   """
-  if name not in extendedColors:
-    return name if name.isdigit() and is_rgb_valid([name]) else None
+  code = colorCodes.get(name)
+  if code is not None:
+    return code
 
-  return extendedColors[name]  # type: ignore
+  return name if name.isdigit() and is_rgb_valid([name]) else None
 
 
 def check_invalid_mode(mode: str):
   """
   Raises `ValueError` if mode is not a valid `ColorMode`
   """
-  if mode not in get_args(ColorMode):
+  if mode not in COLOR_MODES:
     raise ValueError(f"Color mode {mode} is not supported")
 
 
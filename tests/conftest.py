@@ -1,6 +1,26 @@
 import pytest
 import logging
 
+from pytermstyle import color_support
+
+@pytest.fixture(autouse=True)
+def refresh_color_support(monkeypatch):
+  # Colors are expected as configured, regardless of terminal running the tests
+  monkeypatch.setenv("COLORTERM", "truecolor")
+  color_support.refresh()
+
+  yield
+
+  color_support.watch_env(False)
+  color_support.refresh()
+
+
+@pytest.fixture
+def level_names(monkeypatch):
+  # Levels registered with `logging.addLevelName` are removed after the test
+  monkeypatch.setattr(logging, "_levelToName", logging._levelToName.copy())
+  monkeypatch.setattr(logging, "_nameToLevel", logging._nameToLevel.copy())
+
 @pytest.fixture
 def texts():
   return {
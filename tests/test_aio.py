@@ -0,0 +1,190 @@
+import asyncio
+import io
+import os
+import pytest
+import subprocess
+import sys
+import threading
+
+from pytermstyle import AsyncTermStyle
+
+from .conftest import newline
+
+class FakeWriter:
+  def __init__(self):
+    self.writes = []
+    self.drains = 0
+
+  def write(self, data):
+    self.writes.append(data)
+
+  async def drain(self):
+    self.drains += 1
+
+class TestAsyncTermStyle:
+  @pytest.fixture(autouse=True)
+  def setup_before_after(self, monkeypatch):
+    monkeypatch.setenv('FORCE_COLOR', 'true')
+
+    yield
+
+  def test__aprint(self, colored, texts, mock_settings_config):
+    writer = FakeWriter()
+    logger = AsyncTermStyle(mock_settings_config, writer=writer)
+
+    async def main():
+      await logger.aprint(texts["message"])
+      await logger.bold().aprint(texts["message"], end="")
+
+    asyncio.run(main())
+
+    assert writer.writes == [
+      newline(colored["defaultSettings"]).encode(),
+      colored["style"].format(1).encode(),
+    ]
+    assert writer.drains == 2
+
+  def test__coalesced_writes(self, texts):
+    writer = FakeWriter()
+    logger = AsyncTermStyle(writer=writer)
+
+    async def main():
+      await asyncio.gather(*[logger.aprint(f"{index}") for index in range(10)])
+
+    asyncio.run(main())
+
+    assert writer.writes == ["".join(newline(f"{index}") for index in range(10)).encode()]
+
+  def test__per_task_styles(self):
+    writer = FakeWriter()
+    logger = AsyncTermStyle(writer=writer)
+
+    async def styled():
+      await logger.bold().aprint("bold")
+
+    async def main():
+      await asyncio.gather(styled(), logger.aprint("plain"))
+
+    asyncio.run(main())
+
+    assert writer.writes == [b"\033[1mbold\033[0m\nplain\n"]
+
+  def test__empty_output(self):
+    writer = FakeWriter()
+    logger = AsyncTermStyle(writer=writer)
+
+    async def main():
+      await logger.bold().aprint()
+      await logger.aprint("")
+
+    asyncio.run(main())
+
+    assert writer.writes == []
+
+  def test__pipe_stream(self, texts):
+    read_fd, write_fd = os.pipe()
+    stream = os.fdopen(write_fd, "w")
+    logger = AsyncTermStyle(stream=stream)
+
+    async def main():
+      await logger.fg_red().aprint(texts["message"])
+      await logger.aclose()
+
+    asyncio.run(main())
+    stream.close()
+
+    with os.fdopen(read_fd, "rb") as pipe:
+      assert pipe.read() == newline(f"\033[38;5;1m{texts['message']}\033[0m").encode()
+
+  def test__pipe_blocking_restored(self, texts):
+    read_fd, write_fd = os.pipe()
+    stream = os.fdopen(write_fd, "w")
+    logger = AsyncTermStyle(stream=stream)
+    blocking = []
+
+    async def main():
+      await logger.aprint(texts["message"])
+      blocking.append(os.get_blocking(write_fd))
+
+      await logger.aclose()
+      blocking.append(os.get_blocking(write_fd))
+
+    assert os.get_blocking(write_fd)
+    asyncio.run(main())
+
+    assert blocking == [False, True]
+
+    # Plain writes larger than the pipe buffer wait for the reader instead of failing
+    with os.fdopen(read_fd, "rb") as pipe:
+      reader = threading.Thread(target=pipe.read)
+      reader.start()
+
+      stream.write("x" * 200000)
+      stream.close()
+      reader.join()
+
+  def test__pipe_blocking_restored_at_exit(self):
+    read_fd, write_fd = os.pipe()
+    code = (
+      "import asyncio, sys\n"
+      "from pytermstyle import AsyncTermStyle\n"
+      "logger = AsyncTermStyle(stream=sys.stdout)\n"
+      "asyncio.run(logger.aprint('text'))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+    try:
+      subprocess.run([sys.executable, "-c", code], stdout=write_fd, env=env, check=True)
+
+      assert os.get_blocking(write_fd)
+    finally:
+      os.close(write_fd)
+
+    with os.fdopen(read_fd, "rb") as pipe:
+      assert pipe.read() == newline("text").encode()
+
+  @pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires pseudo-terminal")
+  def test__terminal_stays_blocking(self, texts):
+    master_fd, slave_fd = os.openpty()
+    stream = os.fdopen(slave_fd, "w")
+    logger = AsyncTermStyle(stream=stream)
+    blocking = []
+
+    async def main():
+      await logger.aprint(texts["message"])
+      blocking.append(os.get_blocking(slave_fd))
+
+      await logger.aclose()
+
+    try:
+      asyncio.run(main())
+
+      assert blocking == [True]
+      assert texts["message"].encode() in os.read(master_fd, 1024)
+    finally:
+      stream.close()
+      os.close(master_fd)
+
+  def test__default_stream(self, texts, capsys):
+    logger = AsyncTermStyle()
+
+    async def main():
+      await logger.aprint(texts["message"])
+      await logger.aclose()
+
+    asyncio.run(main())
+
+    assert capsys.readouterr().out == newline(texts["message"])
+
+  def test__executor_stream(self, texts, monkeypatch):
+    monkeypatch.delenv('FORCE_COLOR')
+    stream = io.StringIO()
+    logger = AsyncTermStyle({ "style": ["bold"] }, stream=stream)
+
+    async def main():
+      await logger.aprint(texts["message"])
+      await logger.aprint(texts["message"])
+
+    asyncio.run(main())
+
+    assert stream.getvalue() == newline(texts["message"]) * 2
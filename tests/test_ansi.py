@@ -0,0 +1,66 @@
+import pytest
+
+from pytermstyle import TermStyle, Style
+from pytermstyle.ansi import strip_ansi, visible_len
+
+
+rendered = [
+  "\033[1;3mStyled\033[0m",
+  "\033[38;2;61;217;187mRGB\033[0m",
+  "\033[48;5;200mBackground\033[0m",
+  "\033[1;38;5;208;48;2;32;87;111mMixed\033[0m",
+  "\033[0mReset only",
+]
+
+
+class TestStripAnsi:
+  @pytest.mark.parametrize('text', rendered)
+  def test__strip_sequences(self, text: str):
+    stripped = strip_ansi(text)
+
+    assert "\033" not in stripped
+    assert stripped == text.split("m", 1)[1].replace("\033[0m", "")
+
+  def test__plain_text_unchanged(self):
+    text = "Plain text [1m"
+    assert strip_ansi(text) is text
+
+  def test__keeps_other_escape_sequences(self):
+    text = "\033[2Jcleared\033[1mbold\033[0m"
+    assert strip_ansi(text) == "\033[2Jclearedbold"
+
+  @pytest.mark.parametrize('data', [b"\033[1;38;2;0;0;0mBytes\033[0m", bytearray(b"\033[4mBytes\033[0m")])
+  def test__bytes(self, data):
+    assert strip_ansi(data) == b"Bytes"
+    assert visible_len(data) == 5
+
+  def test__memoryview(self):
+    data = memoryview(b"\033[31mView\033[0m")
+
+    assert strip_ansi(data) == b"View"
+    assert visible_len(data) == 4
+
+  def test__rendered_output(self, monkeypatch):
+    monkeypatch.setenv('FORCE_COLOR', 'true')
+    logger = TermStyle()
+    style = Style({"style": ["bold", "underline"], "foreground": {"rgb": ["61", "217", "187"]}})
+
+    assert strip_ansi(logger.bold().bg_color("200").render("Chained")) == "Chained"
+    assert strip_ansi(style.render("Reusable")) == "Reusable"
+
+
+class TestVisibleLen:
+  @pytest.mark.parametrize('text', rendered)
+  def test__visible_len(self, text: str):
+    assert visible_len(text) == len(strip_ansi(text))
+
+  def test__plain_text(self):
+    assert visible_len("Plain") == 5
+    assert visible_len(b"") == 0
+
+  def test__large_input(self):
+    line = "\033[1;38;2;61;217;187mValue\033[0m | plain\n"
+    text = line * 50000
+
+    assert visible_len(text) == len("Value | plain\n") * 50000
+    assert visible_len(text.encode()) == visible_len(text)
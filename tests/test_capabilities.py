@@ -0,0 +1,176 @@
+import io
+import pytest
+
+from pytermstyle import ColorSupport, TermStyle, Style, color_support, detect_color_support, detect_color_depth
+
+from .conftest import newline
+
+class TTYStream(io.StringIO):
+  def __init__(self):
+    super().__init__()
+    self.calls = 0
+
+  def isatty(self):
+    self.calls += 1
+    return True
+
+@pytest.fixture(autouse=True)
+def clear_env(monkeypatch):
+  for env_var in ["NO_COLOR", "ANSI_COLORS_DISABLED", "FORCE_COLOR", "TERM", "COLORTERM"]:
+    monkeypatch.delenv(env_var, raising=False)
+
+  yield
+
+class TestDetection:
+  def test__tty_stream(self):
+    assert detect_color_support(TTYStream()) == True
+    assert detect_color_support(io.StringIO()) == False
+    assert detect_color_support(object()) == False
+
+  def test__closed_stream(self):
+    stream = io.StringIO()
+    stream.close()
+
+    assert detect_color_support(stream) == False
+
+  @pytest.mark.parametrize('env', [("NO_COLOR", "1"), ("ANSI_COLORS_DISABLED", "1"), ("TERM", "dumb")])
+  def test__disabled_env(self, monkeypatch, env):
+    monkeypatch.setenv(*env)
+
+    assert detect_color_support(TTYStream()) == False
+
+  def test__force_color(self, monkeypatch):
+    monkeypatch.setenv("FORCE_COLOR", "1")
+
+    assert detect_color_support(io.StringIO()) == True
+
+
+class TestColorSupport:
+  def test__cached_per_stream(self):
+    support = ColorSupport()
+    stream, other = TTYStream(), io.StringIO()
+
+    assert support.enabled(stream) == True
+    assert support.enabled(stream) == True
+    assert support.enabled(other) == False
+    assert support.enabled(stream) == True
+    assert stream.calls == 1
+
+  def test__refresh(self, monkeypatch):
+    support = ColorSupport()
+    stream = TTYStream()
+
+    assert support.enabled(stream) == True
+
+    monkeypatch.setenv("NO_COLOR", "1")
+    assert support.enabled(stream) == True
+
+    support.refresh(stream)
+    assert support.enabled(stream) == False
+
+    monkeypatch.delenv("NO_COLOR")
+    support.refresh()
+    assert support.enabled(stream) == True
+
+  def test__watch_env(self, monkeypatch):
+    support = ColorSupport()
+    support.watch_env()
+    stream = TTYStream()
+
+    assert support.enabled(stream) == True
+
+    monkeypatch.setenv("TERM", "dumb")
+    assert support.enabled(stream) == False
+
+    support.watch_env(False)
+    monkeypatch.delenv("TERM")
+    assert support.enabled(stream) == False
+
+  def test__logger_stream(self, texts):
+    logger = TermStyle({"style": ["bold"]})
+    stream = TTYStream()
+
+    logger(texts["message"], file=stream)
+    logger(texts["message"], file=stream)
+
+    assert stream.getvalue() == newline("\033[1m{}\033[0m".format(texts["message"])) * 2
+    assert stream.calls == 1
+
+
+class TestColorDepth:
+  @pytest.mark.parametrize('env, depth', [
+    ({}, "truecolor"),
+    ({"COLORTERM": "truecolor"}, "truecolor"),
+    ({"COLORTERM": "24bit", "TERM": "xterm-256color"}, "truecolor"),
+    ({"TERM": "xterm-256color"}, "256"),
+    ({"TERM": "screen-256color"}, "256"),
+    ({"TERM": "linux"}, "16"),
+    ({"TERM": "vt100"}, "16"),
+    ({"FORCE_COLOR": "1"}, "truecolor"),
+    ({"FORCE_COLOR": "1", "TERM": "linux"}, "16"),
+    ({"FORCE_COLOR": "2"}, "256"),
+    ({"FORCE_COLOR": "3", "TERM": "linux"}, "truecolor"),
+    ({"FORCE_COLOR": "true", "TERM": "xterm-256color"}, "256"),
+  ])
+  def test__detect_depth(self, monkeypatch, env, depth):
+    for env_var, value in env.items():
+      monkeypatch.setenv(env_var, value)
+
+    assert detect_color_depth(TTYStream()) == depth
+
+  def test__no_color_depth(self, monkeypatch):
+    assert detect_color_depth(io.StringIO()) == "none"
+
+    monkeypatch.setenv("NO_COLOR", "1")
+    monkeypatch.setenv("FORCE_COLOR", "3")
+    assert detect_color_depth(TTYStream()) == "none"
+
+  def test__force_depth(self, monkeypatch):
+    support = ColorSupport()
+    stream = TTYStream()
+
+    support.force_depth("256")
+    assert support.depth(stream) == "256"
+    assert support.depth(io.StringIO()) == "none"
+
+    support.force_depth("none")
+    assert support.depth(stream) == "none"
+    assert support.enabled(stream) == False
+
+    support.force_depth(None)
+    assert support.depth(stream) == "truecolor"
+
+    with pytest.raises(ValueError):
+      support.force_depth("8")  # type: ignore
+
+  def test__watch_colorterm(self, monkeypatch):
+    support = ColorSupport()
+    support.watch_env()
+    stream = TTYStream()
+
+    monkeypatch.setenv("TERM", "xterm-256color")
+    assert support.depth(stream) == "256"
+
+    monkeypatch.setenv("COLORTERM", "truecolor")
+    assert support.depth(stream) == "truecolor"
+
+  def test__downgraded_output(self, texts):
+    stream = TTYStream()
+    logger = TermStyle()
+    style = Style({"foreground": {"rgb": ["61", "217", "187"]}, "background": {"color": "200"}})
+
+    try:
+      color_support.force_depth("256")
+      logger.fg_rgb(61, 217, 187, text=texts["message"], file=stream)
+      assert style.render("Style", file=stream) == "\033[38;5;79;48;5;200mStyle\033[0m"
+
+      color_support.force_depth("16")
+      logger.bold().fg_rgb(61, 217, 187).bg_color("orange", text=texts["message"], file=stream)
+      assert style.render("Style", file=stream) == "\033[36;105mStyle\033[0m"
+    finally:
+      color_support.force_depth(None)
+
+    assert stream.getvalue() == (
+      newline("\033[38;5;79m{}\033[0m".format(texts["message"])) +
+      newline("\033[1;36;43m{}\033[0m".format(texts["message"]))
+    )
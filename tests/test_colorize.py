@@ -0,0 +1,145 @@
+import io
+import pytest
+import re
+
+from pytermstyle import Colorizer
+from pytermstyle.__main__ import main
+
+LOG = b"".join([
+  b"INFO start\n",
+  b"DEBUG took 15ms\n",
+  b"plain line 3ms\n",
+  b"  [ERROR] failure\n",
+  b"CRITICAL stop",
+])
+
+COLORED_LOG = b"".join([
+  b"\033[38;5;2mINFO start\033[0m\n",
+  b"\033[38;5;81mDEBUG took 15ms\033[0m\n",
+  b"plain line \033[1;38;5;3m3ms\033[0m\n",
+  b"\033[38;5;1m  [ERROR] failure\033[0m\n",
+  b"\033[1;38;5;1mCRITICAL stop\033[0m",
+])
+
+@pytest.fixture
+def colorizer():
+  return Colorizer({ r"\d+ms": "bold yellow" }, levels=True)
+
+class TestColorizer:
+  def test__colorize(self, colorizer):
+    assert colorizer.colorize(LOG) == COLORED_LOG
+
+  def test__rules_only(self):
+    colorizer = Colorizer({
+      r"\d+ms": { "foreground": { "color": "red" } },
+      r"ERROR|INFO": "underline",
+    })
+
+    assert colorizer.colorize(b"INFO 3ms ERROR") == b"\033[4mINFO\033[0m \033[38;5;1m3ms\033[0m \033[4mERROR\033[0m"
+
+  def test__custom_levels(self):
+    colorizer = Colorizer(levels={ "NOTICE": "cyan" })
+
+    assert colorizer.colorize(b"NOTICE x\nINFO y\n") == b"\033[38;5;6mNOTICE x\033[0m\nINFO y\n"
+
+  def test__ignore_case_levels(self):
+    colorizer = Colorizer(levels={ "NOTICE": "cyan", "info": "green" }, flags=re.IGNORECASE)
+
+    assert colorizer.colorize(b"notice: x\nInfo: y\n") == b"\033[38;5;6mnotice: x\033[0m\n\033[38;5;2mInfo: y\033[0m\n"
+
+  def test__group_references(self):
+    colorizer = Colorizer({ r"(?P<char>\w)(?P=char)": "bold", r"\\1": "red" })
+
+    assert colorizer.colorize(b"aab \\1") == b"\033[1maa\033[0mb \033[38;5;1m\\1\033[0m"
+
+    for pattern in [r"(\w)\1", r"(\w)\12", r"(a)?(?(1)b|c)"]:
+      with pytest.raises(re.error, match="named groups"):
+        Colorizer({ pattern: "bold" })
+
+  def test__octal_escapes(self):
+    colorizer = Colorizer({ r"a\0b": "red", r"\101": "bold", r"\0123": "faint" })
+
+    assert colorizer.colorize(b"a\0b A \n3") == (
+      b"\033[38;5;1ma\0b\033[0m \033[1mA\033[0m \033[2m\n3\033[0m"
+    )
+
+  def test__no_rules(self):
+    with pytest.raises(ValueError):
+      Colorizer()
+
+  @pytest.mark.parametrize('chunk_size', [1, 7, 16, 1024])
+  def test__chunks(self, colorizer, chunk_size):
+    chunks = list(colorizer.iter_chunks(io.BytesIO(LOG), chunk_size))
+
+    assert b"".join(chunks) == COLORED_LOG
+    if chunk_size >= 16:
+      assert all(len(chunk) < chunk_size * 4 for chunk in chunks)
+
+  @pytest.mark.parametrize('chunk_size', [1, 7, 1024])
+  def test__mmap(self, colorizer, tmp_path, chunk_size):
+    path = tmp_path / "log.txt"
+    path.write_bytes(LOG)
+
+    assert b"".join(colorizer.iter_mapped(path, chunk_size)) == COLORED_LOG
+
+    with open(path, "rb") as file:
+      assert b"".join(colorizer.iter_mapped(file, chunk_size)) == COLORED_LOG
+
+  def test__mmap_empty(self, colorizer, tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    assert list(colorizer.iter_mapped(path)) == []
+
+  def test__colorize_stream(self, colorizer):
+    destination = io.BytesIO()
+    colorizer.colorize_stream(io.BytesIO(LOG), destination, chunk_size=8, color=True)
+
+    assert destination.getvalue() == COLORED_LOG
+
+  def test__colorize_stream_no_color(self, colorizer, monkeypatch):
+    monkeypatch.setenv('NO_COLOR', 'true')
+    destination = io.BytesIO()
+
+    colorizer.colorize_stream(io.BytesIO(LOG), destination)
+
+    assert destination.getvalue() == LOG
+
+
+class TestCommandLine:
+  def test__files(self, tmp_path, capsysbinary):
+    path = tmp_path / "log.txt"
+    path.write_bytes(LOG)
+
+    assert main(["--color", "always", "-l", "-m", r"\d+ms", "bold yellow", str(path)]) == 0
+    assert capsysbinary.readouterr().out == COLORED_LOG
+
+    assert main(["--color", "always", "--mmap", str(path)]) == 0
+    assert capsysbinary.readouterr().out == COLORED_LOG.replace(b"\033[1;38;5;3m3ms\033[0m", b"3ms")
+
+  def test__no_color(self, tmp_path, capsysbinary):
+    path = tmp_path / "log.txt"
+    path.write_bytes(LOG)
+
+    assert main(["--color", "never", str(path)]) == 0
+    assert capsysbinary.readouterr().out == LOG
+
+  def test__invalid_arguments(self, capsys):
+    with pytest.raises(SystemExit):
+      main(["-m", "x", "unknown"])
+
+    with pytest.raises(SystemExit):
+      main(["-m", "(", "bold"])
+
+    with pytest.raises(SystemExit):
+      main(["-m", r"(\w)\1", "bold"])
+
+  def test__ignore_case(self, tmp_path, capsysbinary):
+    path = tmp_path / "app.log"
+    path.write_bytes(b"info: hello\n")
+
+    assert main(["-i", "--color", "always", str(path)]) == 0
+    assert capsysbinary.readouterr().out == b"\033[38;5;2minfo: hello\033[0m\n"
+
+  def test__missing_file(self, tmp_path, capsys):
+    assert main([str(tmp_path / "missing.txt")]) == 1
@@ -0,0 +1,141 @@
+import asyncio
+import contextvars
+import pytest
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pytermstyle import TermStyle, get_default_logger
+
+STYLES = {
+  "bold": "\033[1m{}\033[0m",
+  "fg_red": "\033[38;5;1m{}\033[0m",
+  "bg_blue": "\033[48;5;4m{}\033[0m",
+  "italic": "\033[3m{}\033[0m",
+}
+
+class TestThreadSafety:
+  @pytest.fixture(autouse=True)
+  def setup_before_after(self, monkeypatch):
+    monkeypatch.setenv('FORCE_COLOR', 'true')
+    get_default_logger().clear()
+
+    yield
+
+  def test__shared_logger_stress(self):
+    logger = get_default_logger()
+    barrier = threading.Barrier(8)
+    names = list(STYLES)
+
+    def worker(index):
+      barrier.wait()
+      errors = []
+
+      for iteration in range(2000):
+        name = names[(index + iteration) % len(names)]
+        text = f"{index}:{iteration}"
+
+        getattr(logger, name)()
+        rendered = logger.render(text)
+
+        if rendered != STYLES[name].format(text):
+          errors.append(rendered)
+
+        if logger.render(text) != text:
+          errors.append(text)
+
+      return errors
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+      results = list(executor.map(worker, range(8)))
+
+    assert results == [[]] * 8
+
+  def test__pending_style_not_shared(self):
+    logger = TermStyle()
+    logger.bold()
+
+    result = []
+    thread = threading.Thread(target=lambda: result.append(logger.render("text")))
+    thread.start()
+    thread.join()
+
+    assert result == ["text"]
+    assert logger.render("text") == STYLES["bold"].format("text")
+
+
+class TestContext:
+  def test__context_size_constant(self):
+    def chain_loggers(count: int) -> int:
+      for _ in range(count):
+        TermStyle().bold().render("text")
+
+      return len(contextvars.copy_context())
+
+    context = contextvars.Context()
+    size = context.run(chain_loggers, 10)
+
+    assert context.run(chain_loggers, 1000) == size
+
+  def test__pending_styles_per_logger(self):
+    first, second = TermStyle(), TermStyle()
+    first.bold()
+
+    try:
+      assert second.get_base_format() == ""
+      assert first.get_base_format() == "\033[1m"
+    finally:
+      first._clear_override()
+
+
+class TestAsyncSafety:
+  @pytest.fixture(autouse=True)
+  def setup_before_after(self, monkeypatch):
+    monkeypatch.setenv('FORCE_COLOR', 'true')
+
+    yield
+
+  def test__tasks_isolated(self):
+    logger = TermStyle()
+
+    async def styled(name):
+      getattr(logger, name)()
+      await asyncio.sleep(0)
+
+      return logger.render(name)
+
+    async def plain():
+      await asyncio.sleep(0)
+
+      return logger.render("plain")
+
+    async def main():
+      return await asyncio.gather(styled("bold"), plain(), styled("italic"), plain())
+
+    results = asyncio.run(main())
+
+    assert results == [
+      STYLES["bold"].format("bold"),
+      "plain",
+      STYLES["italic"].format("italic"),
+      "plain",
+    ]
+
+  def test__child_task_copy(self):
+    logger = TermStyle()
+
+    async def child():
+      logger.italic()
+
+      return logger.render("child")
+
+    async def main():
+      logger.bold()
+      child_result = await asyncio.create_task(child())
+
+      return child_result, logger.render("parent")
+
+    child_result, parent_result = asyncio.run(main())
+
+    assert child_result == "\033[1;3mchild\033[0m"
+    assert parent_result == STYLES["bold"].format("parent")
@@ -0,0 +1,87 @@
+import pytest
+
+from pytermstyle import TermStyle, TermSettings, build_format, format_cache_info, clear_format_cache, merge_keys
+from pytermstyle.formats import pack_styles, unpack_styles, pack_color, unpack_color, pack_rgb, unpack_rgb
+
+class TestFormatCache:
+  @pytest.fixture(autouse=True)
+  def setup_before_after(self, monkeypatch):
+    monkeypatch.setenv('FORCE_COLOR', 'true')
+    clear_format_cache()
+
+    yield
+
+  def test__build_format(self, mock_settings_config, texts):
+    settings = TermSettings(mock_settings_config)
+
+    assert build_format(settings.key()) == texts["startBaseFormat"]
+    assert build_format(TermSettings().key()) == ""
+
+  def test__cache_hits(self, mock_settings_config, texts):
+    logger = TermStyle(mock_settings_config)
+
+    assert logger.get_base_format() == texts["startBaseFormat"]
+    assert logger.get_base_format() == texts["startBaseFormat"]
+    assert TermStyle(mock_settings_config).get_base_format() == texts["startBaseFormat"]
+
+    info = format_cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+  def test__invalidate_on_change(self, mock_settings_config):
+    logger = TermStyle(mock_settings_config)
+    first = logger.get_base_format()
+
+    logger.configure({"style": ["bold"]})
+    assert logger.get_base_format() == "\033[1m"
+
+    logger.add_color("red", "foreground")
+    assert logger.get_base_format() == "\033[38;5;1m"
+
+    logger.add_style("italic")
+    assert logger.get_base_format() == "\033[3;38;5;1m"
+
+    logger.print(None)
+    assert logger.get_base_format() == "\033[1m"
+
+    logger.configure(mock_settings_config)
+    assert logger.get_base_format() == first
+
+  def test__clear_cache(self, mock_settings_config):
+    TermStyle(mock_settings_config).get_base_format()
+    clear_format_cache()
+
+    info = format_cache_info()
+    assert info.hits == 0
+    assert info.misses == 0
+    assert info.currsize == 0
+
+
+class TestPackedSettings:
+  def test__pack_styles(self):
+    mask = pack_styles(["underline", "bold", "bold"])
+
+    assert unpack_styles(mask) == ["bold", "underline"]
+    assert unpack_styles(0) == []
+
+  def test__pack_color(self):
+    assert unpack_color(pack_color("light-red")) == "light-red"
+    assert unpack_color(pack_color("196")) == "196"
+    assert pack_color("light-red") != pack_color("196")
+    assert unpack_rgb(pack_color("red")) is None
+
+    with pytest.raises(ValueError):
+      pack_color("unknown")
+
+  def test__pack_rgb(self):
+    packed = pack_rgb(["61", "217", "187"])
+
+    assert unpack_rgb(packed) == ["61", "217", "187"]
+    assert unpack_color(packed) is None
+    assert pack_rgb([61, 217, 187]) == packed
+
+  def test__merge_keys(self):
+    first = TermSettings({ "style": ["bold"], "foreground": { "color": "red" } }).key()
+    second = TermSettings({ "style": ["italic"], "background": { "color": "blue" } }).key()
+
+    assert build_format(merge_keys(first, second)) == "\033[1;3;38;5;1;48;5;4m"
@@ -0,0 +1,112 @@
+import pytest
+
+from pytermstyle import TermStyle, ColorException, color_support
+from pytermstyle.definitions import COLOR_RGB
+from pytermstyle.gradient import interpolate_rgb, pack_rgb_array, render_colored
+
+
+def packed(r: int, g: int, b: int) -> int:
+  return COLOR_RGB | (r << 16) | (g << 8) | b
+
+
+@pytest.fixture
+def force_color(monkeypatch):
+  monkeypatch.setenv('FORCE_COLOR', 'true')
+
+
+class TestColors:
+  def test__interpolate(self):
+    assert interpolate_rgb((255, 0, 0), (0, 0, 255), 3) == [packed(255, 0, 0), packed(128, 0, 128), packed(0, 0, 255)]
+    assert interpolate_rgb((10, 20, 30), (0, 0, 0), 1) == [packed(10, 20, 30)]
+    assert interpolate_rgb((10, 20, 30), (0, 0, 0), 0) == []
+
+  def test__interpolate_endpoints(self):
+    colors = interpolate_rgb((0, 0, 0), (255, 255, 255), 1000)
+
+    assert len(colors) == 1000
+    assert colors[0] == packed(0, 0, 0)
+    assert colors[-1] == packed(255, 255, 255)
+
+  def test__pack(self):
+    assert pack_rgb_array([(61, 217, 187), [0, 0, 0]]) == [packed(61, 217, 187), packed(0, 0, 0)]
+
+  @pytest.mark.parametrize('colors', [[(256, 0, 0)], [(-1, 0, 0)], [(1, 2)], [("1", 2, 3)], [(0.5, 2, 3)]])
+  def test__pack_invalid(self, colors):
+    with pytest.raises(ValueError):
+      pack_rgb_array(colors)
+
+  def test__numpy_array(self):
+    numpy = pytest.importorskip("numpy")
+
+    colors = numpy.array([[61, 217, 187], [255, 255, 255]], dtype=numpy.uint8)
+    assert pack_rgb_array(colors) == [packed(61, 217, 187), packed(255, 255, 255)]
+
+    with pytest.raises(ValueError):
+      pack_rgb_array(numpy.array([[300, 0, 0]]))
+
+
+class TestRenderColored:
+  def test__merge_runs(self):
+    red, blue = packed(255, 0, 0), packed(0, 0, 255)
+
+    assert render_colored("aabbba", [red, red, blue, blue, blue, red]) == (
+      "\033[38;2;255;0;0maa\033[38;2;0;0;255mbbb\033[38;2;255;0;0ma\033[0m"
+    )
+
+  def test__merge_converted_colors(self):
+    colors = [packed(255, 0, 0), packed(250, 5, 5), packed(0, 0, 250)]
+
+    assert render_colored("abc", colors, "background", "16") == "\033[101mab\033[44mc\033[0m"
+
+  def test__base_codes(self):
+    assert render_colored("a", [packed(1, 2, 3)], base_codes="1;4") == "\033[1;4m\033[38;2;1;2;3ma\033[0m"
+
+  def test__no_color(self):
+    assert render_colored("abc", [packed(1, 2, 3)] * 3, depth="none") == "abc"
+
+
+class TestTermStyle:
+  def test__gradient(self, force_color):
+    logger = TermStyle({"style": ["bold"], "foreground": {"color": "red"}})
+
+    assert logger.gradient("abc", (255, 0, 0), (0, 0, 255)) == (
+      "\033[1m\033[38;2;255;0;0ma\033[38;2;128;0;128mb\033[38;2;0;0;255mc\033[0m"
+    )
+
+  def test__gradient_chained(self, force_color):
+    logger = TermStyle()
+
+    rendered = logger.underline().bg_blue().gradient("ab", (0, 0, 0), (255, 255, 255), mode="background")
+    assert rendered == "\033[4m\033[48;2;0;0;0ma\033[48;2;255;255;255mb\033[0m"
+
+    assert logger.gradient("ab", (0, 0, 0), (0, 0, 0)) == "\033[38;2;0;0;0mab\033[0m"
+
+  def test__render_colors(self, force_color):
+    logger = TermStyle()
+
+    assert logger.render_colors("ab", [(1, 2, 3), (4, 5, 6)]) == "\033[38;2;1;2;3ma\033[38;2;4;5;6mb\033[0m"
+
+  def test__color_depth(self, force_color):
+    logger = TermStyle()
+
+    try:
+      color_support.force_depth("256")
+      assert logger.gradient("ab", (255, 0, 0), (250, 0, 0)) == "\033[38;5;196mab\033[0m"
+    finally:
+      color_support.force_depth(None)
+
+  def test__no_color(self):
+    logger = TermStyle()
+
+    assert logger.bold().gradient("abc", (255, 0, 0), (0, 0, 255)) == "abc"
+    assert logger.render_colors("ab", [(1, 2, 3), (4, 5, 6)]) == "ab"
+    assert logger.get_base_format() == ""
+
+  @pytest.mark.parametrize('colors', [[(1, 2, 3)], [(1, 2, 3), (256, 0, 0)]])
+  def test__invalid_colors(self, force_color, colors):
+    with pytest.raises(ColorException):
+      TermStyle().render_colors("ab", colors)
+
+  def test__invalid_gradient(self, force_color):
+    with pytest.raises(ColorException):
+      TermStyle().gradient("ab", (0, 0, 0), (0, 0, 300))
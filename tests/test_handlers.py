@@ -0,0 +1,124 @@
+import io
+import logging
+import threading
+import pytest
+
+from pytermstyle import TermStyleQueueHandler, TermStyleFormatter
+
+class BlockingStream(io.StringIO):
+  def __init__(self):
+    super().__init__()
+    self.release = threading.Event()
+    self.writes = 0
+
+  def write(self, text):
+    self.release.wait(5)
+    self.writes += 1
+
+    return super().write(text)
+
+@pytest.fixture
+def logger():
+  logger = logging.getLogger("pytermstyle.tests.handlers")
+  logger.propagate = False
+  logger.setLevel(logging.DEBUG)
+
+  yield logger
+
+  for handler in list(logger.handlers):
+    logger.removeHandler(handler)
+    handler.close()
+
+class TestQueueHandler:
+  @pytest.fixture(autouse=True)
+  def setup_before_after(self, monkeypatch):
+    monkeypatch.setenv('FORCE_COLOR', 'true')
+
+    yield
+
+  def test__colored_output(self, logger, texts):
+    stream = io.StringIO()
+    handler = TermStyleQueueHandler(stream)
+    logger.addHandler(handler)
+
+    logger.info("%s", texts["message"])
+    logger.error(texts["message"])
+    handler.stop()
+
+    assert stream.getvalue() == "".join([
+      "\033[38;5;2mINFO:pytermstyle.tests.handlers:\033[0m{}\n".format(texts["message"]),
+      "\033[38;5;1mERROR:pytermstyle.tests.handlers:\033[0m{}\n".format(texts["message"]),
+    ])
+
+  def test__custom_formatter(self, logger, texts):
+    stream = io.StringIO()
+    handler = TermStyleQueueHandler(stream, formatter=TermStyleFormatter("%(colorStart)s%(message)s%(colorEnd)s", fast=True))
+    logger.addHandler(handler)
+
+    logger.warning(texts["message"])
+    handler.stop()
+
+    assert stream.getvalue() == "\033[38;5;3m{}\033[0m\n".format(texts["message"])
+
+  def test__arguments_merged_on_call(self, logger):
+    stream = io.StringIO()
+    handler = TermStyleQueueHandler(stream, formatter=logging.Formatter("%(message)s"), start=False)
+    logger.addHandler(handler)
+
+    values = [1]
+    logger.info("%s", values)
+    values.append(2)
+
+    handler.start()
+    handler.stop()
+
+    assert stream.getvalue() == "[1]\n"
+
+  def test__batched_writes(self, logger):
+    stream = BlockingStream()
+    handler = TermStyleQueueHandler(stream, formatter=logging.Formatter("%(message)s"), start=False)
+    logger.addHandler(handler)
+
+    for index in range(100):
+      logger.info(str(index))
+
+    stream.release.set()
+    handler.start()
+    handler.stop()
+
+    assert stream.writes == 1
+    assert stream.getvalue() == "".join(f"{index}\n" for index in range(100))
+    assert handler.max_queue_depth == 100
+    assert handler.queue_depth == 0
+
+  def test__drop_policy(self, logger):
+    stream = io.StringIO()
+    handler = TermStyleQueueHandler(stream, maxsize=3, policy="drop", formatter=logging.Formatter("%(message)s"), start=False)
+    logger.addHandler(handler)
+
+    for index in range(5):
+      logger.info(str(index))
+
+    assert handler.dropped == 2
+    assert handler.queue_depth == 3
+
+    handler.start()
+    handler.stop()
+
+    assert stream.getvalue() == "0\n1\n2\n"
+
+  def test__block_policy_timeout(self, logger):
+    handler = TermStyleQueueHandler(io.StringIO(), maxsize=1, timeout=0.01, start=False)
+    logger.addHandler(handler)
+
+    logger.info("first")
+    logger.info("second")
+
+    assert handler.dropped == 1
+
+  def test__invalid_arguments(self):
+    with pytest.raises(ValueError):
+      TermStyleQueueHandler(policy="unknown", start=False)  # type: ignore
+
+    with pytest.raises(ValueError):
+      TermStyleQueueHandler(maxsize=0, start=False)
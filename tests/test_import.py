@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pytermstyle
+
+# Generous limit, which is exceeded only when heavy modules are imported eagerly
+IMPORT_TIME_BUDGET_US = 100_000
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+  env = dict(os.environ, PYTHONPATH=SRC)
+  return subprocess.run(
+    [sys.executable, *args, "-c", code], env=env, capture_output=True, text=True, check=True
+  )
+
+
+class TestLazyImport:
+  @pytest.mark.parametrize('name', pytermstyle.__all__)
+  def test__public_attributes(self, name):
+    assert getattr(pytermstyle, name) is not None
+
+  def test__dir(self):
+    assert set(pytermstyle.__all__) <= set(dir(pytermstyle))
+
+  def test__unknown_attribute(self):
+    with pytest.raises(AttributeError):
+      pytermstyle.unknown_attribute
+
+  def test__submodules(self):
+    result = run_python(
+      "import pytermstyle; "
+      "print(pytermstyle.utils.unique([1, 1]), pytermstyle.settings.TermSettings.__name__, "
+      "pytermstyle.logger.__name__, pytermstyle.definitions.RESET == pytermstyle.RESET, "
+      "pytermstyle.pytermstyle.TermStyle is pytermstyle.TermStyle)"
+    )
+
+    assert result.stdout.strip() == "[1] TermSettings pytermstyle.logger True True"
+
+  def test__heavy_modules_not_imported(self):
+    result = run_python(
+      "import sys, pytermstyle; pytermstyle.TermStyle; "
+      "print(' '.join(name for name in ['logging', 'asyncio', 'numpy'] if name in sys.modules))"
+    )
+
+    assert result.stdout.strip() == ""
+
+  def test__import_time(self):
+    result = run_python("import pytermstyle", "-X", "importtime")
+
+    for line in result.stderr.splitlines():
+      # "import time: self [us] | cumulative | imported package"
+      _, cumulative, name = line.split("|")
+      if name.strip() == "pytermstyle":
+        assert int(cumulative) < IMPORT_TIME_BUDGET_US
+        return
+
+    pytest.fail("import time of pytermstyle is not reported")
@@ -1,7 +1,7 @@
 import pytest
 import logging
 
-from pytermstyle import create_logger, TermStyleRecord, TermStyleFormatter, basicConfig
+from pytermstyle import create_logger, TermStyleRecord, TermStyleFormatter, TermConfigException, basicConfig
 
 class TestRecord:
   @pytest.fixture(autouse=True)
@@ -62,7 +62,150 @@ class TestFormatter:
 
     assert formatter.formatMessage(mock_record) == colored["customFormatMessage"]
   
+  def test__fast_default_settings(self, mock_record, colored, texts):
+    formatter = TermStyleFormatter(fast=True)
+    mock_record.message = texts["message"]
+
+    assert formatter.formatMessage(mock_record) == colored["defaultLoggerSettings"]
+
+  def test__fast_custom_settings(self, mock_record, colored, texts):
+    formatter = TermStyleFormatter(settings={ "INFO": { "style": ["bold"] } }, fast=True)
+    mock_record.message = texts["message"]
+
+    assert formatter.formatMessage(mock_record) == colored["customLoggerSettings"]
+
+  def test__fast_no_color(self, mock_record, texts, monkeypatch):
+    monkeypatch.delenv('FORCE_COLOR')
+    monkeypatch.setenv('NO_COLOR', 'true')
+
+    formatter = TermStyleFormatter(fast=True)
+    mock_record.message = texts["message"]
+
+    assert formatter.formatMessage(mock_record) == "INFO:MockRecord:{}".format(texts["message"])
+
+  @pytest.mark.parametrize('fast', [True, False])
+  def test__unknown_level(self, mock_record, texts, fast, level_names):
+    logging.addLevelName(25, "NOTICE")
+    mock_record.levelno, mock_record.levelname = 25, "NOTICE"
+    mock_record.message = texts["message"]
+
+    formatter = TermStyleFormatter(fast=fast)
+
+    assert formatter.formatMessage(mock_record) == "NOTICE:MockRecord:{}".format(texts["message"])
+
+  @pytest.mark.parametrize('fast', [True, False])
+  def test__critical_settings(self, mock_record, texts, fast):
+    mock_record.levelno, mock_record.levelname = logging.CRITICAL, "CRITICAL"
+    mock_record.message = texts["message"]
+
+    formatter = TermStyleFormatter(fast=fast)
+
+    assert formatter.formatMessage(mock_record) == "\033[1;38;5;1mCRITICAL:MockRecord:\033[0m{}".format(texts["message"])
+
+  @pytest.mark.parametrize('fast', [True, False])
+  def test__custom_levels(self, mock_record, texts, fast, level_names):
+    logging.addLevelName(15, "TRACE")
+    formatter = TermStyleFormatter(
+      settings={"TRACE": {"style": ["faint"]}, 35: {"foreground": {"color": "orange"}}},
+      fast=fast
+    )
+    mock_record.message = texts["message"]
+
+    mock_record.levelno, mock_record.levelname = 15, "TRACE"
+    assert formatter.formatMessage(mock_record) == "\033[2mTRACE:MockRecord:\033[0m{}".format(texts["message"])
+
+    mock_record.levelno, mock_record.levelname = 35, "Level 35"
+    assert formatter.formatMessage(mock_record) == "\033[38;5;214mLevel 35:MockRecord:\033[0m{}".format(texts["message"])
+
+  def test__level_table(self):
+    formatter = TermStyleFormatter(settings={logging.INFO: {"style": ["bold"]}})
+
+    assert formatter.get_level_colors(logging.INFO) == ("\033[1m", "\033[0m")
+    assert formatter.get_level_colors(logging.ERROR) == ("\033[38;5;1m", "\033[0m")
+    assert formatter.get_level_colors(logging.NOTSET) == ("", "")
+    assert formatter.get_level_colors(42) == ("", "")
+
+  @pytest.mark.parametrize('settings', [
+    {"UNKNOWN_LEVEL": {"style": ["bold"]}},
+    {"INFO": {"styles": ["bold"]}},
+    {"INFO": {"style": ["unknown"]}},
+    {"INFO": {"foreground": {"color": "unknown"}}},
+    {"INFO": "bold"},
+  ])
+  def test__invalid_settings(self, settings):
+    with pytest.raises(TermConfigException):
+      TermStyleFormatter(settings=settings)
+
   def test__basic_config(self):
     basicConfig()
 
     assert type(logging.root.handlers[0].formatter) is TermStyleFormatter
+
+
+class TestRegions:
+  FORMAT = "%(levelColor)s%(levelname)s%(reset)s %(dim)s%(name)s%(reset)s %(message)s"
+
+  @pytest.fixture(autouse=True)
+  def setup_before_after(self, monkeypatch):
+    monkeypatch.setenv('FORCE_COLOR', 'true')
+
+    yield
+
+  @pytest.mark.parametrize('fast', [True, False])
+  def test__regions(self, mock_record, texts, fast):
+    formatter = TermStyleFormatter(self.FORMAT, regions={"dim": "faint"}, fast=fast)
+    mock_record.message = texts["message"]
+
+    assert formatter.formatMessage(mock_record) == (
+      "\033[38;5;2mINFO\033[0m \033[2mMockRecord\033[0m {}".format(texts["message"])
+    )
+
+  @pytest.mark.parametrize('style, fmt', [
+    ("{", "{levelColor}{levelname}{reset} {dim}{name}{reset} {message}"),
+    ("$", "${levelColor}${levelname}${reset} ${dim}${name}${reset} ${message}"),
+  ])
+  def test__format_styles(self, mock_record, texts, style, fmt):
+    formatter = TermStyleFormatter(fmt, style=style, regions={"dim": "faint"})
+    mock_record.message = texts["message"]
+
+    assert formatter.formatMessage(mock_record) == (
+      "\033[38;5;2mINFO\033[0m \033[2mMockRecord\033[0m {}".format(texts["message"])
+    )
+
+  @pytest.mark.parametrize('fast', [True, False])
+  def test__record_not_modified(self, mock_record, texts, fast):
+    formatter = TermStyleFormatter(self.FORMAT, regions={"dim": "faint"}, fast=fast)
+    mock_record.message = texts["message"]
+    attributes = dict(mock_record.__dict__)
+
+    formatter.formatMessage(mock_record)
+
+    assert mock_record.__dict__ == attributes
+
+  def test__no_color(self, mock_record, texts, monkeypatch):
+    monkeypatch.delenv('FORCE_COLOR')
+    monkeypatch.setenv('NO_COLOR', 'true')
+
+    formatter = TermStyleFormatter(self.FORMAT, regions={"dim": "faint"})
+    mock_record.message = texts["message"]
+
+    assert formatter.formatMessage(mock_record) == "INFO MockRecord {}".format(texts["message"])
+    assert formatter.get_region_values() == {"dim": "", "reset": ""}
+
+  def test__missing_field(self, mock_record):
+    formatter = TermStyleFormatter("%(unknown)s %(message)s")
+    mock_record.message = ""
+
+    with pytest.raises(ValueError):
+      formatter.formatMessage(mock_record)
+
+  def test__defaults(self, mock_record):
+    formatter = TermStyleFormatter("%(region)s%(message)s", defaults={"region": "-"})
+    mock_record.message = "text"
+
+    assert formatter.formatMessage(mock_record) == "-text"
+
+  @pytest.mark.parametrize('regions', [{"reset": "bold"}, {"levelColor": "red"}, {"dim": "unknown"}])
+  def test__invalid_regions(self, regions):
+    with pytest.raises(TermConfigException):
+      TermStyleFormatter(regions=regions)
@@ -0,0 +1,63 @@
+import pytest
+
+from pytermstyle import TermStyle, TermConfigException, MarkupTemplate, compile_markup, markup
+
+
+@pytest.fixture
+def force_color(monkeypatch):
+  monkeypatch.setenv('FORCE_COLOR', 'true')
+
+
+class TestMarkup:
+  def test__markup(self, force_color):
+    assert markup("[bold red]ERROR[/] user [cyan]{id}[/]", id=42) == (
+      "\033[1;38;5;1mERROR\033[0m user \033[38;5;6m42\033[0m"
+    )
+
+  def test__nested(self, force_color):
+    assert markup("[bold]a [red on blue]b[/] c[/]") == "\033[1ma \033[38;5;1;48;5;4mb\033[0;1m c\033[0m"
+
+  def test__unclosed(self, force_color):
+    assert markup("[underline #3dd9bb]open") == "\033[4;38;2;61;217;187mopen\033[0m"
+
+  def test__named_closing_tag(self, force_color):
+    assert markup("[italic]a[/italic]b") == "\033[3ma\033[0mb"
+
+  def test__literal_brackets(self, force_color):
+    assert markup("items[0] [note] \\[bold] []") == "items[0] [note] [bold] []"
+
+  def test__arguments_not_parsed(self, force_color):
+    assert markup("[green]{}[/] {value}", "[bold]", value="[/]") == "\033[38;5;2m[bold]\033[0m [/]"
+
+  def test__unmatched_closing_tag(self):
+    with pytest.raises(TermConfigException):
+      markup("text[/]")
+
+  def test__no_color(self):
+    assert markup("[bold red]ERROR[/] user [cyan]{id}[/]", id=42) == "ERROR user 42"
+
+
+class TestCompiledTemplate:
+  def test__cached(self):
+    template = compile_markup("[bold]cached {}[/]")
+
+    assert isinstance(template, MarkupTemplate)
+    assert compile_markup("[bold]cached {}[/]") is template
+
+  def test__format_string(self):
+    template = compile_markup("[bold #ff0000]{}[/]")
+
+    assert template.format_string() == "\033[1;38;2;255;0;0m{}\033[0m"
+    assert template.format_string("256") == "\033[1;38;5;196m{}\033[0m"
+    assert template.format_string("none") == "{}"
+    assert template.format_string() is template.format_string()
+
+
+class TestTermStyle:
+  def test__markup(self, force_color):
+    logger = TermStyle()
+
+    assert logger.markup("[strike]{}[/]", "done") == "\033[9mdone\033[0m"
+
+  def test__no_color(self):
+    assert TermStyle().markup("[strike]{}[/]", "done") == "done"
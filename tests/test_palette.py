@@ -0,0 +1,77 @@
+import pytest
+
+from pytermstyle import TermSettings, build_format
+from pytermstyle.palette import (
+  PALETTE_16, PALETTE_256, rgb_to_256, rgb_to_16, color_256_to_16, get_16_color_code
+)
+
+
+class TestPalette:
+  def test__palette_size(self):
+    assert len(PALETTE_256) == 256
+    assert PALETTE_256[:16] == PALETTE_16
+    assert PALETTE_256[16] == (0, 0, 0)
+    assert PALETTE_256[231] == (255, 255, 255)
+    assert PALETTE_256[232] == (8, 8, 8)
+    assert PALETTE_256[255] == (238, 238, 238)
+
+  @pytest.mark.parametrize('code', [16, 21, 79, 196, 208, 231, 232, 244, 255])
+  def test__palette_colors_are_exact(self, code: int):
+    assert rgb_to_256(*PALETTE_256[code]) == code
+
+  @pytest.mark.parametrize('rgb, code', [
+    ((61, 217, 187), 79),
+    ((250, 0, 0), 196),
+    ((128, 128, 128), 244),
+    ((30, 30, 30), 234),
+  ])
+  def test__rgb_to_256(self, rgb, code):
+    assert rgb_to_256(*rgb) == code
+
+  @pytest.mark.parametrize('rgb, index', [
+    ((0, 0, 0), 0),
+    ((200, 10, 10), 1),
+    ((250, 250, 250), 15),
+    ((120, 120, 130), 8),
+    ((0, 30, 240), 4),
+  ])
+  def test__rgb_to_16(self, rgb, index):
+    assert rgb_to_16(*rgb) == index
+
+  def test__256_to_16(self):
+    assert [color_256_to_16(code) for code in range(16)] == list(range(16))
+    assert color_256_to_16(196) == 9
+    assert color_256_to_16(16) == 0
+    assert color_256_to_16(231) == 15
+
+  def test__memoized(self):
+    rgb_to_256.cache_clear()
+
+    for _ in range(3):
+      rgb_to_256(10, 20, 30)
+
+    assert rgb_to_256.cache_info().hits == 2
+
+  @pytest.mark.parametrize('index, mode, code', [
+    (1, "foreground", "31"),
+    (1, "background", "41"),
+    (9, "foreground", "91"),
+    (15, "background", "107"),
+  ])
+  def test__16_color_code(self, index, mode, code):
+    assert get_16_color_code(index, mode) == code
+
+
+class TestFormatDepth:
+  def test__depths(self, mock_settings_config, texts):
+    key = TermSettings(mock_settings_config).key()
+
+    assert build_format(key, "truecolor") == texts["startBaseFormat"]
+    assert build_format(key, "256") == "\033[1;3;4;38;5;80;48;5;5m"
+    assert build_format(key, "16") == "\033[1;3;4;36;45m"
+    assert build_format(key, "none") == ""
+
+  def test__styles_unchanged(self):
+    key = TermSettings({"style": ["bold", "underline"]}).key()
+
+    assert build_format(key, "16") == build_format(key) == "\033[1;4m"
@@ -1,6 +1,8 @@
+
+import copy
 import pytest
 
-from pytermstyle import TermConfigException, TermSettings
+from pytermstyle import TermConfigException, TermSettings, CompiledSettings
 
 @pytest.fixture
 def invalid_config():
@@ -181,3 +183,114 @@ class TestSettings:
     ]))
 
     assert str(te.value) == expected_text
+
+  def test__settings_key(self, mock_settings_config):
+    settings = TermSettings(mock_settings_config)
+    key = settings.key()
+
+    assert key == TermSettings(mock_settings_config).key()
+    assert hash(key) == hash(TermSettings(mock_settings_config).key())
+    assert settings.key() is key
+
+    settings.add_style("bold")
+    assert settings.key() == key
+
+    settings.add_style("framed")
+    assert settings.key() != key
+
+    settings.add_rgb(["1", "2", "3"], "background")
+    assert settings.key() != TermSettings(mock_settings_config).key()
+
+    settings.clear()
+    assert settings.key() == TermSettings().key()
+
+  def test__copy_settings(self, mock_settings_config):
+    settings = TermSettings(mock_settings_config)
+    copied = settings.copy()
+
+    assert repr(copied) == repr(settings)
+    assert copied.key() == settings.key()
+
+    copied.add_style("framed")
+    copied.add_color("red", "background")
+
+    assert settings.styles() == ["bold", "italic", "underline"]
+    assert settings.color("background") == "magenta"
+
+  def test__compact_settings(self, mock_settings_config):
+    settings = TermSettings(mock_settings_config)
+
+    assert not hasattr(settings, "__dict__")
+    assert settings.key() == TermSettings(mock_settings_config).key()
+    assert settings.key() != TermSettings().key()
+    assert settings.as_dict() == mock_settings_config
+    assert TermSettings(settings.as_dict()).key() == settings.key()
+
+  def test__duplicate_styles(self):
+    settings = TermSettings({ "style": ["underline", "bold", "underline"] })
+
+    assert settings.styles() == ["bold", "underline"]
+    assert settings.key() == TermSettings({ "style": ["bold", "underline"] }).key()
+
+  def test__identity(self, mock_settings_config):
+    settings = TermSettings(mock_settings_config)
+
+    assert settings != TermSettings(mock_settings_config)
+    assert { settings: "bold" }[settings] == "bold"
+
+    compiled = TermSettings.compile(mock_settings_config)
+    assert compiled == TermSettings.compile(settings)
+    assert compiled != settings
+
+  def test__color_code(self):
+    settings = TermSettings({ "foreground": { "color": "200" } })
+    assert settings.color("foreground") == "200"
+
+    settings.add_rgb([61, 217, 217], "foreground") # type: ignore
+    assert settings.rgb("foreground") == ["61", "217", "217"]
+    assert settings.color("foreground") is None
+
+class TestCompiledSettings:
+  def test__compile(self, mock_settings_config):
+    compiled = TermSettings.compile(mock_settings_config)
+
+    assert isinstance(compiled, CompiledSettings)
+    assert compiled.key() == TermSettings(mock_settings_config).key()
+    assert compiled.as_dict() == mock_settings_config
+    assert hash(compiled) == hash(compiled.key())
+
+  def test__same_content(self, mock_settings_config):
+    compiled = TermSettings.compile(mock_settings_config)
+
+    assert TermSettings.compile(copy.deepcopy(mock_settings_config)) is compiled
+    assert TermSettings.compile(TermSettings(mock_settings_config)) is compiled
+    assert TermSettings.compile(compiled) is compiled
+    assert TermSettings.compile({ "style": ["bold"] }) is not compiled
+    assert TermSettings.compile() is TermSettings.compile({})
+
+  def test__invalid_settings(self, invalid_config):
+    with pytest.raises(TermConfigException):
+      TermSettings.compile(invalid_config)
+
+  def test__immutable(self, mock_settings_config):
+    compiled = TermSettings.compile(mock_settings_config)
+
+    for modify in [
+      lambda: compiled.add_style("framed"),
+      lambda: compiled.add_color("red", "foreground"),
+      lambda: compiled.add_rgb(["1", "2", "3"], "background"),
+      compiled.clear,
+    ]:
+      with pytest.raises(TermConfigException):
+        modify()
+
+    assert compiled.key() == TermSettings(mock_settings_config).key()
+
+  def test__modifiable_copy(self, mock_settings_config):
+    compiled = TermSettings.compile(mock_settings_config)
+    copied = compiled.copy()
+
+    assert not isinstance(copied, CompiledSettings)
+
+    copied.add_style("framed")
+    assert copied != compiled
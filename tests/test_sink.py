@@ -0,0 +1,139 @@
+import io
+import time
+import pytest
+
+from pytermstyle import OutputSink, TermStyle, create_logger
+
+from .conftest import newline
+
+class TestOutputSink:
+  def test__buffer_size(self):
+    target = io.StringIO()
+    sink = OutputSink(target, buffer_size=10)
+
+    sink.write("12345")
+    assert target.getvalue() == ""
+    assert sink.pending == 5
+
+    sink.write("67890")
+    assert target.getvalue() == "1234567890"
+    assert sink.pending == 0
+
+  def test__unbuffered(self):
+    target = io.StringIO()
+    sink = OutputSink(target, buffer_size=0)
+
+    sink.write("text")
+    assert target.getvalue() == "text"
+
+  def test__explicit_flush(self):
+    target = io.StringIO()
+    sink = OutputSink(target)
+
+    sink.write("first ")
+    sink.write("second")
+    assert target.getvalue() == ""
+
+    sink.flush()
+    assert target.getvalue() == "first second"
+
+  def test__flush_interval(self):
+    target = io.StringIO()
+    sink = OutputSink(target, flush_interval=0.01)
+
+    sink.write("text")
+    assert target.getvalue() == ""
+
+    deadline = time.monotonic() + 5
+    while not target.getvalue() and time.monotonic() < deadline:
+      time.sleep(0.01)
+
+    assert target.getvalue() == "text"
+
+  def test__binary_target(self):
+    target = io.BytesIO()
+
+    with OutputSink(target) as sink:
+      sink.write("\033[1mtext\033[0m")
+
+    assert target.getvalue() == b"\033[1mtext\033[0m"
+    assert sink.closed == True
+
+    with pytest.raises(ValueError):
+      sink.write("text")
+
+  def test__callable_target(self):
+    chunks = []
+    sink = OutputSink(chunks.append, buffer_size=0)
+
+    sink.write("text")
+    assert chunks == ["text"]
+    assert sink.isatty() == False
+
+  def test__invalid_arguments(self):
+    with pytest.raises(TypeError):
+      OutputSink(1)
+
+    with pytest.raises(ValueError):
+      OutputSink(buffer_size=-1)
+
+    with pytest.raises(ValueError):
+      OutputSink(flush_interval=0)
+
+
+class TestLoggerSink:
+  @pytest.fixture(autouse=True)
+  def setup_before_after(self, monkeypatch):
+    monkeypatch.setenv('FORCE_COLOR', 'true')
+
+    yield
+
+  def test__logger_sink(self, capsys, colored, texts, mock_settings_config):
+    target = io.StringIO()
+    logger = TermStyle(mock_settings_config, sink=target)
+
+    logger(texts["message"])
+    logger.bold(texts["message"], end="")
+    assert target.getvalue() == ""
+
+    logger.flush()
+    assert target.getvalue() == newline(colored["defaultSettings"]) + colored["style"].format(1)
+    assert capsys.readouterr().out == ""
+
+  def test__print_flush(self, texts):
+    target = io.StringIO()
+    logger = create_logger(sink=target)
+
+    logger(texts["message"], flush=True)
+    assert target.getvalue() == newline(texts["message"])
+
+  def test__explicit_file(self, capsys, texts):
+    target = io.StringIO()
+    logger = create_logger(sink=target)
+
+    logger(texts["message"], file=io.StringIO())
+    logger.flush()
+    assert target.getvalue() == ""
+
+  def test__print_many(self, texts):
+    target = io.StringIO()
+    logger = create_logger({ "style": ["bold"] }, sink=OutputSink(target, buffer_size=0))
+
+    logger.print_many([texts["message"]] * 2, chunk_size=1)
+    assert target.getvalue() == newline(colored_bold(texts["message"])) * 2
+
+  def test__set_sink(self, capsys, texts):
+    target = io.StringIO()
+    logger = create_logger(sink=target)
+
+    logger(texts["message"])
+    logger.set_sink(None)
+    assert target.getvalue() == newline(texts["message"])
+    assert logger.sink is None
+
+    logger(texts["message"])
+    assert capsys.readouterr().out == newline(texts["message"])
+
+
+def colored_bold(text):
+  return f"\033[1m{text}\033[0m"
@@ -0,0 +1,93 @@
+import pytest
+
+from pytermstyle import TermStyle, Style, TermSettings, render_spans, sgr_transition
+
+
+def key(spec: str):
+  return Style.parse(spec).key
+
+
+EMPTY = (0, 0, 0)
+
+
+class TestTransition:
+  @pytest.mark.parametrize('previous, current, sequence', [
+    ("red", "green", "\033[38;5;2m"),
+    ("bold red", "red", "\033[22m"),
+    ("bold faint red", "faint red", "\033[22;2m"),
+    ("italic underline", "underline", "\033[23m"),
+    ("slow_blink rapid_blink red", "rapid_blink red", "\033[25;6m"),
+    ("framed red", "encircled red", "\033[54;52m"),
+    ("overlined strike on 200", "conceal on 200", "\033[29;55;8m"),
+    ("framed", "encircled", "\033[0;52m"),
+    ("red on blue", "red", "\033[49m"),
+    ("red on blue", "on blue", "\033[39m"),
+    ("bold", "bold underline", "\033[4m"),
+    ("#3dd9bb", "#3dd9bc", "\033[38;2;61;217;188m"),
+  ])
+  def test__delta(self, previous, current, sequence):
+    assert sgr_transition(key(previous), key(current)) == sequence
+
+  def test__reset_when_shorter(self):
+    previous = key("bold italic underline strike red on blue")
+
+    assert sgr_transition(previous, key("green")) == "\033[0;38;5;2m"
+
+  def test__from_and_to_plain(self):
+    assert sgr_transition(EMPTY, key("bold red")) == "\033[1;38;5;1m"
+    assert sgr_transition(key("bold red"), EMPTY) == "\033[0m"
+    assert sgr_transition(key("red"), key("red")) == ""
+
+  def test__color_depth(self):
+    # Both colors are converted to the same 8-bit color
+    assert sgr_transition(key("bold #ff0000"), key("#fe0000"), "256") == "\033[22m"
+    assert sgr_transition(key("red"), key("green"), "none") == ""
+
+
+class TestRenderSpans:
+  def test__render(self):
+    spans = [
+      ("ERROR", "bold red"),
+      (" user ", None),
+      ("42", "cyan"),
+      (" ", Style.parse("bold cyan")),
+      ("!", {"style": ["bold"], "foreground": {"color": "cyan"}}),
+      ("?", TermSettings({"foreground": {"color": "cyan"}})),
+    ]
+
+    assert render_spans(spans) == (
+      "\033[1;38;5;1mERROR\033[0m user \033[38;5;6m42\033[1m !\033[22m?\033[0m"
+    )
+
+  def test__empty_spans(self):
+    assert render_spans([]) == ""
+    assert render_spans([("", "bold"), ("plain", None)]) == "plain"
+    assert render_spans([("a", "bold"), ("", "red"), ("b", "bold")]) == "\033[1mab\033[0m"
+
+  def test__no_color(self):
+    assert render_spans([("a", "bold"), ("b", "red")], "none") == "ab"
+
+  def test__shorter_than_separate_segments(self):
+    styles = [Style.parse(spec) for spec in ["bold red", "red", "bold green", "green on blue"]]
+    spans = [(f"cell{index}", styles[index % len(styles)]) for index in range(100)]
+
+    separate = "".join(style.format() + text + "\033[0m" for text, style in spans)
+    rendered = render_spans(spans)
+
+    assert len(rendered) < len(separate) * 0.75
+
+
+class TestTermStyle:
+  def test__render_spans(self, monkeypatch):
+    monkeypatch.setenv('FORCE_COLOR', 'true')
+    logger = TermStyle({"style": ["underline"]})
+
+    assert logger.render_spans([("a", None), ("b", "underline red")]) == "\033[4ma\033[38;5;1mb\033[0m"
+    assert logger.bold().render_spans([("a", None), ("b", "bold")]) == "\033[1mab\033[0m"
+    assert logger.render_spans([("a", None)]) == "\033[4ma\033[0m"
+
+  def test__no_color(self):
+    logger = TermStyle()
+
+    assert logger.bold().render_spans([("a", None), ("b", "red")]) == "ab"
+    assert logger.get_base_format() == ""
@@ -0,0 +1,174 @@
+import logging
+import sys
+
+import pytest
+
+from pytermstyle import TermStyleFormatter, TermStyleStructuredFormatter, TermConfigException, color_support
+
+
+def make_record(msg="User logged in", level=logging.INFO, args=None, **extra):
+  record = logging.LogRecord("app", level, "", 1, msg, args, None)
+  record.__dict__.update(extra)
+
+  return record
+
+
+@pytest.fixture
+def force_color(monkeypatch):
+  monkeypatch.setenv('FORCE_COLOR', 'true')
+
+
+class TestStructuredFormatter:
+  def test__colored(self, force_color):
+    formatter = TermStyleStructuredFormatter()
+    record = make_record(user=42, admin=False, ratio=0.5, team=None, tags=["a"])
+
+    assert formatter.format(record) == (
+      "\033[2mlevel\033[0m=\033[38;5;2mINFO\033[0m "
+      "\033[2mlogger\033[0m=app "
+      "\033[2mmsg\033[0m=\"User logged in\" "
+      "\033[2muser\033[0m=\033[38;5;6m42\033[0m "
+      "\033[2madmin\033[0m=\033[38;5;5mfalse\033[0m "
+      "\033[2mratio\033[0m=\033[38;5;6m0.5\033[0m "
+      "\033[2mteam\033[0m=\033[2mnull\033[0m "
+      "\033[2mtags\033[0m=['a']"
+    )
+
+  def test__no_color(self):
+    formatter = TermStyleStructuredFormatter()
+    record = make_record("Value %s", args=("x",), user=42, admin=True)
+
+    assert formatter.format(record) == 'level=INFO logger=app msg="Value x" user=42 admin=true'
+
+  @pytest.mark.parametrize('value, text', [
+    ("plain", "plain"),
+    ("", '""'),
+    ("a=b", '"a=b"'),
+    ('say "hi"', '"say \\"hi\\""'),
+    ("C:\\path", '"C:\\\\path"'),
+    ("two\nlines", '"two\\nlines"'),
+  ])
+  def test__quoting(self, value, text):
+    formatter = TermStyleStructuredFormatter(["message"])
+
+    assert formatter.format(make_record(value)) == f"msg={text}"
+
+  def test__fields(self):
+    formatter = TermStyleStructuredFormatter({"levelname": "severity", "lineno": "line"}, extra=False)
+
+    assert formatter.format(make_record(user=42)) == "severity=INFO line=1"
+
+  def test__extra_in_fields(self):
+    formatter = TermStyleStructuredFormatter(["levelname", "user", "message"])
+
+    assert formatter.format(make_record(user=42, admin=True)) == 'level=INFO user=42 msg="User logged in" admin=true'
+
+  def test__custom_record(self):
+    class AuditRecord(logging.LogRecord):
+      # Record with only attributes used by the formatter
+      def __init__(self, msg, **extra):
+        self.__dict__.update(extra)
+        self.name, self.msg, self.args = "audit", msg, None
+        self.levelno, self.levelname = logging.INFO, "INFO"
+        self.exc_info = self.exc_text = self.stack_info = None
+
+    formatter = TermStyleStructuredFormatter()
+
+    assert formatter.format(AuditRecord("Deleted", user=42)) == "level=INFO logger=audit msg=Deleted user=42"
+
+  def test__time(self):
+    formatter = TermStyleStructuredFormatter(["asctime", "message"], datefmt="%Y")
+    record = make_record("text")
+    record.created = 0
+
+    assert formatter.format(record) == f"time={formatter.formatTime(record, '%Y')} msg=text"
+
+  def test__level_settings(self, force_color):
+    formatter = TermStyleStructuredFormatter(["levelname"], settings={"INFO": {"style": ["bold"]}})
+
+    assert formatter.format(make_record()) == "\033[2mlevel\033[0m=\033[1mINFO\033[0m"
+    assert formatter.format(make_record(level=logging.ERROR)) == "\033[2mlevel\033[0m=\033[38;5;1mERROR\033[0m"
+
+  def test__value_styles(self, force_color):
+    formatter = TermStyleStructuredFormatter(["lineno"], styles={"key": "", "number": "bold yellow"})
+
+    assert formatter.format(make_record()) == "lineno=\033[1;38;5;3m1\033[0m"
+
+  def test__color_depth(self, force_color):
+    formatter = TermStyleStructuredFormatter(["lineno"], styles={"number": "#ff0000"})
+
+    try:
+      color_support.force_depth("16")
+      assert formatter.format(make_record()) == "\033[2mlineno\033[0m=\033[91m1\033[0m"
+    finally:
+      color_support.force_depth(None)
+
+    assert formatter.format(make_record()) == "\033[2mlineno\033[0m=\033[38;2;255;0;0m1\033[0m"
+
+  @pytest.mark.parametrize('styles', [{"unknown": "bold"}, {"key": "bold unknown"}])
+  def test__invalid_styles(self, styles):
+    with pytest.raises(TermConfigException):
+      TermStyleStructuredFormatter(styles=styles)
+
+  def test__exception(self):
+    formatter = TermStyleStructuredFormatter(["message"])
+
+    try:
+      raise ValueError("failed")
+    except ValueError:
+      record = logging.LogRecord("app", logging.ERROR, "", 1, "error", None, sys.exc_info())
+
+    formatted = formatter.format(record)
+
+    assert formatted.startswith('msg=error exc="Traceback (most recent call last):\\n')
+    assert formatted.endswith('ValueError: failed"')
+    assert "\n" not in formatted
+
+  def test__logging(self, force_color):
+    records = []
+
+    class Handler(logging.Handler):
+      def emit(self, record):
+        records.append(self.format(record))
+
+    handler = Handler()
+    handler.setFormatter(TermStyleStructuredFormatter(["message"], styles={"key": "", "number": ""}))
+
+    logger = logging.getLogger("pytermstyle.test.structured")
+    logger.addHandler(handler)
+    logger.propagate = False
+
+    try:
+      logger.warning("done", extra={"count": 3})
+    finally:
+      logger.removeHandler(handler)
+
+    assert records == ["msg=done count=3"]
+
+  @pytest.mark.parametrize('fast', [True, False])
+  def test__other_formatters(self, force_color, fast):
+    records = []
+
+    class Handler(logging.Handler):
+      def emit(self, record):
+        records.append(self.format(record))
+
+    colored = Handler()
+    colored.setFormatter(TermStyleFormatter(
+      "%(levelColor)s%(levelname)s%(reset)s %(dim)s%(message)s%(reset)s", regions={"dim": "faint"}, fast=fast
+    ))
+    structured = Handler()
+    structured.setFormatter(TermStyleStructuredFormatter(["message"], styles={"key": "", "number": ""}))
+
+    logger = logging.getLogger("pytermstyle.test.structured.other")
+    logger.addHandler(colored)
+    logger.addHandler(structured)
+    logger.propagate = False
+
+    try:
+      logger.warning("done", extra={"count": 3})
+    finally:
+      logger.removeHandler(colored)
+      logger.removeHandler(structured)
+
+    assert records == ["\033[38;5;3mWARNING\033[0m \033[2mdone\033[0m", "msg=done count=3"]
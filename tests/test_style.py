@@ -0,0 +1,91 @@
+import pickle
+import pytest
+
+from pytermstyle import Style, TermSettings, TermStyle, TermConfigException
+
+from .conftest import newline
+
+class TestStyle:
+  @pytest.fixture(autouse=True)
+  def setup_before_after(self, monkeypatch):
+    monkeypatch.setenv('FORCE_COLOR', 'true')
+
+    yield
+
+  def test__render(self, colored, texts, mock_settings_config):
+    style = Style(mock_settings_config)
+
+    assert style.prefix == texts["startBaseFormat"]
+    assert style(texts["message"]) == colored["defaultSettings"]
+    assert style.render(texts["message"]) == colored["defaultSettings"]
+    assert style("") == ""
+    assert Style()(texts["message"]) == texts["message"]
+
+  def test__no_color(self, monkeypatch, texts, mock_settings_config):
+    monkeypatch.setenv('NO_COLOR', 'true')
+
+    assert Style(mock_settings_config)(texts["message"]) == texts["message"]
+
+  def test__interned(self, mock_settings_config):
+    style = Style(mock_settings_config)
+
+    assert Style(mock_settings_config) is style
+    assert Style(TermSettings(mock_settings_config)) is style
+    assert Style(style) is style
+    assert hash(style) == hash(Style(mock_settings_config))
+    assert { style: 1 }[Style(mock_settings_config)] == 1
+    assert pickle.loads(pickle.dumps(style)) is style
+
+  def test__immutable(self):
+    style = Style({ "style": ["bold"] })
+
+    with pytest.raises(AttributeError):
+      style._prefix = ""  # type: ignore
+
+    with pytest.raises(AttributeError):
+      style.color = "red"  # type: ignore
+
+  def test__invalid_settings(self):
+    with pytest.raises(TermConfigException):
+      Style({ "style": ["unknown"] })
+
+  def test__composition(self, colored, texts):
+    strike = Style({ "style": ["strike"], "background": { "color": "red" } })
+    colors = Style({ "foreground": { "color": "blue" }, "background": { "color": "yellow" } })
+
+    composed = strike | colors
+
+    assert composed(texts["message"]) == colored["baseChainedColors"]
+    assert strike + colors is composed
+    assert composed | strike != composed
+    assert (composed | strike).prefix == "\033[9;38;5;4;48;5;1m"
+
+    with pytest.raises(TypeError):
+      strike | { "style": ["bold"] }  # type: ignore
+
+  def test__batch_output(self, capsys, colored, texts, mock_settings_config):
+    style = Style(mock_settings_config)
+
+    TermStyle().print_many([(texts["message"], style)])
+    captured = capsys.readouterr()
+
+    assert captured.out == newline(colored["defaultSettings"])
+
+  @pytest.mark.parametrize('spec', ["bold sky-blue on #20576f", "bold,sky-blue,on,#20576F", "  sky-blue  bold on #20576f "])
+  def test__parse(self, spec):
+    expected = Style({
+      "style": ["bold"],
+      "foreground": { "color": "sky-blue" },
+      "background": { "rgb": ["32", "87", "111"] },
+    })
+
+    assert Style.parse(spec) is expected
+
+  def test__parse_codes(self):
+    assert Style.parse("200 on 1").prefix == "\033[38;5;200;48;5;1m"
+    assert Style.parse("") is Style()
+
+  @pytest.mark.parametrize('spec', ["unknown", "bold on", "on #12345", "red on blue on"])
+  def test__parse_invalid(self, spec):
+    with pytest.raises(TermConfigException):
+      Style.parse(spec)
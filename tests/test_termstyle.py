@@ -1,6 +1,6 @@
 import pytest
 
-from pytermstyle import TermStyle, ColorException, init_config, get_default_logger, create_logger, textStyles, baseColors, extendedColors
+from pytermstyle import TermStyle, ColorException, init_config, get_default_logger, create_logger, TermSettings, textStyles, baseColors, extendedColors
 
 from .conftest import newline, valid_rgbs, invalid_rgbs
 
@@ -242,6 +242,19 @@ class TestLoggerWithSettings:
 
     assert captured.out == newline(texts["message"])
   
+  def test__shared_settings(self, capsys, texts, colored, mock_settings_config):
+    settings = TermSettings.compile(mock_settings_config)
+    logger, other = TermStyle(settings), TermStyle(mock_settings_config)
+
+    assert logger._default_settings is settings
+    assert other._default_settings is settings
+
+    logger.clear()
+    other(texts["message"])
+    captured = capsys.readouterr()
+
+    assert captured.out == newline(colored["defaultSettings"])
+
   def test__override_settings(self, capsys, texts, colored, mock_settings_config):
     logger = TermStyle(mock_settings_config)
 
@@ -331,3 +344,129 @@ class TestModuleLogger:
     captured = capsys.readouterr()
 
     assert captured.out == newline(colored["defaultSettings"])
+
+
+class TestBatchOutput:
+  @pytest.fixture(autouse=True)
+  def setup_before_after(self, monkeypatch):
+    monkeypatch.setenv('FORCE_COLOR', 'true')
+
+    yield
+
+  def test__render_many_default(self, colored, texts, mock_settings_config):
+    logger = TermStyle(mock_settings_config)
+
+    chunks = list(logger.render_many([texts["message"]] * 3))
+
+    assert chunks == [newline(colored["defaultSettings"]) * 3]
+
+  def test__render_many_pairs(self, colored, texts):
+    logger = TermStyle()
+    bold = { "style": ["strike"], "foreground": { "color": "blue" }, "background": { "color": "yellow" } }
+
+    chunks = list(logger.render_many([
+      (texts["message"], bold),
+      (texts["message"], None),
+      ("", bold),
+      texts["message"],
+    ]))
+
+    assert chunks == ["".join([
+      newline(colored["baseChainedColors"]),
+      newline(texts["message"]),
+      newline(""),
+      newline(texts["message"]),
+    ])]
+
+  def test__render_many_chunks(self, texts):
+    logger = TermStyle()
+
+    lines = (str(index) for index in range(10))
+    chunks = list(logger.render_many(lines, { "style": ["bold"] }, end="", chunk_size=4))
+
+    assert len(chunks) == 3
+    assert chunks[0] == "".join("\033[1m{}\033[0m".format(index) for index in range(4))
+
+    with pytest.raises(ValueError):
+      logger.render_many([], chunk_size=0)
+
+  def test__render_many_validates_once(self, monkeypatch):
+    calls = []
+    verify = TermSettings._verify_settings
+    monkeypatch.setattr(TermSettings, "_verify_settings", lambda self, settings: calls.append(settings) or verify(self, settings))
+
+    lines = (("line", { "style": ["framed"], "foreground": { "color": "77" } }) for _ in range(100))
+    chunks = list(TermStyle().render_many(lines, end=""))
+
+    assert chunks == ["\033[51;38;5;77mline\033[0m" * 100]
+    assert len(calls) == 1
+
+  def test__render_many_override(self, colored, texts):
+    logger = TermStyle()
+
+    chunks = list(logger.fg_blue().bg_yellow().strike().render_many([texts["message"]]))
+    assert chunks == [newline(colored["baseChainedColors"])]
+
+    chunks = list(logger.render_many([texts["message"]]))
+    assert chunks == [newline(texts["message"])]
+
+  def test__print_many(self, capsys, colored, texts, mock_settings_config):
+    logger = TermStyle()
+
+    logger.print_many([texts["message"]] * 2, mock_settings_config, chunk_size=1)
+    captured = capsys.readouterr()
+
+    assert captured.out == newline(colored["defaultSettings"]) * 2
+
+  def test__print_many_no_color(self, capsys, texts, mock_settings_config, monkeypatch):
+    monkeypatch.setenv('NO_COLOR', 'true')
+    logger = TermStyle(mock_settings_config)
+
+    logger.print_many([texts["message"], (texts["message"], mock_settings_config)])
+    captured = capsys.readouterr()
+
+    assert captured.out == newline(texts["message"]) * 2
+
+
+class TestRender:
+  @pytest.fixture(autouse=True)
+  def setup_before_after(self, monkeypatch):
+    monkeypatch.setenv('FORCE_COLOR', 'true')
+
+    yield
+
+  def test__render(self, capsys, colored, texts, mock_settings_config):
+    logger = TermStyle(mock_settings_config)
+
+    assert logger.render(texts["message"]) == colored["defaultSettings"]
+    assert logger.render("") == ""
+    assert logger.render(None) == ""
+    assert TermStyle().render(texts["message"]) == texts["message"]
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+
+  def test__render_chain(self, colored, texts):
+    logger = TermStyle()
+
+    assert logger.fg_blue().bg_yellow().strike().render(texts["message"]) == colored["baseChainedColors"]
+    assert logger.render(texts["message"]) == texts["message"]
+
+  def test__render_without_clear(self, texts):
+    logger = TermStyle()
+
+    logger.bold()
+
+    assert logger.render(texts["message"], clear=False) == colored_bold(texts["message"])
+    assert logger.render(texts["message"]) == colored_bold(texts["message"])
+    assert logger.render(texts["message"]) == texts["message"]
+
+  def test__render_no_color(self, monkeypatch, texts, mock_settings_config):
+    monkeypatch.setenv('NO_COLOR', 'true')
+    logger = TermStyle(mock_settings_config)
+
+    assert logger.bold().render(texts["message"]) == texts["message"]
+
+
+def colored_bold(text):
+  return f"\033[1m{text}\033[0m"
@@ -0,0 +1,166 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from pytermstyle import Theme, Style, TermSettings, TermConfigException
+
+
+THEME = {
+  "error": "bold red",
+  "ok": {"foreground": {"color": "green"}},
+  "muted": Style.parse("faint"),
+  "key": TermSettings({"style": ["underline"]}),
+}
+
+
+@pytest.fixture
+def force_color(monkeypatch):
+  monkeypatch.setenv('FORCE_COLOR', 'true')
+
+
+def write_theme(path, content: str, mtime: int):
+  path.write_text(content)
+  # File systems with coarse timestamps would not notice quick changes
+  os.utime(path, ns=(mtime, mtime))
+
+
+class TestTheme:
+  def test__lookup(self):
+    theme = Theme(THEME)
+
+    assert theme["error"] is Style.parse("bold red")
+    assert theme["ok"] is Style.parse("green")
+    assert theme["muted"] is Style.parse("faint")
+    assert theme["key"] is Style.parse("underline")
+    assert theme.get("unknown") is None
+    assert "error" in theme and "unknown" not in theme
+    assert list(theme) == ["error", "ok", "muted", "key"]
+    assert len(theme) == 4
+
+    with pytest.raises(KeyError):
+      theme["unknown"]
+
+  def test__render(self, force_color):
+    assert Theme(THEME)["error"]("text") == "\033[1;38;5;1mtext\033[0m"
+
+  @pytest.mark.parametrize('styles', [
+    {"error": "bold unknown"},
+    {"error": {"style": ["unknown"]}},
+    {"error": 42},
+    {1: "bold"},
+    ["bold"],
+  ])
+  def test__invalid(self, styles):
+    with pytest.raises(TermConfigException):
+      Theme(styles)
+
+  def test__load_replaces_styles(self):
+    theme = Theme(THEME)
+    theme.load({"error": "red"})
+
+    assert list(theme) == ["error"]
+    assert theme["error"] is Style.parse("red")
+
+    with pytest.raises(TermConfigException):
+      theme.load({"error": "bold", "ok": "unknown"})
+
+    assert list(theme) == ["error"]
+
+  def test__reload_without_file(self):
+    with pytest.raises(TermConfigException):
+      Theme().reload()
+
+
+class TestThemeFile:
+  def test__json(self, tmp_path):
+    path = tmp_path / "theme.json"
+    write_theme(path, json.dumps({"error": "bold red", "ok": {"foreground": {"color": "green"}}}), 10 ** 9)
+
+    theme = Theme.from_file(path)
+
+    assert theme.path == str(path)
+    assert theme["error"] is Style.parse("bold red")
+    assert theme["ok"] is Style.parse("green")
+
+  def test__toml(self, tmp_path):
+    try:
+      import tomllib  # noqa: F401
+    except ImportError:
+      pytest.importorskip("tomli")
+
+    path = tmp_path / "theme.toml"
+    write_theme(path, 'error = "bold red"\n\n[ok]\nforeground = { color = "green" }\n', 10 ** 9)
+
+    theme = Theme.from_file(path)
+
+    assert theme["error"] is Style.parse("bold red")
+    assert theme["ok"] is Style.parse("green")
+
+  @pytest.mark.parametrize('content', ['{"error": ', '["bold"]', '{"error": "bold unknown"}'])
+  def test__invalid_file(self, tmp_path, content):
+    path = tmp_path / "theme.json"
+    write_theme(path, content, 10 ** 9)
+
+    with pytest.raises(TermConfigException):
+      Theme.from_file(path)
+
+  def test__missing_file(self, tmp_path):
+    with pytest.raises(TermConfigException):
+      Theme.from_file(tmp_path / "missing.json")
+
+  def test__reload(self, tmp_path):
+    path = tmp_path / "theme.json"
+    write_theme(path, '{"error": "red"}', 10 ** 9)
+    theme = Theme.from_file(path)
+
+    assert theme.reload() == False
+
+    write_theme(path, '{"error": "bold red"}', 2 * 10 ** 9)
+    assert theme.reload() == True
+    assert theme["error"] is Style.parse("bold red")
+
+    # Invalid changes keep previous styles
+    write_theme(path, '{"error": "unknown"}', 3 * 10 ** 9)
+    with pytest.raises(TermConfigException):
+      theme.reload()
+
+    assert theme["error"] is Style.parse("bold red")
+
+  def test__watch(self, tmp_path):
+    path = tmp_path / "theme.json"
+    write_theme(path, '{"error": "red"}', 10 ** 9)
+    theme = Theme.from_file(path, watch=True, interval=0.01)
+
+    try:
+      with pytest.raises(RuntimeError):
+        theme.watch()
+
+      styles = {Style.parse("red"), Style.parse("bold red")}
+      seen = []
+      stop = threading.Event()
+
+      def render():
+        while not stop.is_set():
+          seen.append(theme["error"])
+
+      renderer = threading.Thread(target=render)
+      renderer.start()
+
+      write_theme(path, '{"error": "bold red"}', 2 * 10 ** 9)
+
+      deadline = time.monotonic() + 5
+      while theme["error"] is not Style.parse("bold red") and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+      stop.set()
+      renderer.join()
+
+      assert theme["error"] is Style.parse("bold red")
+      assert set(seen) <= styles
+    finally:
+      theme.stop()
+
+    assert theme._watcher is None
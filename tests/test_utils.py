@@ -1,6 +1,7 @@
 import pytest
 
 import pytermstyle.utils as utils
+import pytermstyle.definitions as definitions
 
 from .conftest import valid_rgbs, invalid_rgbs
 
@@ -74,4 +75,24 @@ class TestUnique:
     assert utils.unique([]) == []
     assert utils.unique([1, 2, 3]) == [1, 2, 3]
     assert utils.unique([1, 1, 2, 3, 1, 2]) == [1, 2, 3]
-    assert utils.unique([1, 1, 1, 1]) == [1]
\ No newline at end of file
+    assert utils.unique([1, 1, 1, 1]) == [1]
+
+class TestLookupTables:
+  def test__8bit_tables(self):
+    assert len(definitions.FG_8BIT_CODES) == 256
+    assert definitions.FG_8BIT_CODES[196] == "38;5;196"
+    assert definitions.BG_8BIT_CODES[0] == "48;5;0"
+
+  def test__color_codes(self):
+    assert definitions.colorCodes["sky-blue"] == "153"
+    assert definitions.colorCodes["255"] == "255"
+    assert "256" not in definitions.colorCodes
+
+  def test__non_canonical_codes(self):
+    assert utils.is_valid_color("061") == True
+    assert utils.get_8bit_color_code("061") == "061"
+    assert utils.is_rgb_valid([61, "217", 1.0]) == True
+    assert utils.is_rgb_valid([256]) == False
+
+  def test__modes(self):
+    assert definitions.COLOR_MODES == {"foreground", "background"}